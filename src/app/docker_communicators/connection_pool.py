@@ -0,0 +1,216 @@
+"""
+This module provides a pool of keep-alive HTTP and HTTPS connections for the Docker Hub API.
+
+Opening a connection to Docker Hub costs a TCP and a TLS handshake, which is more than a search
+request itself takes, so the pool keeps the connections open between requests and reuses them.
+Responses are requested gzip-compressed. A kept connection may have been closed by the server
+in the meantime, so a request that fails on a reused connection is sent again on a new one.
+
+Classes:
+- ConnectionPool: A thread-safe pool of keep-alive connections, grouped by origin.
+"""
+import gzip
+import http.client
+import ssl
+import threading
+import time
+import urllib.parse
+import zlib
+from typing import Optional
+
+from ..exeptions.exeptions import DockerApiError
+from ..utils.constants import (
+    HUB_MAX_IDLE_CONNECTIONS, HUB_IDLE_TIMEOUT, HUB_TIMEOUT, HTTPS_SCHEME, GZIP_ENCODING, EMPTY_STRING
+)
+
+Origin = tuple[str, str, Optional[int]]
+
+# errors of a kept connection that the server closed while it was idle
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of keep-alive HTTP and HTTPS connections.
+
+    Every origin (scheme, host and port) has its own idle connections. A request takes the most
+    recently used idle connection of its origin, or opens a new one, and puts the connection
+    back when the response is read, unless the server is going to close it.
+
+    Attributes:
+        max_idle (int): The maximum number of idle connections kept for every origin.
+        idle_timeout (float): The number of seconds after which an idle connection is not reused.
+        timeout (float): The timeout of connecting and reading, in seconds.
+        context (Optional[ssl.SSLContext]): The TLS settings of HTTPS connections (the defaults if None).
+        connections_opened (int): The number of connections opened so far.
+        requests (int): The number of requests sent so far.
+    """
+
+    def __init__(
+            self,
+            max_idle: int = HUB_MAX_IDLE_CONNECTIONS,
+            idle_timeout: float = HUB_IDLE_TIMEOUT,
+            timeout: float = HUB_TIMEOUT,
+            context: Optional[ssl.SSLContext] = None
+    ):
+        """
+        Initializes an empty pool.
+
+        Args:
+            max_idle (int): The maximum number of idle connections kept for every origin.
+            idle_timeout (float): The number of seconds after which an idle connection is not reused.
+            timeout (float): The timeout of connecting and reading, in seconds.
+            context (Optional[ssl.SSLContext]): The TLS settings of HTTPS connections.
+        """
+        self.max_idle: int = max_idle
+        self.idle_timeout: float = idle_timeout
+        self.timeout: float = timeout
+        self.context: Optional[ssl.SSLContext] = context
+        self.connections_opened: int = 0
+        self.requests: int = 0
+        self.__idle: dict[Origin, list[tuple[http.client.HTTPConnection, float]]] = {}
+        self.__lock = threading.Lock()
+
+    def __new_connection(self, origin: Origin) -> http.client.HTTPConnection:
+        """
+        Creates a connection to an origin; it connects when the first request is sent.
+
+        Args:
+            origin (Origin): The scheme, host and port of the server.
+
+        Returns:
+            http.client.HTTPConnection: The new connection.
+        """
+        scheme, host, port = origin
+        with self.__lock:
+            self.connections_opened += 1
+        if scheme == HTTPS_SCHEME:
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def __take(self, origin: Origin) -> Optional[http.client.HTTPConnection]:
+        """
+        Takes the most recently used idle connection of an origin, closing the expired ones.
+
+        Args:
+            origin (Origin): The scheme, host and port of the server.
+
+        Returns:
+            Optional[http.client.HTTPConnection]: The connection, or None if there is no fresh one.
+        """
+        with self.__lock:
+            idle = self.__idle.get(origin, [])
+            while idle:
+                connection, last_used = idle.pop()
+                if time.monotonic() - last_used < self.idle_timeout:
+                    return connection
+                connection.close()
+        return None
+
+    def __put_back(self, origin: Origin, connection: http.client.HTTPConnection) -> None:
+        """
+        Keeps a connection whose response was read for the next request to the origin.
+
+        Args:
+            origin (Origin): The scheme, host and port of the server.
+            connection (http.client.HTTPConnection): The connection.
+        """
+        with self.__lock:
+            idle = self.__idle.setdefault(origin, [])
+            if len(idle) < self.max_idle:
+                idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def __send(
+            self,
+            connection: http.client.HTTPConnection,
+            target: str,
+            headers: dict[str, str]
+    ) -> tuple[int, bytes, http.client.HTTPMessage, bool]:
+        """
+        Sends a GET request on a connection and reads the whole response.
+
+        Args:
+            connection (http.client.HTTPConnection): The connection.
+            target (str): The path and the query of the URL.
+            headers (dict[str, str]): The extra headers of the request.
+
+        Returns:
+            tuple[int, bytes, http.client.HTTPMessage, bool]: The status, the decompressed body,
+                                                              the headers of the response and
+                                                              whether the connection can be reused.
+
+        Raises:
+            DockerApiError: If the gzip-encoded body is corrupt or truncated.
+        """
+        with self.__lock:
+            self.requests += 1
+        connection.request("GET", target, headers={"Accept-Encoding": GZIP_ENCODING, **headers})
+        response = connection.getresponse()
+        body = response.read()
+        if response.getheader("Content-Encoding", EMPTY_STRING).lower() == GZIP_ENCODING:
+            try:
+                body = gzip.decompress(body)
+            except (zlib.error, EOFError, gzip.BadGzipFile) as error:
+                raise DockerApiError(f"invalid gzip-encoded response: {error}")
+        return response.status, body, response.headers, not response.will_close
+
+    def get(
+            self,
+            url: str,
+            headers: Optional[dict[str, str]] = None
+    ) -> tuple[int, bytes, http.client.HTTPMessage]:
+        """
+        Sends a GET request, reusing an idle connection to the origin of the URL if there is one.
+
+        Args:
+            url (str): The URL, for example 'https://hub.docker.com/v2/search/repositories/?query=nginx'.
+            headers (Optional[dict[str, str]]): The extra headers of the request, for example
+                                                the validators of a conditional request.
+
+        Returns:
+            tuple[int, bytes, http.client.HTTPMessage]: The status, the decompressed body and
+                                                        the headers of the response.
+
+        Raises:
+            OSError: If the server cannot be reached.
+            http.client.HTTPException: If the response is not valid HTTP.
+            DockerApiError: If the gzip-encoded body of the response is corrupt or truncated.
+        """
+        parts = urllib.parse.urlsplit(url)
+        origin: Origin = (parts.scheme, parts.hostname, parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        connection = self.__take(origin)
+        reused = connection is not None
+        while True:
+            connection = connection or self.__new_connection(origin)
+            try:
+                status, body, response_headers, reusable = self.__send(connection, target, headers or {})
+                break
+            except DockerApiError:
+                # a connection that delivered a broken body is not trusted with another request
+                connection.close()
+                raise
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                if not reused or not isinstance(error, STALE_CONNECTION_ERRORS):
+                    raise
+                # the server closed the idle connection, a GET can be sent again on a new one
+                connection, reused = None, False
+        if reusable:
+            self.__put_back(origin, connection)
+        else:
+            connection.close()
+        return status, body, response_headers
+
+    def close(self) -> None:
+        """Closes all idle connections."""
+        with self.__lock:
+            idle, self.__idle = self.__idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
@@ -4,18 +4,40 @@ This module provides an abstract base class and a concrete implementation for co
 It includes:
 - ABCDockerApi: An abstract base class defining the interface for Docker API communication.
 - DockerApiCommunicator: A concrete implementation of the ABCDockerApi that handles HTTP requests to the Docker API.
+
+All communicators send their requests through one shared ConnectionPool, so the connections
+to Docker Hub stay open between searches and page flips. Every communicator keeps the pages
+it fetched in a bounded PageCache, and can prefetch pages into it in the background.
+For filtering, it builds a TagIndex of all tags of a repository, once per repository.
+
+The responses are also kept across sessions in the on-disk HubResponseCache, keyed by URL.
+A fresh cached response is used without a request. A stale one is returned at once, too,
+while a background request revalidates it with its ETag and Last-Modified validators, so
+the next session gets the current response.
+
+Every request takes a token of the shared RateLimiter first. Requests refused with 429 or
+503 are retried after a jittered exponential backoff (or the delay Docker Hub asks for).
+Prefetch and revalidation are background requests: they are not retried and are dropped
+first when the budget runs low, so the budget is left to what the user is waiting for.
 """
-import functools
 import http
+import http.client
 import json
-import urllib.request
+import threading
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Optional, Union
 
-from ..exeptions.exeptions import DockerApiError
-from ..utils.constants import PAGE_SIZE
-from ..utils.enams import QueryParams, DockerApiEndpoints
+from .connection_pool import ConnectionPool
+from .rate_limiter import RateLimiter
+from ..exeptions.exeptions import DockerApiError, DockerApiRateLimitError
+from ..utils.constants import (
+    PAGE_SIZE, START_PAGE_NUMBER, ETAG_HEADER, LAST_MODIFIED_HEADER, IF_NONE_MATCH_HEADER, IF_MODIFIED_SINCE_HEADER, HUB_MAX_RETRIES
+)
+from ..utils.enams import QueryParams, DockerApiEndpoints, RequestPriorities
 from ..utils.hints import ImageResponse, TagResponse
+from ..utils.hub_cache import HubResponseCache, CachedResponse
+from ..utils.page_cache import PageCache
+from ..utils.tag_index import TagIndex
 
 
 class ABCDockerApi(ABC):
@@ -48,29 +70,152 @@ class ABCDockerApi(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def prefetch_repositories(self, text: str, page: int) -> None:
+        """
+        Fetches a page of repositories in the background, so a following `get_repositories` is instant.
+
+        Args:
+            text (str): The search query for repositories.
+            page (int): The page number.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def prefetch_tags(self, name: str, page: int) -> None:
+        """
+        Fetches a page of tags in the background, so a following `get_tags` is instant.
+
+        Args:
+            name (str): The name of the repository in the format 'username/repository'.
+            page (int): The page number.
+        """
+        raise NotImplementedError()
+
+
+connection_pool = ConnectionPool()
+response_cache = HubResponseCache()
+rate_limiter = RateLimiter()
+
+# the statuses of a request refused for too many requests, which is worth sending again later
+RETRY_STATUSES = (http.HTTPStatus.TOO_MANY_REQUESTS, http.HTTPStatus.SERVICE_UNAVAILABLE)
+
 
 class DockerApiCommunicator(ABCDockerApi):
     """Concrete implementation of the ABCDockerApi for communicating with the Docker API."""
 
+    def __init__(self):
+        """Initializes the communicator with an empty cache of result pages."""
+        self.pages: PageCache[Union[ImageResponse, TagResponse]] = PageCache()
+        self.tag_indexes: dict[str, TagIndex] = {}
+        self.__revalidating: set[str] = set()
+        self.__lock = threading.Lock()
+
     @staticmethod
-    @functools.lru_cache
-    def __get_http_response(url: str) -> bytes:
+    def __fetch_url(
+            url: str,
+            priority: RequestPriorities,
+            cached: Optional[CachedResponse] = None
+    ) -> bytes:
         """
-        Sends an HTTP GET request to the specified URL and returns the response data.
+        Sends an HTTP GET request to the specified URL over a pooled keep-alive connection,
+        within the request budget, stores the response in the on-disk cache and returns the
+        response data. An interactive request refused for too many requests is sent again
+        up to HUB_MAX_RETRIES times.
 
         Args:
             url (str): The URL to send the request to.
+            priority (RequestPriorities): The priority of the request.
+            cached (Optional[CachedResponse]): The stale cached response to the URL; if given,
+                                               the request is conditional on its validators.
 
         Returns:
-            bytes: The response data in bytes.
+            bytes: The response data in bytes, decompressed if it was sent gzip-encoded.
 
         Raises:
-            DockerApiError: If the HTTP response status is not OK (200).
+            DockerApiRateLimitError: If the request budget is spent.
+            DockerApiError: If the HTTP response status is not OK (200) or, for a conditional
+                            request, Not Modified (304), or the response is not valid HTTP.
+            OSError: If Docker Hub cannot be reached.
+        """
+        headers: dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers[IF_NONE_MATCH_HEADER] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers[IF_MODIFIED_SINCE_HEADER] = cached.last_modified
+        attempt = 0
+        while True:
+            rate_limiter.acquire(priority)
+            try:
+                status, data, response_headers = connection_pool.get(url, headers)
+            except http.client.HTTPException as error:
+                raise DockerApiError(str(error))
+            rate_limiter.update(response_headers)
+            if status not in RETRY_STATUSES:
+                break
+            delay = rate_limiter.throttle(response_headers, attempt)
+            if priority is RequestPriorities.BACKGROUND or attempt == HUB_MAX_RETRIES:
+                raise DockerApiRateLimitError(delay)
+            attempt += 1
+        if status == http.HTTPStatus.NOT_MODIFIED and cached is not None:
+            response_cache.touch(url)
+            return cached.body
+        if status == http.HTTPStatus.OK:
+            response_cache.put(
+                url, data, response_headers.get(ETAG_HEADER), response_headers.get(LAST_MODIFIED_HEADER)
+            )
+            return data
+        raise DockerApiError(status)
+
+    def __revalidate(self, url: str, cached: CachedResponse) -> None:
         """
-        response = urllib.request.urlopen(url)
-        if response.getcode() == http.HTTPStatus.OK:
-            return response.read()
-        raise DockerApiError()
+        Revalidates a stale cached response in a background thread, unless it is already
+        being revalidated. Failures are ignored: the stale response stays in the cache.
+
+        Args:
+            url (str): The URL of the request.
+            cached (CachedResponse): The stale cached response.
+        """
+        with self.__lock:
+            if url in self.__revalidating:
+                return
+            self.__revalidating.add(url)
+
+        def run():
+            try:
+                self.__fetch_url(url, RequestPriorities.BACKGROUND, cached)
+            except (DockerApiError, OSError):
+                pass
+            finally:
+                with self.__lock:
+                    self.__revalidating.discard(url)
+
+        threading.Thread(target=run, daemon=True, name="hub-revalidate").start()
+
+    def __get_http_response(self, url: str, priority: RequestPriorities) -> bytes:
+        """
+        Returns the response data of an HTTP GET request to the specified URL, from the
+        on-disk cache if it is there: a stale cached response is returned as well and
+        revalidated in the background.
+
+        Args:
+            url (str): The URL to send the request to.
+            priority (RequestPriorities): The priority of the request, if it has to be sent.
+
+        Returns:
+            bytes: The response data in bytes, decompressed if it was sent gzip-encoded.
+
+        Raises:
+            DockerApiRateLimitError: If the request budget is spent.
+            DockerApiError: If the HTTP response status is not OK (200) or the response is not valid HTTP.
+            OSError: If Docker Hub cannot be reached.
+        """
+        cached = response_cache.get(url)
+        if cached is None:
+            return self.__fetch_url(url, priority)
+        if not response_cache.is_fresh(cached):
+            self.__revalidate(url, cached)
+        return cached.body
 
     @staticmethod
     def __add_query_to_url(url: str, query_params: dict[QueryParams, Union[str, int]]) -> str:
@@ -87,13 +232,19 @@ class DockerApiCommunicator(ABCDockerApi):
         query: str = "&".join([f"{key}={value}" for key, value in query_params.items()])
         return url + "?" + query
 
-    def get_repositories(self, text: str, page: int = 1) -> ImageResponse:
+    def __fetch_repositories(
+            self,
+            text: str,
+            page: int,
+            priority: RequestPriorities = RequestPriorities.INTERACTIVE
+    ) -> ImageResponse:
         """
-        Fetches repositories from the Docker API based on the search text and page number.
+        Fetches a page of repositories from the Docker API, bypassing the page cache.
 
         Args:
             text (str): The search query for repositories.
-            page (int): The page number for pagination (default is 1).
+            page (int): The page number.
+            priority (RequestPriorities): The priority of the request.
 
         Returns:
             ImageResponse: A structured response containing image data.
@@ -106,16 +257,23 @@ class DockerApiCommunicator(ABCDockerApi):
                 QueryParams.PAGE_SIZE.value: PAGE_SIZE
             }
         )
-        data: bytes = self.__get_http_response(url=url)
+        data: bytes = self.__get_http_response(url=url, priority=priority)
         return json.loads(data)
 
-    def get_tags(self, name: str, page: int = 1) -> TagResponse:
+    def __fetch_tags(
+            self,
+            name: str,
+            page: int,
+            priority: RequestPriorities = RequestPriorities.INTERACTIVE
+    ) -> TagResponse:
         """
-        Fetches tags for a specified repository from the Docker API.
+        Fetches a page of tags from the Docker API, bypassing the page cache.
 
         Args:
             name (str): The name of the repository in the format 'username/repository'.
-            page (int): The page number
+            page (int): The page number.
+            priority (RequestPriorities): The priority of the request.
+
         Returns:
             TagResponse: A structured response containing tag data.
         """
@@ -130,6 +288,122 @@ class DockerApiCommunicator(ABCDockerApi):
                 QueryParams.PAGE_SIZE.value: PAGE_SIZE
             }
         )
-        data: bytes = self.__get_http_response(url)
+        data: bytes = self.__get_http_response(url, priority)
         return json.loads(data)
 
+    def get_repositories(self, text: str, page: int = 1) -> ImageResponse:
+        """
+        Fetches repositories from the Docker API based on the search text and page number.
+
+        Args:
+            text (str): The search query for repositories.
+            page (int): The page number for pagination (default is 1).
+
+        Returns:
+            ImageResponse: A structured response containing image data.
+        """
+        return self.pages.get(
+            (DockerApiEndpoints.DOCKER_REPOSITORIES_ENDPOINT, text),
+            page,
+            lambda: self.__fetch_repositories(text, page)
+        )
+
+    def get_tags(self, name: str, page: int = 1) -> TagResponse:
+        """
+        Fetches tags for a specified repository from the Docker API.
+
+        Args:
+            name (str): The name of the repository in the format 'username/repository'.
+            page (int): The page number
+        Returns:
+            TagResponse: A structured response containing tag data.
+        """
+        return self.pages.get(
+            (DockerApiEndpoints.DOCKER_TAGS_ENDPOINT, name),
+            page,
+            lambda: self.__fetch_tags(name, page)
+        )
+
+    def cached_repositories(self, text: str, page: int) -> Optional[ImageResponse]:
+        """
+        Returns a page of repositories if it is cached, without fetching it.
+
+        Args:
+            text (str): The search query for repositories.
+            page (int): The page number.
+
+        Returns:
+            Optional[ImageResponse]: The page, or None if it is not cached.
+        """
+        return self.pages.peek((DockerApiEndpoints.DOCKER_REPOSITORIES_ENDPOINT, text), page)
+
+    def prefetch_repositories(self, text: str, page: int) -> None:
+        """
+        Fetches a page of repositories into the page cache in the background.
+
+        Args:
+            text (str): The search query for repositories.
+            page (int): The page number.
+        """
+        self.pages.prefetch(
+            (DockerApiEndpoints.DOCKER_REPOSITORIES_ENDPOINT, text),
+            page,
+            lambda: self.__fetch_repositories(text, page, RequestPriorities.BACKGROUND)
+        )
+
+    def prefetch_tags(self, name: str, page: int) -> None:
+        """
+        Fetches a page of tags into the page cache in the background.
+
+        Args:
+            name (str): The name of the repository in the format 'username/repository'.
+            page (int): The page number.
+        """
+        self.pages.prefetch(
+            (DockerApiEndpoints.DOCKER_TAGS_ENDPOINT, name),
+            page,
+            lambda: self.__fetch_tags(name, page, RequestPriorities.BACKGROUND)
+        )
+
+    def get_tag_index(self, name: str) -> TagIndex:
+        """
+        Returns the index of all tags of a repository, starting to fetch them in the background
+        the first time. The index takes the pages that are in the page cache and fetches the
+        others as background requests, without adding them to the page cache.
+
+        Args:
+            name (str): The name of the repository in the format 'username/repository'.
+
+        Returns:
+            TagIndex: The index, which may still be incomplete.
+        """
+        if name not in self.tag_indexes:
+            key = (DockerApiEndpoints.DOCKER_TAGS_ENDPOINT, name)
+            self.tag_indexes[name] = TagIndex(
+                fetch_page=lambda page: (
+                    self.pages.peek(key, page) or self.__fetch_tags(name, page, RequestPriorities.BACKGROUND)
+                ),
+                first_page=self.pages.peek(key, START_PAGE_NUMBER)
+            )
+        self.tag_indexes[name].start()
+        return self.tag_indexes[name]
+
+    @staticmethod
+    def get_budget_text() -> str:
+        """
+        Returns the remaining Docker Hub request budget for the footer of the search viewers.
+
+        Returns:
+            str: For example 'Hub 175/180', or the time until requests are allowed again.
+        """
+        return rate_limiter.get_budget_text()
+
+    @staticmethod
+    def retry_in() -> float:
+        """
+        Returns the number of seconds until an interactive request may be sent.
+
+        Returns:
+            float: 0 if a request may be sent now.
+        """
+        return rate_limiter.retry_in()
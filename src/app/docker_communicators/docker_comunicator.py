@@ -1,22 +1,565 @@
 """
 Module: docker_communicators
 
-This module provides a DockerCommunicator class that facilitates communication with Docker using subprocess.
+This module provides an abstract base class for communicating with Docker and a DockerCommunicator class
+that facilitates communication with Docker using subprocess.
 It also defines a custom exception class called DockerNotRunningError, which is raised when Docker is not running.
 """
-import functools
+import atexit
+import json
+import shlex
 import subprocess
+import tempfile
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Callable, Iterator, Optional
 
 from ..utils.commands import *
-from ..exeptions.exeptions import DockerNotRunningError
+from .volume_helper import VolumeHelper
+from ..utils.cache import TTLCache, CacheStats, invalidates
+from ..utils.constants import EMPTY_STRING, NONE_VALUE, SPACE, END_OF_LINE, LATEST, CHUNK_SIZE, HELPER_IMAGE, MAX_BATCH_COMMAND_LENGTH
+from ..utils.enams import CacheResources
+from ..utils.image_store import ImageStore
+from ..utils.records import Listing, BaseRecord, ImageRecord, ContainerRecord, VolumeRecord
+from ..utils.pull_progress import PullProgress
+from ..utils.streams import LineWriter
+from ..exeptions.exeptions import DockerNotRunningError, DockerCommandError
+
+# the kinds of cached data that the Docker events listener patches
+LISTING_RESOURCES = (CacheResources.IMAGES, CacheResources.CONTAINERS, CacheResources.VOLUMES)
+
+class ABCDockerCommunicator(ABC):
+    """
+    Abstract base class for communicating with Docker.
+
+    Listings, inspect results and the version are kept in a TTLCache. Methods that change
+    Docker objects invalidate only the cached data of the objects they change (see `invalidates`),
+    except the listings while the Docker events are followed, which the events patch instead.
+
+    The inspect information of images and the last images table are also kept across sessions
+    in an ImageStore, since an image ID identifies the content of the image.
+
+    Attributes:
+        images_cache_key (str): The key of the images table in the cache.
+    """
+    images_cache_key: str
+
+    def __init__(self):
+        """Initializes the communicator with an empty cache."""
+        self.cache: TTLCache = TTLCache()
+        self.image_store: ImageStore = ImageStore()
+
+    @abstractmethod
+    def image_rename(self, old_name: str, new_name: str) -> None:
+        """
+        Renames a Docker image from the old name to the new name.
+
+        Args:
+            old_name (str): The current name of the Docker image to be renamed.
+            new_name (str): The new name for the Docker image.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def container_rename(self, old_name: str, new_name: str) -> None:
+        """
+        Renames a Docker container from the old name to the new name.
+
+        Args:
+            old_name (str): The current name of the Docker container to be renamed.
+            new_name (str): The new name for the Docker container.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def create_new_volume(self, new_name: str) -> None:
+        """
+        Creates a new Docker volume with the specified name.
+
+        Args:
+            new_name (str): The name for the new Docker volume to be created.
+        """
+        raise NotImplementedError()
+
+    @invalidates(CacheResources.VOLUMES)
+    def volume_rename(self, old_name: str, new_name: str) -> None:
+        """
+        Renames a Docker volume by copying its data to a new volume with the new name
+        in a helper container (see `volume_helper`).
+
+        Args:
+            old_name (str): The current name of the Docker volume to be renamed.
+            new_name (str): The new name for the Docker volume.
+        """
+        self.create_new_volume(new_name)
+        with self.volume_helper([old_name, new_name]) as helper:
+            helper.copy_volume(old_name, new_name)
+
+    @abstractmethod
+    def check_version(self) -> str:
+        """
+        Check the version of Docker.
+
+        Returns:
+            str: The version of Docker.
+        """
+        raise NotImplementedError()
+
+    def images(self) -> Listing:
+        """
+        Get information about all Docker images.
+
+        Returns:
+            Listing: The records of all Docker images.
+        """
+        return self.cache.get(CacheResources.IMAGES, self.images_cache_key, self.fetch_images)
+
+    def fetch_images(self) -> Listing:
+        """
+        Fetch the images table bypassing the cache, and store it for the next session.
+
+        Storing the table drops the stored inspect information of the images that no longer exist.
+
+        Returns:
+            Listing: The records of all Docker images.
+        """
+        listing = Listing(ImageRecord, self.find_images())
+        self.image_store.save_listing(listing)
+        return listing
+
+    def restore_images(self) -> bool:
+        """
+        Put the images table stored by the last session into the cache, so the images
+        tab is shown without waiting for Docker. It should be replaced soon with `refresh_images`.
+
+        Returns:
+            bool: Whether a stored table was found.
+        """
+        listing = self.image_store.load_listing()
+        if listing is None:
+            return False
+        self.cache.put(CacheResources.IMAGES, self.images_cache_key, listing)
+        return True
+
+    def refresh_images(self) -> None:
+        """Fetch the images table and replace the cached one, which stays in use until then."""
+        self.cache.put(CacheResources.IMAGES, self.images_cache_key, self.fetch_images())
+
+    @abstractmethod
+    def containers(self) -> Listing:
+        """
+        Get information about all Docker containers.
+
+        Returns:
+            Listing: The records of all Docker containers.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def volumes(self) -> Listing:
+        """
+        Get information about all Docker volumes.
+
+        Returns:
+            Listing: The records of all Docker volumes.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_images(self, reference: str = EMPTY_STRING) -> list[ImageRecord]:
+        """
+        Fetch the records of Docker images matching a reference, bypassing the cache.
+
+        Args:
+            reference (str): The image reference, for example 'nginx:latest' (all images if empty).
+
+        Returns:
+            list[ImageRecord]: The records of the matching images.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_images_by_id(self, image_id: str) -> list[ImageRecord]:
+        """
+        Fetch the records of a Docker image by ID, one per repository tag, bypassing the cache.
+
+        Args:
+            image_id (str): The ID of the image.
+
+        Returns:
+            list[ImageRecord]: The records of the image, or an empty list if it does not exist.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_containers(self, container_id: str) -> list[ContainerRecord]:
+        """
+        Fetch the record of a Docker container by ID, bypassing the cache.
 
+        Args:
+            container_id (str): The ID of the container.
+
+        Returns:
+            list[ContainerRecord]: The record of the container, or an empty list if it does not exist.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_volumes(self, name: str) -> list[VolumeRecord]:
+        """
+        Fetch the record of a Docker volume by name, bypassing the cache.
+
+        Args:
+            name (str): The name of the volume.
 
-class DockerCommunicator:
+        Returns:
+            list[VolumeRecord]: The record of the volume, or an empty list if it does not exist.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def events(self) -> Iterator[dict]:
+        """
+        Follow the stream of Docker events.
+
+        Returns:
+            Iterator[dict]: The decoded events, as they happen.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_volume_by_name(self, name: str):
+        """
+        Delete a Docker volume by name.
+
+        Args:
+            name (str): The name of the volume to delete.
+        """
+        raise NotImplementedError()
+
+    def tar_volume_by_name(self, name: str, output: BinaryIO):
+        """
+        Stream a tar archive of the content of a Docker volume from a helper container
+        (see `volume_helper`).
+
+        Args:
+            name (str): The name of the Docker volume to be exported.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        with self.volume_helper([name]) as helper:
+            helper.tar_volume(name, output)
+
+    def volume_helper(self, names: list[str]) -> VolumeHelper:
+        """
+        Get a helper container for operations on several Docker volumes.
+
+        The container is started when the returned context is entered, with all
+        the volumes mounted, and removed when it exits.
+
+        Args:
+            names (list[str]): The names of the Docker volumes.
+
+        Returns:
+            VolumeHelper: The context of the helper container.
+        """
+        return VolumeHelper(self, names)
+
+    @abstractmethod
+    def start_helper(self, binds: list[str]) -> str:
+        """
+        Start a long-lived helper container with the HELPER_IMAGE.
+
+        Args:
+            binds (list[str]): The volume bindings, for example 'data:/volumes/data'.
+
+        Returns:
+            str: The ID of the started container.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def exec_in_container(self, container_id: str, command: list[str], output: Optional[BinaryIO] = None) -> None:
+        """
+        Run a command in a running Docker container.
+
+        Args:
+            container_id (str): The ID of the container.
+            command (list[str]): The command to run.
+            output (Optional[BinaryIO]): The stream to write the standard output of the command to.
+        """
+        raise NotImplementedError()
+
+    def stored_inspect(self, image_id: str) -> Optional[str]:
+        """
+        Get the inspect information of an image from the image store, without asking Docker.
+
+        The tags of an image can change while its ID stays the same, so if the images table
+        is cached, the stored tags are replaced with the tags in the table.
+
+        Args:
+            image_id (str): The ID of the image.
+
+        Returns:
+            Optional[str]: Inspect information formatted like the output of 'docker inspect',
+                           or None if the image is not stored.
+        """
+        image = self.image_store.get(image_id)
+        if image is None:
+            return None
+        if (CacheResources.IMAGES, self.images_cache_key) in self.cache:
+            records = self.images().by_id.get(ImageStore.full_id(image)[:12])
+            if records:
+                image["RepoTags"] = [record.reference for record in records if record.tag != NONE_VALUE]
+        return json.dumps([image], indent=4)
+
+    def store_inspect(self, output: str) -> str:
+        """
+        Keep the images in the output of 'docker inspect' in the image store.
+
+        Args:
+            output (str): Inspect information of images or containers.
+
+        Returns:
+            str: The same output.
+        """
+        try:
+            self.image_store.put(json.loads(output))
+        except (ValueError, TypeError, AttributeError):
+            pass
+        return output
+
+    def cache_clear(self, *resources: CacheResources) -> None:
+        """
+        Clear the cached data of the given kinds, or all cached data if no kind is given.
+
+        Args:
+            *resources (CacheResources): The kinds of data to clear.
+        """
+        self.cache.invalidate(*resources)
+
+    def follow_events(self, followed: bool) -> None:
+        """
+        Sets whether the listings are kept up to date by a Docker events listener. While they are,
+        they neither expire nor are invalidated by changes; when the listener stops, they are
+        dropped, because events may have been missed, and expire and are invalidated again.
+
+        Args:
+            followed (bool): Whether the events listener is running.
+        """
+        if followed:
+            self.cache.set_live(*LISTING_RESOURCES)
+        else:
+            self.cache.set_live()
+            self.cache.invalidate(*LISTING_RESOURCES)
+
+    def cache_stats(self) -> dict[CacheResources, CacheStats]:
+        """
+        Get the hit and miss counters of the cache.
+
+        Returns:
+            dict[CacheResources, CacheStats]: The counters of every kind of cached data.
+        """
+        return self.cache.stats
+
+    @abstractmethod
+    def delete_containers_by_image_id(self, image_id: str):
+        """
+        Delete all containers associated with a specific image ID.
+
+        Args:
+            image_id (str): The ID of the image.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_image(self, image_id: str) -> None:
+        """
+        Delete a Docker image by ID.
+
+        Args:
+            image_id (str): The ID of the image to delete.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def stop_container(self, container_id: str) -> None:
+        """
+        Stop a Docker container by ID.
+
+        Args:
+            container_id (str): The ID of the container to stop.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_container(self, container_id: str) -> None:
+        """
+        Delete a Docker container by ID.
+
+        Args:
+            container_id (str): The ID of the container to delete.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save_image(self, image_id: str, output: BinaryIO) -> None:
+        """
+        Stream a tar archive of a Docker image.
+
+        Args:
+            image_id (str): The ID of the Docker image to be saved.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save_images(self, references: list[str], output: BinaryIO) -> None:
+        """
+        Stream one tar archive of several Docker images, storing shared layers once.
+
+        Args:
+            references (list[str]): The references or IDs of the Docker images.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def export_container(self, container_id: str, output: BinaryIO) -> None:
+        """
+        Stream a tar archive of the filesystem of a Docker container.
+
+        Args:
+            container_id (str): The ID of the Docker container to be exported.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def inspect(self, container_or_image_id: str, is_image: bool = False) -> str:
+        """
+        Get inspect information about Docker image or container by id.
+
+        Args:
+            container_or_image_id (str): The ID of the image or container.
+            is_image (bool): Whether the ID is known to be an image, which may be kept in the image store.
+
+        Returns:
+            str: Inspect information of Image or Container.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def inspect_many(self, ids: list[str]) -> None:
+        """
+        Fetch the inspect information of several Docker images or containers into the cache,
+        so a following `inspect` of any of them does not wait for Docker.
+
+        IDs that are already cached are skipped, and failures are ignored.
+
+        Args:
+            ids (list[str]): The IDs of the images or containers.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def pull(self, name: str, progress: Optional[PullProgress] = None) -> None:
+        """
+        Pull a Docker image.
+
+        Args:
+            name (str): The name of the Docker image.
+            progress (Optional[PullProgress]): The progress to update while the layers are pulled.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def __for_each(
+            docker_func: Callable[[str], None],
+            ids: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Call an operation for every ID and collect the errors.
+
+        Args:
+            docker_func (Callable[[str], None]): The operation on one Docker object.
+            ids (list[str]): The IDs or names of the Docker objects.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all IDs after every operation.
+
+        Returns:
+            dict[str, str]: The error message of every ID whose operation failed.
+        """
+        errors: dict[str, str] = {}
+        for done, obj_id in enumerate(ids, 1):
+            try:
+                docker_func(obj_id)
+            except DockerCommandError as error:
+                errors[obj_id] = str(error)
+            if on_progress:
+                on_progress(done, len(ids))
+        return errors
+
+    def delete_containers(
+            self,
+            container_ids: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Delete several Docker containers.
+
+        Args:
+            container_ids (list[str]): The IDs of the containers to delete.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all containers after every operation.
+
+        Returns:
+            dict[str, str]: The error message of every container that could not be deleted.
+        """
+        return self.__for_each(self.delete_container, container_ids, on_progress)
+
+    def delete_images(
+            self,
+            image_ids: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Delete several Docker images with their containers.
+
+        Args:
+            image_ids (list[str]): The IDs of the images to delete.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all images after every operation.
+
+        Returns:
+            dict[str, str]: The error message of every image that could not be deleted.
+        """
+        return self.__for_each(self.delete_image, image_ids, on_progress)
+
+    def delete_volumes_by_name(
+            self,
+            names: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Delete several Docker volumes.
+
+        Args:
+            names (list[str]): The names of the volumes to delete.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all volumes after every operation.
+
+        Returns:
+            dict[str, str]: The error message of every volume that could not be deleted.
+        """
+        return self.__for_each(self.delete_volume_by_name, names, on_progress)
+
+
+class DockerCommunicator(ABCDockerCommunicator):
     """A class for communicating with Docker using subprocess."""
+    images_cache_key = DOCKER_ALL_IMAGES
 
     @staticmethod
-    @functools.lru_cache
-    def __get_output(command: str) -> str:
+    def __check_output(command: str) -> str:
         """
         Execute a command and return the output as a string.
 
@@ -38,16 +581,257 @@ class DockerCommunicator:
         except subprocess.CalledProcessError:
             raise DockerNotRunningError()
 
+    def __get_output(self, command: str, resource: CacheResources) -> str:
+        """
+        Execute a command and return the cached output as a string.
+
+        Args:
+            command (str): The command to execute.
+            resource (CacheResources): The kind of data the command outputs.
+
+        Returns:
+            str: The output of the command.
+
+        Raises:
+            DockerNotRunningError: If the command execution fails.
+        """
+        return self.cache.get(resource, command, lambda: self.__check_output(command))
+
+    def __get_listing(self, command: str, record_type: type[BaseRecord], resource: CacheResources) -> Listing:
+        """
+        Execute a listing command and parse its JSON lines into cached records.
+
+        Args:
+            command (str): The command to execute, with the '{{json .}}' format.
+            record_type (type[BaseRecord]): The type of the records.
+            resource (CacheResources): The kind of the listed objects.
+
+        Returns:
+            Listing: The parsed records.
+
+        Raises:
+            DockerNotRunningError: If the command execution fails.
+        """
+        return self.cache.get(
+            resource,
+            command,
+            lambda: Listing.from_json_lines(record_type, self.__check_output(command))
+        )
+
     @staticmethod
-    def __run_command(command: str) -> None:
+    def __run_command(command: str) -> str:
         """
-        Execute a command without capturing the output.
+        Execute a command that changes Docker objects.
 
         Args:
             command (str): The command to execute.
+
+        Returns:
+            str: The output of the command.
+
+        Raises:
+            DockerCommandError: If the command fails, with the error output of the command.
+        """
+        completed_process = subprocess.run(
+            command,
+            shell=True,
+            check=False,
+            capture_output=True,
+            text=True
+        )
+        if completed_process.returncode != 0:
+            raise DockerCommandError(completed_process.stderr.strip())
+        return completed_process.stdout
+
+    @staticmethod
+    def __stream_command(command: str, output: BinaryIO) -> None:
+        """
+        Execute a command and stream its binary output in chunks, without buffering it whole.
+
+        The error output goes to a temporary file rather than a pipe: a command that fills the pipe
+        of the error output would block before closing the standard output, which is read to the end first.
+
+        Args:
+            command (str): The command to execute.
+            output (BinaryIO): The stream to write the output of the command to.
+
+        Raises:
+            DockerCommandError: If the command fails, with the error output of the command.
+        """
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=stderr)
+            try:
+                while chunk := process.stdout.read1(CHUNK_SIZE):
+                    output.write(chunk)
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                process.stdout.close()
+            if process.wait() != 0:
+                stderr.seek(0)
+                raise DockerCommandError(stderr.read().decode(errors="replace").strip())
+
+    @staticmethod
+    def __batch_errors(ids: list[str], stderr: str) -> dict[str, str]:
+        """
+        Parse the error output of a failed batch command into per-ID errors.
+
+        Every error line is attributed to the IDs it mentions. Lines that mention
+        no ID (for example, when Docker is not reachable) are attributed to all
+        IDs without an error of their own.
+
+        Args:
+            ids (list[str]): The IDs or names passed to the command.
+            stderr (str): The error output of the command.
+
+        Returns:
+            dict[str, str]: The error message of every ID that failed.
+        """
+        errors: dict[str, str] = {}
+        unmatched: list[str] = []
+        for line in stderr.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            matched = [obj_id for obj_id in ids if obj_id in line]
+            for obj_id in matched:
+                errors[obj_id] = line
+            if not matched:
+                unmatched.append(line)
+        if unmatched:
+            for obj_id in ids:
+                errors.setdefault(obj_id, END_OF_LINE.join(unmatched))
+        return errors
+
+    @staticmethod
+    def __batches(command: str, ids: list[str]) -> Iterator[list[str]]:
+        """
+        Split IDs into batches whose command lines stay under MAX_BATCH_COMMAND_LENGTH.
+
+        Args:
+            command (str): The command the IDs are appended to.
+            ids (list[str]): The IDs or names of the Docker objects.
+
+        Returns:
+            Iterator[list[str]]: The batches of IDs.
+        """
+        batch: list[str] = []
+        length = len(command)
+        for obj_id in ids:
+            size = len(shlex.quote(obj_id)) + 1
+            if batch and length + size > MAX_BATCH_COMMAND_LENGTH:
+                yield batch
+                batch, length = [], len(command)
+            batch.append(obj_id)
+            length += size
+        if batch:
+            yield batch
+
+    def __run_batch(
+            self,
+            command: str,
+            ids: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Execute a command once for a whole batch of IDs appended to it.
+
+        Args:
+            command (str): The command, for example 'docker rm -f '.
+            ids (list[str]): The IDs or names of the Docker objects.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all IDs after every batch.
+
+        Returns:
+            dict[str, str]: The error message of every ID that failed.
+        """
+        errors: dict[str, str] = {}
+        done = 0
+        for batch in self.__batches(command, ids):
+            completed_process = subprocess.run(
+                command + SPACE.join(map(shlex.quote, batch)),
+                shell=True,
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            if completed_process.returncode != 0:
+                errors.update(self.__batch_errors(batch, completed_process.stderr))
+            done += len(batch)
+            if on_progress:
+                on_progress(done, len(ids))
+        return errors
+
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
+    def delete_containers(
+            self,
+            container_ids: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Delete several Docker containers with one 'docker rm -f' per batch.
+
+        Args:
+            container_ids (list[str]): The IDs of the containers to delete.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all containers after every batch.
+
+        Returns:
+            dict[str, str]: The error message of every container that could not be deleted.
+        """
+        return self.__run_batch(DOCKER_CONTAINER_REMOVE, container_ids, on_progress)
+
+    @invalidates(CacheResources.IMAGES, CacheResources.CONTAINERS, CacheResources.INSPECT)
+    def delete_images(
+            self,
+            image_ids: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
+        """
+        Delete several Docker images with one 'docker rmi -f' per batch,
+        after deleting the containers of all the images in one batch.
+
+        Args:
+            image_ids (list[str]): The IDs of the images to delete.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all images after every batch.
+
+        Returns:
+            dict[str, str]: The error message of every image that could not be deleted.
+        """
+        container_ids_by_image: dict[str, list[str]] = self.__containers_by_image()
+        container_ids: list[str] = [
+            container_id
+            for image_id in image_ids
+            for container_id in container_ids_by_image.get(image_id, [])
+        ]
+        if container_ids:
+            self.delete_containers(container_ids)
+        return self.__run_batch(DOCKER_IMAGE_RM, image_ids, on_progress)
+
+    @invalidates(CacheResources.VOLUMES)
+    def delete_volumes_by_name(
+            self,
+            names: list[str],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[str, str]:
         """
-        subprocess.run(command, shell=True, check=False, stdout=subprocess.DEVNULL)
+        Delete several Docker volumes with one 'docker volume rm -f' per batch.
 
+        Args:
+            names (list[str]): The names of the volumes to delete.
+            on_progress (Optional[Callable[[int, int], None]]): Called with the number of finished
+                                                               and all volumes after every batch.
+
+        Returns:
+            dict[str, str]: The error message of every volume that could not be deleted.
+        """
+        return self.__run_batch(DOCKER_VOLUME_REMOVE, names, on_progress)
+
+    @invalidates(CacheResources.IMAGES, CacheResources.INSPECT)
     def image_rename(self, old_name: str, new_name: str) -> None:
         """
         Renames a Docker image from the old name to the new name.
@@ -62,13 +846,14 @@ class DockerCommunicator:
         self.__run_command(
             DOCKER_IMAGE_RENAME.replace(
                 "<old_name>",
-                old_name
+                shlex.quote(old_name)
             ).replace(
                 "<new_name>",
-                new_name
+                shlex.quote(new_name)
             )
         )
 
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
     def container_rename(self, old_name: str, new_name: str) -> None:
         """
         Renames a Docker container from the old name to the new name.
@@ -83,13 +868,14 @@ class DockerCommunicator:
         self.__run_command(
             DOCKER_CONTAINER_RENAME.replace(
                 "<old_name>",
-                old_name
+                shlex.quote(old_name)
             ).replace(
                 "<new_name>",
-                new_name
+                shlex.quote(new_name)
             )
         )
 
+    @invalidates(CacheResources.VOLUMES)
     def create_new_volume(self, new_name: str) -> None:
         """
         Creates a new Docker volume with the specified name.
@@ -103,30 +889,7 @@ class DockerCommunicator:
         self.__run_command(
             DOCKER_VOLUME_CREATE.replace(
                 "<new_name>",
-                new_name
-            )
-        )
-
-    def volume_rename(self, old_name: str, new_name: str) -> None:
-        """
-        Renames a Docker volume from the old name to the new name.
-
-        This method first creates a new volume with the new name, then copies
-        the data from the old volume to the new volume, and finally removes
-        the old volume.
-
-        Args:
-            old_name (str): The current name of the Docker volume to be renamed.
-            new_name (str): The new name for the Docker volume.
-        """
-        self.create_new_volume(new_name)
-        self.__run_command(
-            DOCKER_VOLUME_COPY.replace(
-                "<old_name>",
-                old_name
-            ).replace(
-                "<new_name>",
-                new_name
+                shlex.quote(new_name)
             )
         )
 
@@ -138,45 +901,137 @@ class DockerCommunicator:
             str: The version of Docker.
         """
         return self.__get_output(
-            DOCKER_VERSION
+            DOCKER_VERSION,
+            CacheResources.VERSION
         )
 
-    def images(self) -> str:
+    def containers(self) -> Listing:
         """
-        Get information about all Docker images.
+        Get information about all Docker containers.
 
         Returns:
-            str: Information about all Docker images.
+            Listing: The records of all Docker containers.
 
         """
-        return self.__get_output(
-            DOCKER_ALL_IMAGES
+        return self.__get_listing(
+            DOCKER_ALL_CONTAINERS,
+            ContainerRecord,
+            CacheResources.CONTAINERS
         )
 
-    def containers(self) -> str:
+    def volumes(self) -> Listing:
         """
-        Get information about all Docker containers.
+        Get information about all Docker volumes.
 
         Returns:
-            str: Information about all Docker containers.
+            Listing: The records of all Docker volumes.
 
         """
-        return self.__get_output(
-            DOCKER_ALL_CONTAINERS
+        return self.__get_listing(
+            DOCKER_ALL_VOLUMES,
+            VolumeRecord,
+            CacheResources.VOLUMES
         )
 
-    def volumes(self) -> str:
+    def find_images(self, reference: str = EMPTY_STRING) -> list[ImageRecord]:
         """
-        Get information about all Docker volumes.
+        Fetch the records of Docker images matching a reference, bypassing the cache.
+
+        Args:
+            reference (str): The image reference, for example 'nginx:latest' (all images if empty).
 
         Returns:
-            str: Information about all Docker volumes.
+            list[ImageRecord]: The records of the matching images.
+        """
+        return Listing.from_json_lines(
+            ImageRecord,
+            self.__check_output(DOCKER_FIND_IMAGES.replace("<reference>", shlex.quote(reference) if reference else EMPTY_STRING))
+        ).records
 
+    def find_images_by_id(self, image_id: str) -> list[ImageRecord]:
         """
-        return self.__get_output(
-            DOCKER_ALL_VOLUMES
+        Fetch the records of a Docker image by ID, one per repository tag, bypassing the cache.
+
+        'docker images' can not filter by ID, so the image is inspected instead.
+
+        Args:
+            image_id (str): The ID of the image.
+
+        Returns:
+            list[ImageRecord]: The records of the image, or an empty list if it does not exist.
+        """
+        # an unknown ID makes the command fail and print an empty list
+        completed_process = subprocess.run(
+            DOCKER_IMAGE_INSPECT.replace("<id>", shlex.quote(image_id)),
+            shell=True,
+            check=False,
+            capture_output=True,
+            text=True
         )
+        try:
+            images: list[dict] = json.loads(completed_process.stdout or "[]")
+        except ValueError:
+            raise DockerNotRunningError()
+        return [record for image in images for record in ImageRecord.from_inspect(image)]
+
+    def find_containers(self, container_id: str) -> list[ContainerRecord]:
+        """
+        Fetch the record of a Docker container by ID, bypassing the cache.
+
+        Args:
+            container_id (str): The ID of the container.
+
+        Returns:
+            list[ContainerRecord]: The record of the container, or an empty list if it does not exist.
+        """
+        return Listing.from_json_lines(
+            ContainerRecord,
+            self.__check_output(DOCKER_FIND_CONTAINERS.replace("<id>", shlex.quote(container_id)))
+        ).records
+
+    def find_volumes(self, name: str) -> list[VolumeRecord]:
+        """
+        Fetch the record of a Docker volume by name, bypassing the cache.
 
+        Args:
+            name (str): The name of the volume.
+
+        Returns:
+            list[VolumeRecord]: The record of the volume, or an empty list if it does not exist.
+        """
+        records = Listing.from_json_lines(
+            VolumeRecord,
+            self.__check_output(DOCKER_FIND_VOLUMES.replace("<name>", shlex.quote(name)))
+        ).records
+        return [record for record in records if record.name == name]
+
+    def events(self) -> Iterator[dict]:
+        """
+        Follow the stream of Docker events of the 'docker events' command.
+
+        Returns:
+            Iterator[dict]: The decoded events, as they happen.
+        """
+        process = subprocess.Popen(
+            DOCKER_EVENTS,
+            shell=True,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        # the listener thread is a daemon, so its generator may never be closed before the exit
+        atexit.register(process.kill)
+        try:
+            for line in process.stdout:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            process.kill()
+            process.wait()
+            process.stdout.close()
+            atexit.unregister(process.kill)
+
+    @invalidates(CacheResources.VOLUMES)
     def delete_volume_by_name(self, name: str):
         """
         Delete a Docker volume by name.
@@ -186,31 +1041,70 @@ class DockerCommunicator:
 
         """
         self.__run_command(
-            DOCKER_VOLUME_REMOVE + name
+            DOCKER_VOLUME_REMOVE + shlex.quote(name)
         )
 
-    def tar_volume_by_name(self, name: str, filename: str):
+    def start_helper(self, binds: list[str]) -> str:
         """
-        Save a Docker volume to a file.
+        Start a long-lived helper container with the HELPER_IMAGE.
 
         Args:
-            name (str): The name of the Docker volume to be exported.
-            filename (str): The name of the file to save the volume to.
+            binds (list[str]): The volume bindings, for example 'data:/volumes/data'.
+
+        Returns:
+            str: The ID of the started container.
         """
-        self.__run_command(
-            DOCKER_TAR_VOLUME_BY_NAME.replace(
-                "<volume_name>",
-                name
+        return self.__run_command(
+            DOCKER_HELPER_START.replace(
+                "<binds>",
+                SPACE.join("-v " + shlex.quote(bind) for bind in binds)
             ).replace(
-                "<file_name>",
-                filename
+                "<image>",
+                shlex.quote(HELPER_IMAGE)
             )
-        )
+        ).strip()
+
+    def exec_in_container(self, container_id: str, command: list[str], output: Optional[BinaryIO] = None) -> None:
+        """
+        Run a command in a running Docker container with 'docker exec'.
+
+        Args:
+            container_id (str): The ID of the container.
+            command (list[str]): The command to run.
+            output (Optional[BinaryIO]): The stream to write the standard output of the command to.
+        """
+        docker_command = DOCKER_EXEC.replace("<container_id>", shlex.quote(container_id)).replace("<command>", shlex.join(command))
+        if output is None:
+            self.__run_command(docker_command)
+        else:
+            self.__stream_command(docker_command, output)
 
-    def cache_clear(self):
-        """Clear the cache used for command output."""
-        self.__get_output.cache_clear()
+    def __containers_by_image(self) -> dict[str, list[str]]:
+        """
+        Map the ID of every image to the IDs of all containers created from it,
+        including stopped ones, from a single 'docker container ls -a' listing.
+
+        The IMAGE column of a container is the reference it was created with, or the
+        image ID if that reference now points to another image, so it is resolved
+        with the references of the current images.
 
+        Returns:
+            dict[str, list[str]]: The IDs of the containers of every image ID.
+        """
+        image_ids_by_reference: dict[str, str] = {}
+        for image in Listing.from_json_lines(ImageRecord, self.__check_output(DOCKER_ALL_IMAGES)).records:
+            image_ids_by_reference[image.id] = image.id
+            image_ids_by_reference[image.reference] = image.id
+            if image.tag == LATEST:
+                image_ids_by_reference[image.repository] = image.id
+        containers: Listing = Listing.from_json_lines(ContainerRecord, self.__check_output(DOCKER_ALL_CONTAINERS))
+        container_ids_by_image: dict[str, list[str]] = {}
+        for container in containers.records:
+            image_id = image_ids_by_reference.get(container.image, container.image)
+            container_ids_by_image.setdefault(image_id, []).append(container.id)
+        return container_ids_by_image
+
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
     def delete_containers_by_image_id(self, image_id: str):
         """
         Delete all containers associated with a specific image ID.
@@ -219,17 +1113,11 @@ class DockerCommunicator:
             image_id (str): The ID of the image.
 
         """
-        completed_process = subprocess.run(
-            DOCKER_PS + " --filter ancestor=" + image_id + " --format '{{.ID}}'",
-            shell=True,
-            capture_output=True,
-            text=True
-        )
-        container_ids = completed_process.stdout.strip().split('\n')
-        for container_id in container_ids:
-            container_id = container_id.replace("'", "")
-            self.delete_container(container_id)
+        container_ids = self.__containers_by_image().get(image_id, [])
+        if container_ids:
+            self.delete_containers(container_ids)
 
+    @invalidates(CacheResources.IMAGES, CacheResources.INSPECT)
     def delete_image(self, image_id: str) -> None:
         """
         Delete a Docker image by ID.
@@ -240,9 +1128,10 @@ class DockerCommunicator:
         """
         self.delete_containers_by_image_id(image_id)
         self.__run_command(
-            DOCKER_IMAGE_RM + image_id
+            DOCKER_IMAGE_RM + shlex.quote(image_id)
         )
 
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
     def stop_container(self, container_id: str) -> None:
         """
         Stop a Docker container by ID.
@@ -252,69 +1141,131 @@ class DockerCommunicator:
 
         """
         self.__run_command(
-            DOCKER_CONTAINER_STOP + container_id
+            DOCKER_CONTAINER_STOP + shlex.quote(container_id)
         )
 
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
     def delete_container(self, container_id: str) -> None:
         """
         Delete a Docker container by ID.
 
+        The container is removed with force, which also kills it if it is running.
+
         Args:
             container_id (str): The ID of the container to delete.
 
         """
-        self.stop_container(container_id)
         self.__run_command(
-            DOCKER_CONTAINER_REMOVE + container_id
+            DOCKER_CONTAINER_REMOVE + shlex.quote(container_id)
         )
 
-    def save_image(self, image_id: str, file_name: str) -> None:
+    def save_image(self, image_id: str, output: BinaryIO) -> None:
         """
-        Save a Docker image to a file.
+        Stream a tar archive of a Docker image.
 
         Args:
             image_id (str): The ID of the Docker image to be saved.
-            file_name (str): The name of the file to save the image to.
+            output (BinaryIO): The stream to write the archive to.
 
         """
-        self.__run_command(
-            DOCKER_SAVE_IMAGE_BY_ID.replace("<file_name>", file_name).replace("<image_id>", image_id)
+        self.__stream_command(DOCKER_SAVE_IMAGE_BY_ID.replace("<image_id>", shlex.quote(image_id)), output)
+
+    def save_images(self, references: list[str], output: BinaryIO) -> None:
+        """
+        Stream one tar archive of several Docker images with a single 'docker save',
+        storing shared layers once.
+
+        Args:
+            references (list[str]): The references or IDs of the Docker images.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        self.__stream_command(
+            DOCKER_SAVE_IMAGES.replace("<references>", SPACE.join(shlex.quote(reference) for reference in references)),
+            output
         )
 
-    def export_container(self, container_id: str, file_name: str) -> None:
+    def export_container(self, container_id: str, output: BinaryIO) -> None:
         """
-        Export a Docker container to a file.
+        Stream a tar archive of the filesystem of a Docker container.
 
         Args:
             container_id (str): The ID of the Docker container to be exported.
-            file_name (str): The name of the file to save the container to.
+            output (BinaryIO): The stream to write the archive to.
         """
-        self.__run_command(
-            DOCKER_EXPORT_CONTAINER.replace("<file_name>", file_name).replace("<container_id>", container_id)
-        )
+        self.__stream_command(DOCKER_EXPORT_CONTAINER.replace("<container_id>", shlex.quote(container_id)), output)
 
-    def inspect(self, container_or_image_id: str) -> str:
+    def inspect(self, container_or_image_id: str, is_image: bool = False) -> str:
         """
         Get inspect information about Docker image or container by id.
 
+        On a miss of the cache, an image is looked up in the image store before asking Docker;
+        containers are never stored.
+
+        Args:
+            container_or_image_id (str): The ID of the image or container.
+            is_image (bool): Whether the ID is known to be an image.
+
         Returns:
             str: Inspect information of Image or Container.
+        """
+        command = DOCKER_INSPECT_BY_ID.replace("<id>", shlex.quote(container_or_image_id))
+
+        def fetch() -> str:
+            stored = self.stored_inspect(container_or_image_id) if is_image else None
+            return stored or self.store_inspect(self.__check_output(command))
 
+        return self.cache.get(CacheResources.INSPECT, command, fetch)
+
+    def inspect_many(self, ids: list[str]) -> None:
         """
-        return self.__get_output(
-            DOCKER_INSPECT_BY_ID.replace("<id>", container_or_image_id)
-        )
+        Fetch the inspect information of several Docker images or containers into the cache
+        with one 'docker inspect' per batch of IDs.
+
+        Every inspected object is cached under the same key as the output of `inspect`
+        for its ID, and inspected images are kept in the image store. IDs that are already
+        cached or stored are skipped, and failures are ignored.
 
-    def pull(self, name:str) -> None:
+        Args:
+            ids (list[str]): The IDs of the images or containers.
         """
-        Pull a Docker image.
+        keys: dict[str, str] = {obj_id: DOCKER_INSPECT_BY_ID.replace("<id>", shlex.quote(obj_id)) for obj_id in ids}
+        missing: list[str] = [
+            obj_id for obj_id, key in keys.items()
+            if (CacheResources.INSPECT, key) not in self.cache and obj_id not in self.image_store
+        ]
+        for batch in self.__batches(DOCKER_INSPECT_MANY, missing):
+            # unknown IDs make the command fail, but the found objects are still printed
+            completed_process = subprocess.run(
+                DOCKER_INSPECT_MANY.replace("<ids>", SPACE.join(map(shlex.quote, batch))),
+                shell=True,
+                check=False,
+                capture_output=True,
+                text=True
+            )
+            try:
+                objects: list[dict] = json.loads(completed_process.stdout or "[]")
+            except ValueError:
+                continue
+            self.image_store.put(objects)
+            for obj_id in batch:
+                for obj in objects:
+                    if obj.get("Id", EMPTY_STRING).split(":")[-1].startswith(obj_id):
+                        self.cache.put(CacheResources.INSPECT, keys[obj_id], json.dumps([obj], indent=4))
+                        break
+
+    @invalidates(CacheResources.IMAGES)
+    def pull(self, name: str, progress: Optional[PullProgress] = None) -> None:
+        """
+        Pull a Docker image, streaming the per-layer output of the command into the progress.
 
         Args:
             name (str): The name of the Docker image.
+            progress (Optional[PullProgress]): The progress to update while the layers are pulled.
         """
-        self.__run_command(
-            DOCKER_PULL.replace("<name>", name)
-        )
+        progress = progress or PullProgress(name)
+        output = LineWriter(progress.apply_line)
+        self.__stream_command(DOCKER_PULL.replace("<name>", shlex.quote(name)), output)
+        output.flush()
 
 
 docker_communicator = DockerCommunicator()
@@ -0,0 +1,786 @@
+"""
+This module provides a DockerEngineCommunicator class that talks to the Docker Engine API directly
+over the daemon socket instead of spawning a docker CLI process for every call.
+
+It includes:
+- UnixHTTPConnection: An HTTP connection over a Unix domain socket.
+- MultiplexedStream: A sink that splits the output of an exec into standard output and error.
+- DockerEngineCommunicator: A concrete implementation of the ABCDockerCommunicator
+  that keeps one persistent keep-alive connection to the Docker daemon.
+"""
+import http
+import http.client
+import json
+import socket
+import struct
+import threading
+import urllib.parse
+from typing import BinaryIO, Iterator, Optional, Union
+
+from .docker_comunicator import ABCDockerCommunicator
+from ..exeptions.exeptions import DockerNotRunningError, DockerCommandError, DockerNotFoundError
+from ..utils.constants import (
+    DOCKER_HOST, UNIX_SCHEME, HELPER_IMAGE, NONE_VALUE, CHUNK_SIZE, COLON, SLASH, LATEST, EMPTY_STRING,
+    STREAM_HEADER_SIZE, STDERR_STREAM
+)
+from ..utils.cache import invalidates
+from ..utils.enams import CacheResources, DockerEngineEndpoints
+from ..utils.formatters import human_size, time_ago
+from ..utils.pull_progress import PullProgress
+from ..utils.records import Listing, BaseRecord, ImageRecord, ContainerRecord, VolumeRecord
+from ..utils.streams import LineWriter
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """An HTTP connection that is established over a Unix domain socket."""
+
+    def __init__(self, socket_path: str):
+        """
+        Initializes the connection with the path of the socket.
+
+        Args:
+            socket_path (str): The path of the Unix domain socket.
+        """
+        super().__init__("localhost")
+        self.socket_path: str = socket_path
+
+    def connect(self):
+        """Connects to the Unix domain socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class MultiplexedStream:
+    """
+    A binary sink that splits the multiplexed output of an exec into standard output and error.
+
+    The daemon sends every piece of the output as a frame with an 8-byte header: the stream
+    type, three zero bytes and the big-endian size of the payload.
+
+    Attributes:
+        output (Optional[BinaryIO]): The stream the standard output is written to, or None to drop it.
+        stderr (bytearray): The collected standard error.
+    """
+
+    def __init__(self, output: Optional[BinaryIO]):
+        """
+        Initializes the sink.
+
+        Args:
+            output (Optional[BinaryIO]): The stream to write the standard output to, or None to drop it.
+        """
+        self.output: Optional[BinaryIO] = output
+        self.stderr = bytearray()
+        self.__buffer = bytearray()
+
+    def write(self, chunk: bytes) -> int:
+        """
+        Consumes a chunk of the multiplexed stream.
+
+        Args:
+            chunk (bytes): The chunk, which may contain parts of several frames.
+
+        Returns:
+            int: The number of consumed bytes.
+        """
+        self.__buffer += chunk
+        while len(self.__buffer) >= STREAM_HEADER_SIZE:
+            stream_type = self.__buffer[0]
+            size = struct.unpack(">I", self.__buffer[4:STREAM_HEADER_SIZE])[0]
+            if len(self.__buffer) < STREAM_HEADER_SIZE + size:
+                break
+            payload = bytes(self.__buffer[STREAM_HEADER_SIZE:STREAM_HEADER_SIZE + size])
+            del self.__buffer[:STREAM_HEADER_SIZE + size]
+            if stream_type == STDERR_STREAM:
+                self.stderr += payload
+            elif self.output is not None:
+                self.output.write(payload)
+        return len(chunk)
+
+
+class DockerEngineCommunicator(ABCDockerCommunicator):
+    """A class for communicating with Docker through the Docker Engine API."""
+    images_cache_key = DockerEngineEndpoints.IMAGES
+
+    def __init__(self, docker_host: str = DOCKER_HOST):
+        """
+        Initializes the communicator with the address of the Docker daemon.
+
+        Args:
+            docker_host (str): The daemon address, for example 'unix:///var/run/docker.sock'
+                               or 'tcp://127.0.0.1:2375'.
+        """
+        super().__init__()
+        self.docker_host = urllib.parse.urlparse(docker_host)
+        self.__local = threading.local()
+
+    def __new_connection(self) -> http.client.HTTPConnection:
+        """
+        Creates a new connection to the Docker daemon.
+
+        Returns:
+            http.client.HTTPConnection: The connection to the daemon.
+        """
+        if self.docker_host.scheme == UNIX_SCHEME:
+            return UnixHTTPConnection(self.docker_host.path)
+        return http.client.HTTPConnection(self.docker_host.hostname, self.docker_host.port)
+
+    def __get_connection(self) -> http.client.HTTPConnection:
+        """
+        Returns the persistent connection of the current thread, creating it if needed.
+
+        Returns:
+            http.client.HTTPConnection: The keep-alive connection to the daemon.
+        """
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = self.__new_connection()
+            self.__local.connection = connection
+        return connection
+
+    def __drop_connection(self):
+        """Closes the persistent connection of the current thread."""
+        connection = getattr(self.__local, "connection", None)
+        if connection is not None:
+            connection.close()
+        self.__local.connection = None
+
+    def __request(
+            self,
+            method: str,
+            path: str,
+            query: Optional[dict] = None,
+            body: Optional[dict] = None,
+            output: Optional[BinaryIO] = None
+    ) -> tuple[int, bytes]:
+        """
+        Sends a request to the Docker daemon over the persistent connection.
+
+        A request that fails because the daemon closed the idle connection is retried once
+        on a new connection. Only the errors of connecting to, sending to and receiving from
+        the daemon mean that it can not be reached; an error of writing the output, such as
+        a full disk, is raised as it is. After any error the connection is closed, because
+        the response may have been left half-read.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The endpoint path.
+            query (Optional[dict]): The query parameters.
+            body (Optional[dict]): The JSON body of the request.
+            output (Optional[BinaryIO]): The stream to write a successful response body to in chunks.
+
+        Returns:
+            tuple[int, bytes]: The status code and the response body.
+
+        Raises:
+            DockerNotRunningError: If the daemon can not be reached.
+            OSError: If the output can not be written.
+        """
+        url = urllib.parse.quote(path, safe="/:@")
+        if query:
+            url += "?" + urllib.parse.urlencode(query, doseq=True)
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        data = json.dumps(body).encode() if body is not None else None
+        for attempt in range(2):
+            connection = self.__get_connection()
+            streaming = False
+            writing = False
+            try:
+                connection.request(method, url, body=data, headers=headers)
+                response = connection.getresponse()
+                if output is not None and response.status == http.HTTPStatus.OK:
+                    streaming = True
+                    while chunk := response.read1(CHUNK_SIZE):
+                        writing = True
+                        output.write(chunk)
+                        writing = False
+                    return response.status, b""
+                return response.status, response.read()
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    BrokenPipeError, ConnectionResetError):
+                self.__drop_connection()
+                if writing:
+                    raise
+                if attempt or streaming:
+                    raise DockerNotRunningError()
+            except (OSError, http.client.HTTPException):
+                self.__drop_connection()
+                if writing:
+                    raise
+                raise DockerNotRunningError()
+            except BaseException:
+                # e.g. a malformed stream in the output; the rest of the response is not read
+                self.__drop_connection()
+                raise
+
+    def __get_json(self, path: str, query: Optional[dict] = None) -> Union[dict, list]:
+        """
+        Sends a GET request and decodes the JSON response.
+
+        Args:
+            path (str): The endpoint path.
+            query (Optional[dict]): The query parameters.
+
+        Returns:
+            Union[dict, list]: The decoded response.
+
+        Raises:
+            DockerNotRunningError: If the daemon can not be reached.
+            DockerNotFoundError: If the object does not exist, with the message of the daemon.
+            DockerCommandError: If the daemon answers with another error, with the message of the daemon.
+        """
+        status, data = self.__request("GET", path, query)
+        if status == http.HTTPStatus.NOT_FOUND:
+            raise DockerNotFoundError(self.__error_message(data))
+        if status != http.HTTPStatus.OK:
+            raise DockerCommandError(self.__error_message(data))
+        return json.loads(data)
+
+    def __run(
+            self,
+            method: str,
+            path: str,
+            query: Optional[dict] = None,
+            body: Optional[dict] = None,
+            output: Optional[BinaryIO] = None
+    ) -> bytes:
+        """
+        Sends a request that changes Docker objects, like the CLI command runner does.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The endpoint path.
+            query (Optional[dict]): The query parameters.
+            body (Optional[dict]): The JSON body of the request.
+            output (Optional[BinaryIO]): The stream to write a successful response body to in chunks.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            DockerCommandError: If the daemon answers with an error, with the message of the daemon.
+        """
+        status, data = self.__request(method, path, query, body, output)
+        if status >= http.HTTPStatus.BAD_REQUEST:
+            raise DockerCommandError(self.__error_message(data))
+        return data
+
+    @staticmethod
+    def __error_message(data: bytes) -> str:
+        """
+        Extracts the message from an error response of the daemon.
+
+        Args:
+            data (bytes): The body of the error response.
+
+        Returns:
+            str: The error message.
+        """
+        try:
+            return json.loads(data)["message"]
+        except (ValueError, KeyError, TypeError):
+            return data.decode(errors="replace").strip()
+
+    @staticmethod
+    def __query(query: dict, filters: Optional[dict]) -> dict:
+        """
+        Adds the JSON encoded filters to the query parameters.
+
+        Args:
+            query (dict): The query parameters.
+            filters (Optional[dict]): The filters of the Docker Engine API.
+
+        Returns:
+            dict: The query parameters with the filters.
+        """
+        if filters:
+            return {**query, "filters": json.dumps(filters)}
+        return query
+
+    @staticmethod
+    def __endpoint(endpoint: DockerEngineEndpoints, obj_id: str) -> str:
+        """
+        Fills the object ID into an endpoint template.
+
+        Args:
+            endpoint (DockerEngineEndpoints): The endpoint template.
+            obj_id (str): The ID or name of the Docker object.
+
+        Returns:
+            str: The endpoint path.
+        """
+        return endpoint.value.replace("{id}", obj_id)
+
+    @staticmethod
+    def __split_reference(name: str) -> tuple[str, str]:
+        """
+        Splits an image reference into the repository and the tag.
+
+        Args:
+            name (str): The image reference, for example 'user/repository:tag'.
+
+        Returns:
+            tuple[str, str]: The repository and the tag ('latest' if the reference has no tag).
+        """
+        if COLON in name.rsplit(SLASH, 1)[-1]:
+            repository, tag = name.rsplit(COLON, 1)
+            return repository, tag
+        return name, LATEST
+
+    def __create_helper(self, command: list[str], binds: list[str]) -> str:
+        """
+        Creates a throwaway helper container, pulling the helper image if it is missing.
+
+        Args:
+            command (list[str]): The command of the helper container.
+            binds (list[str]): The volume bindings of the helper container.
+
+        Returns:
+            str: The ID of the created container.
+        """
+        body = {"Image": HELPER_IMAGE, "Cmd": command, "HostConfig": {"Binds": binds}}
+        status, data = self.__request("POST", DockerEngineEndpoints.CONTAINER_CREATE, body=body)
+        if status == http.HTTPStatus.NOT_FOUND:
+            self.pull(HELPER_IMAGE)
+            data = self.__run("POST", DockerEngineEndpoints.CONTAINER_CREATE, body=body)
+        elif status != http.HTTPStatus.CREATED:
+            raise DockerCommandError(self.__error_message(data))
+        return json.loads(data)["Id"]
+
+    def __list_images(self, filters: Optional[dict] = None) -> Listing:
+        """
+        Fetches the Docker images matching the filters and converts them to records, one per repository tag.
+
+        Args:
+            filters (Optional[dict]): The filters of the Docker Engine API (all objects if None).
+
+        Returns:
+            Listing: The records of the matching Docker images.
+        """
+        records: list[BaseRecord] = []
+        for image in self.__get_json(DockerEngineEndpoints.IMAGES, self.__query({"all": 1}, filters)):
+            for repo_tag in image.get("RepoTags") or [NONE_VALUE + COLON + NONE_VALUE]:
+                repository, tag = repo_tag.rsplit(COLON, 1)
+                records.append(ImageRecord(
+                    image_id=image["Id"].split(COLON)[-1][:12],
+                    repository=repository,
+                    tag=tag,
+                    created=time_ago(image["Created"]),
+                    size=human_size(image["Size"]),
+                    created_at=image["Created"]
+                ))
+        return Listing(ImageRecord, records)
+
+    def __list_containers(self, filters: Optional[dict] = None) -> Listing:
+        """
+        Fetches the Docker containers matching the filters and converts them to records.
+
+        Args:
+            filters (Optional[dict]): The filters of the Docker Engine API (all objects if None).
+
+        Returns:
+            Listing: The records of the matching Docker containers.
+        """
+        records: list[BaseRecord] = []
+        for container in self.__get_json(DockerEngineEndpoints.CONTAINERS, self.__query({"all": 1}, filters)):
+            command = container.get("Command", EMPTY_STRING)
+            ports = ", ".join(
+                f"{port['IP']}:{port['PublicPort']}->{port['PrivatePort']}/{port['Type']}"
+                if port.get("PublicPort") else f"{port['PrivatePort']}/{port['Type']}"
+                for port in container.get("Ports") or []
+            )
+            records.append(ContainerRecord(
+                container_id=container["Id"][:12],
+                image=container["Image"],
+                command='"' + (command if len(command) <= 20 else command[:19] + "…") + '"',
+                created=time_ago(container["Created"]),
+                status=container.get("Status", EMPTY_STRING),
+                ports=ports,
+                names=",".join(name.lstrip(SLASH) for name in container.get("Names") or [])
+            ))
+        return Listing(ContainerRecord, records)
+
+    def __list_volumes(self, filters: Optional[dict] = None) -> Listing:
+        """
+        Fetches the Docker volumes matching the filters and converts them to records.
+
+        Args:
+            filters (Optional[dict]): The filters of the Docker Engine API (all objects if None).
+
+        Returns:
+            Listing: The records of the matching Docker volumes.
+        """
+        return Listing(VolumeRecord, [
+            VolumeRecord(driver=volume["Driver"], volume_name=volume["Name"])
+            for volume in self.__get_json(DockerEngineEndpoints.VOLUMES, self.__query({}, filters)).get("Volumes") or []
+        ])
+
+    @invalidates(CacheResources.IMAGES, CacheResources.INSPECT)
+    def image_rename(self, old_name: str, new_name: str) -> None:
+        """
+        Renames a Docker image from the old name to the new name.
+
+        Args:
+            old_name (str): The current name of the Docker image to be renamed.
+            new_name (str): The new name for the Docker image.
+        """
+        repository, tag = self.__split_reference(new_name)
+        self.__run(
+            "POST",
+            self.__endpoint(DockerEngineEndpoints.IMAGE_TAG, old_name),
+            {"repo": repository, "tag": tag}
+        )
+
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
+    def container_rename(self, old_name: str, new_name: str) -> None:
+        """
+        Renames a Docker container from the old name to the new name.
+
+        Args:
+            old_name (str): The current name of the Docker container to be renamed.
+            new_name (str): The new name for the Docker container.
+        """
+        self.__run(
+            "POST",
+            self.__endpoint(DockerEngineEndpoints.CONTAINER_RENAME, old_name),
+            {"name": new_name}
+        )
+
+    @invalidates(CacheResources.VOLUMES)
+    def create_new_volume(self, new_name: str) -> None:
+        """
+        Creates a new Docker volume with the specified name.
+
+        Args:
+            new_name (str): The name for the new Docker volume to be created.
+        """
+        self.__run("POST", DockerEngineEndpoints.VOLUME_CREATE, body={"Name": new_name})
+
+    def check_version(self) -> str:
+        """
+        Check the version of Docker.
+
+        Returns:
+            str: The version of Docker.
+        """
+        version = self.cache.get(CacheResources.VERSION, DockerEngineEndpoints.VERSION, lambda: self.__get_json(DockerEngineEndpoints.VERSION))
+        return f"Docker version {version['Version']}, build {version.get('GitCommit', NONE_VALUE)}"
+
+    def containers(self) -> Listing:
+        """
+        Get information about all Docker containers.
+
+        Returns:
+            Listing: The records of all Docker containers.
+        """
+        return self.cache.get(CacheResources.CONTAINERS, DockerEngineEndpoints.CONTAINERS, self.__list_containers)
+
+    def volumes(self) -> Listing:
+        """
+        Get information about all Docker volumes.
+
+        Returns:
+            Listing: The records of all Docker volumes.
+        """
+        return self.cache.get(CacheResources.VOLUMES, DockerEngineEndpoints.VOLUMES, self.__list_volumes)
+
+    def find_images(self, reference: str = EMPTY_STRING) -> list[ImageRecord]:
+        """
+        Fetch the records of Docker images matching a reference, bypassing the cache.
+
+        Args:
+            reference (str): The image reference, for example 'nginx:latest' (all images if empty).
+
+        Returns:
+            list[ImageRecord]: The records of the matching images.
+        """
+        return self.__list_images({"reference": [reference]} if reference else None).records
+
+    def find_images_by_id(self, image_id: str) -> list[ImageRecord]:
+        """
+        Fetch the records of a Docker image by ID, one per repository tag, bypassing the cache.
+
+        The daemon can not list images by ID, so the image is inspected instead.
+
+        Args:
+            image_id (str): The ID of the image.
+
+        Returns:
+            list[ImageRecord]: The records of the image, or an empty list if it does not exist.
+        """
+        try:
+            image = self.__get_json(self.__endpoint(DockerEngineEndpoints.IMAGE_INSPECT, image_id))
+        except DockerNotFoundError:
+            return []
+        return ImageRecord.from_inspect(image)
+
+    def find_containers(self, container_id: str) -> list[ContainerRecord]:
+        """
+        Fetch the record of a Docker container by ID, bypassing the cache.
+
+        Args:
+            container_id (str): The ID of the container.
+
+        Returns:
+            list[ContainerRecord]: The record of the container, or an empty list if it does not exist.
+        """
+        return self.__list_containers({"id": [container_id]}).records
+
+    def find_volumes(self, name: str) -> list[VolumeRecord]:
+        """
+        Fetch the record of a Docker volume by name, bypassing the cache.
+
+        Args:
+            name (str): The name of the volume.
+
+        Returns:
+            list[VolumeRecord]: The record of the volume, or an empty list if it does not exist.
+        """
+        return [record for record in self.__list_volumes({"name": [name]}).records if record.name == name]
+
+    def events(self) -> Iterator[dict]:
+        """
+        Follow the stream of Docker events of the '/events' endpoint.
+
+        The stream holds its own connection, so the persistent connection of the
+        thread stays free for other requests.
+
+        Returns:
+            Iterator[dict]: The decoded events, as they happen.
+        """
+        connection = self.__new_connection()
+        try:
+            connection.request("GET", DockerEngineEndpoints.EVENTS.value)
+            response = connection.getresponse()
+            if response.status != http.HTTPStatus.OK:
+                raise DockerCommandError(self.__error_message(response.read()))
+            for line in response:
+                if line.strip():
+                    yield json.loads(line)
+        except OSError:
+            raise DockerNotRunningError()
+        finally:
+            connection.close()
+
+    @invalidates(CacheResources.VOLUMES)
+    def delete_volume_by_name(self, name: str):
+        """
+        Delete a Docker volume by name.
+
+        Args:
+            name (str): The name of the volume to delete.
+        """
+        self.__run("DELETE", self.__endpoint(DockerEngineEndpoints.VOLUME_DELETE, name), {"force": 1})
+
+    def start_helper(self, binds: list[str]) -> str:
+        """
+        Start a long-lived helper container with the HELPER_IMAGE.
+
+        Args:
+            binds (list[str]): The volume bindings, for example 'data:/volumes/data'.
+
+        Returns:
+            str: The ID of the started container.
+        """
+        container_id = self.__create_helper(["sleep", "infinity"], binds)
+        self.__run("POST", self.__endpoint(DockerEngineEndpoints.CONTAINER_START, container_id))
+        return container_id
+
+    def exec_in_container(self, container_id: str, command: list[str], output: Optional[BinaryIO] = None) -> None:
+        """
+        Run a command in a running Docker container and wait for it to finish.
+
+        Args:
+            container_id (str): The ID of the container.
+            command (list[str]): The command to run.
+            output (Optional[BinaryIO]): The stream to write the standard output of the command to.
+
+        Raises:
+            DockerCommandError: If the command fails, with its standard error.
+        """
+        data = self.__run(
+            "POST",
+            self.__endpoint(DockerEngineEndpoints.CONTAINER_EXEC, container_id),
+            body={"Cmd": command, "AttachStdout": True, "AttachStderr": True}
+        )
+        exec_id = json.loads(data)["Id"]
+        stream = MultiplexedStream(output)
+        self.__run(
+            "POST",
+            self.__endpoint(DockerEngineEndpoints.EXEC_START, exec_id),
+            body={"Detach": False, "Tty": False},
+            output=stream
+        )
+        if self.__get_json(self.__endpoint(DockerEngineEndpoints.EXEC_INSPECT, exec_id)).get("ExitCode"):
+            raise DockerCommandError(stream.stderr.decode(errors="replace").strip())
+
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
+    def delete_containers_by_image_id(self, image_id: str):
+        """
+        Delete all containers associated with a specific image ID.
+
+        Args:
+            image_id (str): The ID of the image.
+        """
+        status, data = self.__request(
+            "GET",
+            DockerEngineEndpoints.CONTAINERS,
+            {"all": 1, "filters": json.dumps({"ancestor": [image_id]})}
+        )
+        if status != http.HTTPStatus.OK:
+            return
+        for container in json.loads(data):
+            self.delete_container(container["Id"])
+
+    @invalidates(CacheResources.IMAGES, CacheResources.INSPECT)
+    def delete_image(self, image_id: str) -> None:
+        """
+        Delete a Docker image by ID.
+
+        Args:
+            image_id (str): The ID of the image to delete.
+        """
+        self.delete_containers_by_image_id(image_id)
+        self.__run("DELETE", self.__endpoint(DockerEngineEndpoints.IMAGE_DELETE, image_id), {"force": 1})
+
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
+    def stop_container(self, container_id: str) -> None:
+        """
+        Stop a Docker container by ID.
+
+        Args:
+            container_id (str): The ID of the container to stop.
+        """
+        self.__run("POST", self.__endpoint(DockerEngineEndpoints.CONTAINER_STOP, container_id))
+
+    @invalidates(CacheResources.CONTAINERS, CacheResources.INSPECT)
+    def delete_container(self, container_id: str) -> None:
+        """
+        Delete a Docker container by ID.
+
+        The container is removed with force, which also kills it if it is running.
+
+        Args:
+            container_id (str): The ID of the container to delete.
+        """
+        self.__run("DELETE", self.__endpoint(DockerEngineEndpoints.CONTAINER_DELETE, container_id), {"force": 1})
+
+    def save_image(self, image_id: str, output: BinaryIO) -> None:
+        """
+        Stream a tar archive of a Docker image.
+
+        Args:
+            image_id (str): The ID of the Docker image to be saved.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        self.__run("GET", self.__endpoint(DockerEngineEndpoints.IMAGE_SAVE, image_id), output=output)
+
+    def save_images(self, references: list[str], output: BinaryIO) -> None:
+        """
+        Stream one tar archive of several Docker images, storing shared layers once.
+
+        Args:
+            references (list[str]): The references or IDs of the Docker images.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        self.__run("GET", DockerEngineEndpoints.IMAGES_SAVE, {"names": references}, output=output)
+
+    def export_container(self, container_id: str, output: BinaryIO) -> None:
+        """
+        Stream a tar archive of the filesystem of a Docker container.
+
+        Args:
+            container_id (str): The ID of the Docker container to be exported.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        self.__run(
+            "GET",
+            self.__endpoint(DockerEngineEndpoints.CONTAINER_EXPORT, container_id),
+            output=output
+        )
+
+    def inspect(self, container_or_image_id: str, is_image: bool = False) -> str:
+        """
+        Get inspect information about Docker image or container by id.
+
+        An ID known to be an image is inspected as an image, and on a miss of the cache it is
+        looked up in the image store before asking the daemon. Any other ID is looked up as
+        a container first and as an image if no container has it.
+
+        Args:
+            container_or_image_id (str): The ID of the image or container.
+            is_image (bool): Whether the ID is known to be an image.
+
+        Returns:
+            str: Inspect information of Image or Container, formatted like the output of 'docker inspect'.
+
+        Raises:
+            DockerNotFoundError: If neither a container nor an image has the ID.
+        """
+        if is_image:
+            path = self.__endpoint(DockerEngineEndpoints.IMAGE_INSPECT, container_or_image_id)
+            return self.cache.get(
+                CacheResources.INSPECT,
+                path,
+                lambda: self.stored_inspect(container_or_image_id)
+                or self.store_inspect(json.dumps([self.__get_json(path)], indent=4))
+            )
+        not_found: Optional[DockerNotFoundError] = None
+        for endpoint in (DockerEngineEndpoints.CONTAINER_INSPECT, DockerEngineEndpoints.IMAGE_INSPECT):
+            path = self.__endpoint(endpoint, container_or_image_id)
+            try:
+                return self.cache.get(
+                    CacheResources.INSPECT,
+                    path,
+                    lambda: self.store_inspect(json.dumps([self.__get_json(path)], indent=4))
+                )
+            except DockerNotFoundError as error:
+                not_found = error
+        raise not_found
+
+    def inspect_many(self, ids: list[str]) -> None:
+        """
+        Fetch the inspect information of several Docker images or containers into the cache.
+
+        The daemon has no endpoint that inspects several objects, so they are inspected one
+        after another over the keep-alive connection. IDs that are already cached or kept in
+        the image store are skipped, and failures are ignored.
+
+        Args:
+            ids (list[str]): The IDs of the images or containers.
+        """
+        for obj_id in dict.fromkeys(ids):
+            paths = [
+                self.__endpoint(endpoint, obj_id)
+                for endpoint in (DockerEngineEndpoints.CONTAINER_INSPECT, DockerEngineEndpoints.IMAGE_INSPECT)
+            ]
+            if obj_id in self.image_store or any((CacheResources.INSPECT, path) in self.cache for path in paths):
+                continue
+            try:
+                self.inspect(obj_id)
+            except (DockerNotRunningError, DockerCommandError):
+                continue
+
+    @invalidates(CacheResources.IMAGES)
+    def pull(self, name: str, progress: Optional[PullProgress] = None) -> None:
+        """
+        Pull a Docker image, streaming the JSON progress messages of the daemon into the progress.
+
+        The daemon answers with 200 even if the pull fails later, and reports the failure
+        as an error message in the stream instead.
+
+        Args:
+            name (str): The name of the Docker image.
+            progress (Optional[PullProgress]): The progress to update while the layers are pulled.
+
+        Raises:
+            DockerCommandError: If the daemon reports an error.
+        """
+        progress = progress or PullProgress(name)
+        output = LineWriter(lambda line: progress.apply_json(json.loads(line)))
+        repository, tag = self.__split_reference(name)
+        self.__run("POST", DockerEngineEndpoints.IMAGE_CREATE, {"fromImage": repository, "tag": tag}, output=output)
+        output.flush()
+        if progress.error:
+            raise DockerCommandError(progress.error)
@@ -0,0 +1,149 @@
+"""
+This module provides a DockerEventsListener class that keeps the cached listings of a Docker
+communicator up to date by following the stream of Docker events in a background thread.
+
+Every event is applied to the listing of its object type as an incremental patch:
+only the rows of the object the event is about are fetched again or removed. While the
+listener runs, changes do not invalidate the cached listings (see `follow_events`).
+"""
+import threading
+from typing import Callable
+
+from .docker_comunicator import ABCDockerCommunicator
+from ..exeptions.exeptions import DockerNotRunningError, DockerCommandError
+from ..utils.constants import COLON, NONE_VALUE, EMPTY_STRING
+from ..utils.enams import EventTypes
+from ..utils.records import Listing, BaseRecord
+
+
+class DockerEventsListener(threading.Thread):
+    """
+    A background thread that applies Docker events to the listings of a Docker communicator.
+
+    Attributes:
+        docker_communicator (ABCDockerCommunicator): The communicator whose listings are patched.
+        changed (threading.Event): Set every time a listing has been patched.
+    """
+
+    def __init__(self, docker_communicator: ABCDockerCommunicator):
+        """
+        Initializes the listener for the given communicator.
+
+        Args:
+            docker_communicator (ABCDockerCommunicator): The communicator whose listings are patched.
+        """
+        super().__init__(daemon=True)
+        self.docker_communicator: ABCDockerCommunicator = docker_communicator
+        self.changed = threading.Event()
+        self.handlers_dict: dict[tuple[str, str], Callable[[str, dict], None]] = {
+            (EventTypes.CONTAINER, "create"): self.refresh_container,
+            (EventTypes.CONTAINER, "rename"): self.refresh_container,
+            (EventTypes.CONTAINER, "start"): self.refresh_container,
+            (EventTypes.CONTAINER, "stop"): self.refresh_container,
+            (EventTypes.CONTAINER, "die"): self.refresh_container,
+            (EventTypes.CONTAINER, "pause"): self.refresh_container,
+            (EventTypes.CONTAINER, "unpause"): self.refresh_container,
+            (EventTypes.CONTAINER, "destroy"): self.remove_container,
+            (EventTypes.IMAGE, "pull"): self.add_image,
+            (EventTypes.IMAGE, "tag"): self.add_image,
+            (EventTypes.IMAGE, "untag"): self.refresh_image,
+            (EventTypes.IMAGE, "load"): self.refresh_image,
+            (EventTypes.IMAGE, "import"): self.refresh_image,
+            (EventTypes.IMAGE, "delete"): self.remove_image,
+            (EventTypes.VOLUME, "create"): self.refresh_volume,
+            (EventTypes.VOLUME, "destroy"): self.remove_volume,
+        }
+
+    @staticmethod
+    def short_id(object_id: str) -> str:
+        """
+        Shortens an ID from an event to the form used in the listings.
+
+        Args:
+            object_id (str): The full ID, optionally prefixed with 'sha256:'.
+
+        Returns:
+            str: The first 12 characters of the ID.
+        """
+        return object_id.split(COLON)[-1][:12]
+
+    def refresh_container(self, container_id: str, attributes: dict) -> None:
+        """Fetches the row of a created or changed container."""
+        container_id = self.short_id(container_id)
+        self.docker_communicator.containers().patch(
+            container_id,
+            self.docker_communicator.find_containers(container_id)
+        )
+
+    def remove_container(self, container_id: str, attributes: dict) -> None:
+        """Removes the row of a destroyed container."""
+        self.docker_communicator.containers().patch(self.short_id(container_id), [])
+
+    def add_image(self, image_id: str, attributes: dict) -> None:
+        """
+        Adds the row of a pulled or tagged image reference.
+
+        For a pull the actor of the event is the reference itself, for a tag
+        the new reference is in the 'name' attribute.
+        """
+        listing: Listing = self.docker_communicator.images()
+        reference = attributes.get("name", image_id)
+        for record in self.docker_communicator.find_images(reference):
+            rows: list[BaseRecord] = [
+                row for row in listing.by_id.get(record.id, [])
+                if row.name != NONE_VALUE and row.reference != record.reference
+            ]
+            listing.patch(record.id, rows + [record])
+
+    def refresh_image(self, image_id: str, attributes: dict) -> None:
+        """Fetches the rows of an untagged, loaded or imported image."""
+        self.docker_communicator.images().patch(
+            self.short_id(image_id),
+            self.docker_communicator.find_images_by_id(image_id)
+        )
+
+    def remove_image(self, image_id: str, attributes: dict) -> None:
+        """Removes the rows of a deleted image."""
+        self.docker_communicator.images().patch(self.short_id(image_id), [])
+
+    def refresh_volume(self, name: str, attributes: dict) -> None:
+        """Fetches the row of a created volume."""
+        self.docker_communicator.volumes().patch(name, self.docker_communicator.find_volumes(name))
+
+    def remove_volume(self, name: str, attributes: dict) -> None:
+        """Removes the row of a destroyed volume."""
+        self.docker_communicator.volumes().patch(name, [])
+
+    def apply(self, event: dict) -> None:
+        """
+        Applies one Docker event to the listings.
+
+        Args:
+            event (dict): The decoded Docker event.
+        """
+        action = event.get("Action", EMPTY_STRING).split(COLON)[0]
+        handler = self.handlers_dict.get((event.get("Type"), action))
+        if handler is None:
+            return
+        actor: dict = event.get("Actor") or {}
+        handler(actor.get("ID", EMPTY_STRING), actor.get("Attributes") or {})
+        self.changed.set()
+
+    def run(self):
+        """
+        Follows the Docker events until the stream ends.
+
+        If Docker stops or the stream fails, the thread ends and the listings
+        are invalidated by changes and expire again.
+        """
+        self.docker_communicator.follow_events(True)
+        try:
+            for event in self.docker_communicator.events():
+                try:
+                    self.apply(event)
+                except (DockerNotRunningError, DockerCommandError):
+                    continue
+        except (DockerNotRunningError, DockerCommandError, OSError, ValueError):
+            return
+        finally:
+            self.docker_communicator.follow_events(False)
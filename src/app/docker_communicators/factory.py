@@ -0,0 +1,30 @@
+"""
+This module provides a factory for the Docker communicator that is selected at startup.
+
+The communicator is chosen by the DOCKER_CMD_BACKEND environment variable:
+- cli (default): DockerCommunicator, which runs docker CLI commands.
+- engine: DockerEngineCommunicator, which talks to the Docker Engine API over DOCKER_HOST.
+  Its module, with http.client, is imported only when this backend is selected.
+"""
+import functools
+
+from .docker_comunicator import ABCDockerCommunicator, docker_communicator
+from ..utils.constants import DOCKER_CMD_BACKEND
+from ..utils.enams import Backends
+
+
+@functools.lru_cache
+def get_docker_communicator(backend: str = DOCKER_CMD_BACKEND) -> ABCDockerCommunicator:
+    """
+    Returns the shared Docker communicator for the given backend.
+
+    Args:
+        backend (str): The name of the backend (default is taken from DOCKER_CMD_BACKEND).
+
+    Returns:
+        ABCDockerCommunicator: The communicator for the backend.
+    """
+    if backend == Backends.ENGINE:
+        from .docker_engine_communicator import DockerEngineCommunicator
+        return DockerEngineCommunicator()
+    return docker_communicator
@@ -0,0 +1,225 @@
+"""
+This module provides a client-side limiter of the request rate to the Docker Hub API.
+
+Docker Hub limits the number of API requests per client and answers 429 (Too Many Requests)
+when the limit is spent. The limiter keeps a token bucket that refills at the allowed rate,
+so bursts of searching and prefetching are spread out before Docker Hub has to refuse them,
+and it follows the rate-limit headers of the responses: the remaining budget reported by
+Docker Hub caps the bucket, and a spent budget or a 429 blocks requests until the reset time.
+
+Interactive requests (what the user is waiting for) may wait a little for a token, background
+requests (prefetch and revalidation) never wait and leave a reserve of the bucket to the
+interactive ones, so they are dropped first when the budget runs low.
+
+Classes:
+- RateLimiter: A thread-safe token bucket that follows the rate-limit headers of Docker Hub.
+"""
+import http.client
+import random
+import threading
+import time
+from typing import Optional
+
+from ..exeptions.exeptions import DockerApiRateLimitError
+from ..utils.constants import (
+    HUB_RATE_LIMIT, HUB_RATE_WINDOW, HUB_BACKGROUND_RESERVE, HUB_MAX_RATE_WAIT, HUB_BACKOFF_BASE, HUB_BACKOFF_CAP,
+    RATE_LIMIT_HEADER, RATE_LIMIT_REMAINING_HEADER, RATE_LIMIT_RESET_HEADER, RETRY_AFTER_HEADER,
+    HUB_BUDGET_TEXT, HUB_RATE_LIMITED_TEXT
+)
+from ..utils.enams import RequestPriorities
+
+# a reset header below this value is a number of seconds, above it a Unix time
+MAX_RELATIVE_RESET = 10 ** 8
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket of Docker Hub requests that follows the rate-limit headers of the responses.
+
+    Attributes:
+        capacity (int): The number of requests allowed per window, and the size of the bucket.
+        window (float): The number of seconds in which the bucket refills completely.
+        reserve (float): The share of the bucket that background requests leave to interactive ones.
+        max_wait (float): The maximum number of seconds an interactive request waits for a token.
+    """
+
+    def __init__(
+            self,
+            capacity: int = HUB_RATE_LIMIT,
+            window: float = HUB_RATE_WINDOW,
+            reserve: float = HUB_BACKGROUND_RESERVE,
+            max_wait: float = HUB_MAX_RATE_WAIT
+    ):
+        """
+        Initializes a full bucket.
+
+        Args:
+            capacity (int): The number of requests allowed per window.
+            window (float): The number of seconds in which the bucket refills completely.
+            reserve (float): The share of the bucket that background requests leave to interactive ones.
+            max_wait (float): The maximum number of seconds an interactive request waits for a token.
+        """
+        self.capacity: int = max(1, capacity)
+        self.window: float = window
+        self.reserve: float = reserve
+        self.max_wait: float = max_wait
+        self.__tokens: float = float(self.capacity)
+        self.__updated_at: float = time.monotonic()
+        self.__blocked_until: float = 0.0
+        self.__limit: Optional[int] = None
+        self.__remaining: Optional[int] = None
+        self.__interactive_waiting: int = 0
+        self.__condition = threading.Condition()
+
+    def __refill(self, now: float) -> None:
+        """Adds the tokens earned since the last update, up to the capacity."""
+        rate = self.capacity / self.window
+        self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated_at) * rate)
+        self.__updated_at = now
+
+    def __wait_time(self, priority: RequestPriorities, now: float) -> float:
+        """
+        Returns the number of seconds until a request of a priority may take a token.
+
+        Args:
+            priority (RequestPriorities): The priority of the request.
+            now (float): The current monotonic time.
+
+        Returns:
+            float: 0 if a token can be taken now.
+        """
+        if self.__blocked_until > now:
+            return self.__blocked_until - now
+        needed = 1.0
+        if priority is RequestPriorities.BACKGROUND:
+            if self.__interactive_waiting:
+                return self.window / self.capacity
+            needed += self.capacity * self.reserve
+        return max(0.0, (needed - self.__tokens) * self.window / self.capacity)
+
+    def acquire(self, priority: RequestPriorities = RequestPriorities.INTERACTIVE) -> None:
+        """
+        Takes a token for a request, waiting at most `max_wait` for it if the request is interactive.
+
+        Args:
+            priority (RequestPriorities): The priority of the request.
+
+        Raises:
+            DockerApiRateLimitError: If no token is available in time.
+        """
+        interactive = priority is RequestPriorities.INTERACTIVE
+        with self.__condition:
+            if interactive:
+                self.__interactive_waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self.__refill(now)
+                    wait = self.__wait_time(priority, now)
+                    if wait <= 0:
+                        self.__tokens -= 1
+                        return
+                    if not interactive or wait > self.max_wait:
+                        raise DockerApiRateLimitError(wait)
+                    self.__condition.wait(wait)
+            finally:
+                if interactive:
+                    self.__interactive_waiting -= 1
+                    self.__condition.notify_all()
+
+    @staticmethod
+    def __header_number(headers: http.client.HTTPMessage, name: str) -> Optional[float]:
+        """
+        Reads a number from a header, ignoring a ';'-separated suffix such as '180;w=60'.
+
+        Args:
+            headers (http.client.HTTPMessage): The headers of a response.
+            name (str): The name of the header.
+
+        Returns:
+            Optional[float]: The number, or None if the header is missing or not a number.
+        """
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return float(value.split(";")[0])
+        except ValueError:
+            return None
+
+    def __seconds_to_reset(self, headers: http.client.HTTPMessage) -> Optional[float]:
+        """Returns the number of seconds until the budget is reset, from the reset header."""
+        reset = self.__header_number(headers, RATE_LIMIT_RESET_HEADER)
+        if reset is None:
+            return None
+        if reset > MAX_RELATIVE_RESET:
+            reset -= time.time()
+        return max(0.0, reset)
+
+    def update(self, headers: http.client.HTTPMessage) -> None:
+        """
+        Follows the rate-limit headers of a response: the remaining budget caps the bucket,
+        and a spent budget blocks requests until it is reset.
+
+        Args:
+            headers (http.client.HTTPMessage): The headers of a response of Docker Hub.
+        """
+        limit = self.__header_number(headers, RATE_LIMIT_HEADER)
+        remaining = self.__header_number(headers, RATE_LIMIT_REMAINING_HEADER)
+        if remaining is None:
+            return
+        with self.__condition:
+            now = time.monotonic()
+            self.__refill(now)
+            self.__remaining = int(remaining)
+            self.__limit = None if limit is None else int(limit)
+            self.__tokens = min(self.__tokens, remaining)
+            if remaining < 1:
+                reset = self.__seconds_to_reset(headers)
+                if reset is not None:
+                    self.__blocked_until = max(self.__blocked_until, now + reset)
+
+    def throttle(self, headers: http.client.HTTPMessage, attempt: int) -> float:
+        """
+        Blocks requests after a 429 or 503 response: for the time Docker Hub asks for, or
+        else for a jittered exponential backoff of the attempt.
+
+        Args:
+            headers (http.client.HTTPMessage): The headers of the refused response.
+            attempt (int): The number of the refused attempt of the request, starting at 0.
+
+        Returns:
+            float: The number of seconds requests are blocked for.
+        """
+        delay = self.__header_number(headers, RETRY_AFTER_HEADER)
+        if delay is None:
+            delay = self.__seconds_to_reset(headers)
+        if delay is None:
+            backoff = min(HUB_BACKOFF_CAP, HUB_BACKOFF_BASE * 2 ** attempt)
+            # the jitter spreads out the retries of requests that were refused together
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+        with self.__condition:
+            self.__blocked_until = max(self.__blocked_until, time.monotonic() + delay)
+            self.__condition.notify_all()
+        return delay
+
+    def retry_in(self) -> float:
+        """Returns the number of seconds until an interactive request may be sent, 0 if it may be sent now."""
+        with self.__condition:
+            now = time.monotonic()
+            self.__refill(now)
+            return self.__wait_time(RequestPriorities.INTERACTIVE, now)
+
+    def get_budget_text(self) -> str:
+        """
+        Returns the remaining budget for the footer: the one reported by Docker Hub if it was,
+        the budget of the bucket otherwise, or the time until requests are allowed again.
+        """
+        retry_in = self.retry_in()
+        if retry_in > 0:
+            return HUB_RATE_LIMITED_TEXT.format(seconds=int(retry_in) + 1)
+        with self.__condition:
+            if self.__remaining is not None:
+                remaining = min(self.__remaining, int(self.__tokens))
+                return HUB_BUDGET_TEXT.format(remaining=remaining, limit=self.__limit or self.capacity)
+            return HUB_BUDGET_TEXT.format(remaining=int(self.__tokens), limit=self.capacity)
@@ -0,0 +1,94 @@
+"""
+This module provides a VolumeHelper class that runs operations on Docker volumes
+in one long-lived helper container.
+
+All volumes of a multi-volume operation are mounted into the same helper container,
+which is started once, and every operation runs in it with 'docker exec', so the
+operations can run concurrently without paying the container start cost for every volume.
+
+Usage:
+    with VolumeHelper(docker_communicator, ["data", "logs"]) as helper:
+        helper.tar_volume("data", output)
+"""
+from typing import BinaryIO, Optional, TYPE_CHECKING
+
+from ..utils.constants import HELPER_MOUNT_PATH, COLON, SLASH
+
+if TYPE_CHECKING:
+    from .docker_comunicator import ABCDockerCommunicator
+
+
+class VolumeHelper:
+    """
+    A helper container with Docker volumes mounted, torn down when the context exits.
+
+    Attributes:
+        docker_communicator (ABCDockerCommunicator): The communicator that runs the container.
+        names (list[str]): The names of the mounted volumes.
+        container_id (Optional[str]): The ID of the running helper container.
+    """
+
+    def __init__(self, docker_communicator: "ABCDockerCommunicator", names: list[str]):
+        """
+        Initializes the helper for the given volumes.
+
+        Args:
+            docker_communicator (ABCDockerCommunicator): The communicator that runs the container.
+            names (list[str]): The names of the volumes to mount.
+        """
+        self.docker_communicator: "ABCDockerCommunicator" = docker_communicator
+        self.names: list[str] = list(dict.fromkeys(names))
+        self.container_id: Optional[str] = None
+
+    @staticmethod
+    def mount_path(name: str) -> str:
+        """
+        Returns the path a volume is mounted at in the helper container.
+
+        Args:
+            name (str): The name of the volume.
+
+        Returns:
+            str: The mount path, for example '/volumes/data'.
+        """
+        return HELPER_MOUNT_PATH + SLASH + name
+
+    def __enter__(self) -> "VolumeHelper":
+        """Starts the helper container with all volumes mounted."""
+        self.container_id = self.docker_communicator.start_helper(
+            [name + COLON + self.mount_path(name) for name in self.names]
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Removes the helper container."""
+        if self.container_id:
+            self.docker_communicator.delete_container(self.container_id)
+            self.container_id = None
+
+    def tar_volume(self, name: str, output: BinaryIO) -> None:
+        """
+        Streams a tar archive of the content of a mounted volume.
+
+        Args:
+            name (str): The name of the volume.
+            output (BinaryIO): The stream to write the archive to.
+        """
+        self.docker_communicator.exec_in_container(
+            self.container_id,
+            ["tar", "cf", "-", "-C", self.mount_path(name), "."],
+            output
+        )
+
+    def copy_volume(self, old_name: str, new_name: str) -> None:
+        """
+        Copies the content of a mounted volume into another mounted volume.
+
+        Args:
+            old_name (str): The name of the source volume.
+            new_name (str): The name of the destination volume.
+        """
+        self.docker_communicator.exec_in_container(
+            self.container_id,
+            ["cp", "-a", self.mount_path(old_name) + SLASH + ".", self.mount_path(new_name) + SLASH]
+        )
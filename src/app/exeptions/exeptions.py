@@ -12,3 +12,25 @@ class DockerNotRunningError(Exception):
 class DockerApiError(Exception):
     """Custom exception class to indicate that DockerApi is not allowed."""
     pass
+
+
+class DockerCommandError(Exception):
+    """Custom exception class to indicate that a Docker command has failed."""
+    pass
+
+
+class DockerNotFoundError(DockerCommandError):
+    """Custom exception class to indicate that a Docker object does not exist."""
+    pass
+
+
+class DockerApiRateLimitError(DockerApiError):
+    """Custom exception class to indicate that the Docker Hub request budget is spent for a while."""
+
+    def __init__(self, retry_after: float):
+        """
+        Args:
+            retry_after (float): The number of seconds after which requests can be sent again.
+        """
+        super().__init__(f"rate limited for {retry_after:.1f}s")
+        self.retry_after: float = retry_after
@@ -0,0 +1,214 @@
+"""
+This module provides the cache of the data fetched from Docker.
+
+Every entry belongs to a kind of Docker data (see `CacheResources`), so a change of one kind
+of objects invalidates only the entries of that kind. The cache holds at most CACHE_MAX_SIZE
+entries, evicting the least recently used ones, and every entry expires CACHE_TTL seconds after
+it was fetched, so data that is not kept up to date by the Docker events is fetched again.
+
+The kinds of data that are kept up to date by the Docker events while the events listener
+runs are live: their entries neither expire nor are invalidated by changes, because the
+events patch them; only a full clear drops them.
+
+Classes:
+- CacheStats: The hit and miss counters of one kind of Docker data.
+- TTLCache: A thread-safe LRU cache with expiring entries and per-resource invalidation.
+
+Functions:
+- invalidates: A decorator for communicator methods that change Docker objects.
+"""
+import collections
+import functools
+import threading
+import time
+from typing import Callable, Hashable, Optional, TypeVar
+
+from ..utils.constants import CACHE_TTL, CACHE_MAX_SIZE, SLASH, SPACE
+from ..utils.enams import CacheResources
+
+T = TypeVar("T")
+
+
+class CacheStats:
+    """
+    The counters of the cache for one kind of Docker data.
+
+    Attributes:
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that fetched the data from Docker.
+    """
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        """Initializes the counters at zero."""
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __str__(self) -> str:
+        """Returns the counters, for example '12/3' for 12 hits and 3 misses."""
+        return f"{self.hits}{SLASH}{self.misses}"
+
+
+class TTLCache:
+    """
+    A thread-safe LRU cache whose entries expire and are invalidated per kind of Docker data.
+
+    The data of a missing entry is fetched outside the lock, so a slow Docker command does not
+    block lookups of other entries. Concurrent lookups of the same missing entry wait for the
+    one fetch in progress instead of running the command again. Errors are not cached.
+
+    Attributes:
+        max_size (int): The maximum number of entries.
+        ttl (float): The number of seconds an entry is valid for.
+    """
+
+    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: float = CACHE_TTL):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int): The maximum number of entries.
+            ttl (float): The number of seconds an entry is valid for.
+        """
+        self.max_size: int = max(1, max_size)
+        self.ttl: float = ttl
+        self.__entries: collections.OrderedDict[tuple[CacheResources, Hashable], tuple[float, object]] = (
+            collections.OrderedDict()
+        )
+        self.__fetching: dict[tuple[CacheResources, Hashable], threading.Event] = {}
+        self.__stats: dict[CacheResources, CacheStats] = {resource: CacheStats() for resource in CacheResources}
+        self.__live: frozenset[CacheResources] = frozenset()
+        self.__lock = threading.Lock()
+
+    def set_live(self, *resources: CacheResources) -> None:
+        """
+        Sets the kinds of data that are kept up to date by other means, such as the Docker events,
+        replacing the kinds set before. Their entries do not expire and are not dropped by
+        `invalidate` with kinds given.
+
+        Args:
+            *resources (CacheResources): The live kinds of data, none to make all kinds expire again.
+        """
+        with self.__lock:
+            self.__live = frozenset(resources)
+
+    def __is_valid(self, entry_key: tuple[CacheResources, Hashable]) -> bool:
+        """Checks whether an entry is cached and is live or has not expired; called under the lock."""
+        entry = self.__entries.get(entry_key)
+        return entry is not None and (entry_key[0] in self.__live or entry[0] > time.monotonic())
+
+    def get(self, resource: CacheResources, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Returns the cached data for the key, fetching it with the function if it is missing or expired.
+
+        Args:
+            resource (CacheResources): The kind of the data.
+            key (Hashable): The key of the data within its kind, for example the command that fetches it.
+            func (Callable[[], T]): Fetches the data.
+
+        Returns:
+            T: The cached or the freshly fetched data.
+        """
+        entry_key = (resource, key)
+        with self.__lock:
+            if self.__is_valid(entry_key):
+                self.__entries.move_to_end(entry_key)
+                self.__stats[resource].hits += 1
+                return self.__entries[entry_key][1]
+            fetching: Optional[threading.Event] = self.__fetching.get(entry_key)
+            if fetching is None:
+                self.__fetching[entry_key] = threading.Event()
+                self.__stats[resource].misses += 1
+        if fetching is not None:
+            # another thread is fetching the same data, e.g. a background prefetch
+            fetching.wait()
+            return self.get(resource, key, func)
+        try:
+            value = func()
+            self.put(resource, key, value)
+        finally:
+            with self.__lock:
+                self.__fetching.pop(entry_key).set()
+        return value
+
+    def put(self, resource: CacheResources, key: Hashable, value: object) -> None:
+        """
+        Stores data fetched by other means, for example one of the results of a batched command.
+
+        Args:
+            resource (CacheResources): The kind of the data.
+            key (Hashable): The key of the data within its kind, the same one `get` is called with.
+            value (object): The data.
+        """
+        entry_key = (resource, key)
+        with self.__lock:
+            self.__entries[entry_key] = (time.monotonic() + self.ttl, value)
+            self.__entries.move_to_end(entry_key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def __contains__(self, entry_key: tuple[CacheResources, Hashable]) -> bool:
+        """
+        Checks whether valid data is cached, without counting a hit or a miss.
+
+        Args:
+            entry_key (tuple[CacheResources, Hashable]): The kind and the key of the data.
+
+        Returns:
+            bool: Whether the data is cached and is live or has not expired.
+        """
+        with self.__lock:
+            return self.__is_valid(entry_key)
+
+    def invalidate(self, *resources: CacheResources) -> None:
+        """
+        Drops the entries of the given kinds of data, except the live ones, or all entries if no kind is given.
+
+        Args:
+            *resources (CacheResources): The kinds of data to drop.
+        """
+        with self.__lock:
+            if not resources:
+                self.__entries.clear()
+                return
+            dropped = set(resources) - self.__live
+            for entry_key in [entry_key for entry_key in self.__entries if entry_key[0] in dropped]:
+                del self.__entries[entry_key]
+
+    def __len__(self) -> int:
+        """Returns the number of entries, including expired ones that were not fetched again yet."""
+        return len(self.__entries)
+
+    @property
+    def stats(self) -> dict[CacheResources, CacheStats]:
+        """The hit and miss counters of every kind of data."""
+        return self.__stats
+
+    def __str__(self) -> str:
+        """Returns the counters of every kind of data, for example 'images 12/3   containers 8/2 ...'."""
+        return (SPACE * 3).join(f"{resource.value} {stats}" for resource, stats in self.__stats.items())
+
+
+def invalidates(*resources: CacheResources) -> Callable:
+    """
+    Makes a communicator method invalidate the cached data of the given kinds after it has run.
+
+    The data is invalidated even if the method fails, because a failed operation on several
+    objects may still have changed some of them. Listings that are kept up to date by the
+    Docker events are not invalidated (see `TTLCache.set_live`).
+
+    Args:
+        *resources (CacheResources): The kinds of data the method changes.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.cache_clear(*resources)
+        return wrapper
+    return decorator
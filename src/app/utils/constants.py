@@ -4,8 +4,38 @@ Module: constants
 This module provides constants related to Docker commands and key codes.
 """
 import curses
+import os
+import warnings
+from typing import Callable, TypeVar
+
+from ..utils.enams import Steps, Backends, Compressions
+
+T = TypeVar("T")
+
+
+def env_value(name: str, default: T, parse: Callable[[str], T]) -> T:
+    """
+    Reads a setting from an environment variable.
+
+    A mistyped value must not keep the application from starting, so it is ignored with a warning.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (T): The value if the variable is not set or not valid.
+        parse (Callable[[str], T]): Converts the text of the variable, raising ValueError if it is not valid.
+
+    Returns:
+        T: The value of the setting.
+    """
+    text = os.environ.get(name)
+    if text is None:
+        return default
+    try:
+        return parse(text)
+    except ValueError:
+        warnings.warn(f"{name}={text!r} is not valid, using {getattr(default, 'value', default)}", stacklevel=2)
+        return default
 
-from ..utils.enams import Steps
 
 KEY_EXIT = ord('q')
 KEY_ESC = 27
@@ -15,12 +45,81 @@ KEY_SPASE = ord(" ")
 KEY_DELETE = ord("d")
 KEY_HELP = ord("h")
 KEY_SAVE = ord("s")
+KEY_SAVE_BUNDLE = ord("b")
+KEY_JOBS = ord("j")
 KEY_INSPECT = ord("i")
 KEY_RENAME = ord("n")
 KEY_PULL = ord('p')
 KEY_LATEST = ord('l')
+KEY_MARK = ord('m')
+KEY_FILTER = ord('/')
+KEY_SORT = ord('\t')
+
+DOCKER_CMD_BACKEND = os.environ.get("DOCKER_CMD_BACKEND", Backends.CLI.value)
+DOCKER_HOST = os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock")
+UNIX_SCHEME = "unix"
+HELPER_IMAGE = os.environ.get("DOCKER_CMD_HELPER_IMAGE", "alpine")
+HELPER_MOUNT_PATH = "/volumes"
+STREAM_HEADER_SIZE = 8
+STDERR_STREAM = 2
+NONE_VALUE = "<none>"
+CHUNK_SIZE = 64 * 1024
+COMPRESSION = env_value("DOCKER_CMD_COMPRESSION", Compressions.GZIP, Compressions)
+GZIP_LEVEL = 6
+GZIP_BLOCK_SIZE = 128 * 1024
+GZIP_WINDOW_SIZE = 32 * 1024
+COMPRESSION_THREADS = env_value("DOCKER_CMD_COMPRESSION_THREADS", os.cpu_count() or 1, int)
+MIN_ELAPSED_TIME = 1e-6
+MAX_WORKERS = env_value("DOCKER_CMD_MAX_WORKERS", 8, int)
+PROGRESS_INTERVAL = 0.1
+MAX_JOBS = env_value("DOCKER_CMD_MAX_JOBS", 2, int)
+MAX_PULLS = env_value("DOCKER_CMD_MAX_PULLS", 3, int)
+JOBS_HISTORY = 20
+JOBS_PANEL_HEIGHT = 10
+MAX_BATCH_COMMAND_LENGTH = 8000
+CACHE_TTL = env_value("DOCKER_CMD_CACHE_TTL", 300.0, float)
+CACHE_MAX_SIZE = env_value("DOCKER_CMD_CACHE_SIZE", 256, int)
+CACHE_DIRECTORY = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+IMAGE_STORE_PATH = os.environ.get(
+    "DOCKER_CMD_IMAGE_STORE",
+    os.path.join(CACHE_DIRECTORY, "docker_cmd", "images.sqlite3")
+)
+SQLITE_TIMEOUT = 1.0
+HTTPS_SCHEME = "https"
+GZIP_ENCODING = "gzip"
+HUB_TIMEOUT = env_value("DOCKER_CMD_HUB_TIMEOUT", 10.0, float)
+HUB_MAX_IDLE_CONNECTIONS = 4
+HUB_IDLE_TIMEOUT = 30.0
+HUB_CACHE_PATH = os.environ.get(
+    "DOCKER_CMD_HUB_CACHE",
+    os.path.join(CACHE_DIRECTORY, "docker_cmd", "hub.sqlite3")
+)
+HUB_CACHE_TTL = env_value("DOCKER_CMD_HUB_CACHE_TTL", 600.0, float)
+HUB_CACHE_SIZE = 1000
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+IF_MODIFIED_SINCE_HEADER = "If-Modified-Since"
+RATE_LIMIT_HEADER = "X-RateLimit-Limit"
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RATE_LIMIT_RESET_HEADER = "X-RateLimit-Reset"
+RETRY_AFTER_HEADER = "Retry-After"
+HUB_RATE_LIMIT = env_value("DOCKER_CMD_HUB_RATE_LIMIT", 180, int)
+HUB_RATE_WINDOW = 60.0
+HUB_BACKGROUND_RESERVE = 0.25
+HUB_MAX_RATE_WAIT = 2.0
+HUB_MAX_RETRIES = 3
+HUB_BACKOFF_BASE = 0.5
+HUB_BACKOFF_CAP = 8.0
+SEARCH_DEBOUNCE = env_value("DOCKER_CMD_SEARCH_DEBOUNCE", 0.25, float)
+SEARCH_TRIE_SIZE = 64
+PAGE_CACHE_SIZE = 50
+TAG_INDEX_WORKERS = env_value("DOCKER_CMD_TAG_INDEX_WORKERS", 4, int)
 
 INVISIBLE = 0
+BLOCKING = -1
+REDRAW_TIMEOUT = 500
+LOADING_REDRAW_TIMEOUT = 50
 START_PAGE_NUMBER = 1
 PAGE_SIZE = 100
 NO_PAGES = "0/0"
@@ -31,6 +130,24 @@ DOCKER_NOT_INSTALL_TEXT = (
 INTERNET_TROUBLE_TEXT = "Sorry internet connection closed..."
 DOCKER_API_TROUBLE_TEXT = "Sorry somthing wrong with Docker Api..."
 MAKE_FULL_SCREEN_TEXT = "make the terminal full screen, please"
+DOCKER_COMMAND_TROUBLE_TEXT = "Sorry docker command failed...\n"
+DOCKER_NOT_RUNNING_ITEM_TEXT = "Docker is not running"
+DELETING_TEXT = "Deleting"
+SAVING_TEXT = "Saving"
+RATE_SUFFIX = "/s"
+BUNDLE_NAME = "bundle"
+BUNDLE_ID_LENGTH = 12
+OK_TEXT = "OK"
+SUCCEEDED_TEXT = "succeeded"
+RENAMING_TEXT = "Renaming"
+PULLING_TEXT = "Pulling"
+LAYERS_TEXT = "layers"
+ETA_TEXT = "ETA"
+JOBS_TEXT = "Jobs"
+JOBS_HINT_TEXT = "(j - show or hide the jobs)"
+FAILED_TEXT = "FAILED"
+CACHE_TEXT = "Cache"
+ARCHIVE_IN_USE_TEXT = "{file_name} is already being saved by another job"
 ICON = """
                     ##        .
               ## ## ##       ==
@@ -52,13 +169,25 @@ r            -- refresh
 q, ESC       -- exit
 h            -- message with all available commands
 s            -- save 
+b            -- save the selected images into one bundle with a manifest
+j            -- show or hide the details of the background jobs
 i            -- inspect information of the selected image or container
 n            -- rename the selected object
 p            -- go to pull mode
 l            -- pull the latest selected image
+m            -- in pull mode mark the chosen tag, ENTER pulls all marked tags
 SPACE        -- in pull mode get information about image or tag
+/            -- in pull mode filter all tags of the image by the typed text, ESC ends the filter
+TAB          -- in the tag filter sort the tags by relevance, last update or size
 """
 START_TYPE_NAME = "Start Type New Name..."
+LOADING_TEXT = "(loading...)"
+HUB_BUDGET_TEXT = "Hub {remaining}/{limit}"
+HUB_RATE_LIMITED_TEXT = "Hub limit, retry in {seconds}s"
+FOOTER_SEPARATOR = "   "
+INDEXING_TEXT = "(indexing {loaded}/{total} pages)"
+MATCHES_TEXT = "{count} tags"
+SORT_TEXT = "sort: {order}"
 
 PLUS = "+"
 DASH = "-"
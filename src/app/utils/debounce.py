@@ -0,0 +1,149 @@
+"""
+This module provides a debounced fetcher that runs slow requests on a worker thread.
+
+It is used by the search viewers, so typing is never blocked by a request to Docker Hub:
+every key press only records the newest request, the worker waits until no new request
+has come for the debounce window and then fetches the newest one. A response that arrives
+after a newer request was made is outdated and is discarded.
+
+Classes:
+- DebouncedFetcher: Fetches the newest of a stream of requests on a worker thread.
+"""
+import threading
+import time
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from ..utils.constants import SEARCH_DEBOUNCE
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class DebouncedFetcher(Generic[K, T]):
+    """
+    Fetches the newest of a stream of requests on a worker thread.
+
+    Every request gets a generation number. A request replaces the one that is waiting, and the
+    result of a fetch is kept only if no request was made while it ran, so the owner only ever
+    sees the response to its latest request. An error of the fetch is kept in the same way and
+    raised to the owner by `take`.
+
+    Attributes:
+        delay (float): The debounce window in seconds.
+    """
+
+    def __init__(self, fetch: Callable[[K], T], delay: float = SEARCH_DEBOUNCE):
+        """
+        Initializes the fetcher; the worker thread is started by the first request.
+
+        Args:
+            fetch (Callable[[K], T]): Fetches the response to a request, called on the worker thread.
+            delay (float): The debounce window in seconds.
+        """
+        self.delay: float = delay
+        self.__fetch: Callable[[K], T] = fetch
+        self.__generation: int = 0
+        self.__pending: Optional[tuple[int, K, float]] = None
+        self.__fetching: Optional[int] = None
+        self.__result: Optional[tuple[K, T]] = None
+        self.__error: Optional[BaseException] = None
+        self.__closed: bool = False
+        self.__worker: Optional[threading.Thread] = None
+        self.__condition = threading.Condition()
+
+    def request(self, key: K, immediate: bool = False) -> None:
+        """
+        Requests a fetch, replacing the request that is waiting and outdating the one in flight.
+
+        Args:
+            key (K): The request, for example the search text and the page.
+            immediate (bool): Whether to fetch without waiting for the debounce window,
+                              for requests that are not made while typing.
+        """
+        with self.__condition:
+            self.__generation += 1
+            ready_at = time.monotonic() + (0 if immediate else self.delay)
+            self.__pending = (self.__generation, key, ready_at)
+            self.__result = None
+            self.__error = None
+            if self.__worker is None:
+                self.__worker = threading.Thread(target=self.__run, daemon=True, name="debounced-fetch")
+                self.__worker.start()
+            self.__condition.notify()
+
+    def cancel(self) -> None:
+        """Drops the request that is waiting and outdates the one in flight, for example when its answer is known."""
+        with self.__condition:
+            self.__generation += 1
+            self.__pending = None
+            self.__result = None
+            self.__error = None
+
+    @property
+    def loading(self) -> bool:
+        """Whether the latest request is waiting or being fetched."""
+        with self.__condition:
+            return self.__pending is not None or self.__fetching == self.__generation
+
+    def take(self) -> Optional[tuple[K, T]]:
+        """
+        Takes the response to the latest request, if it has arrived.
+
+        Returns:
+            Optional[tuple[K, T]]: The request and its response, or None if there is none yet.
+
+        Raises:
+            Exception: The error of the fetch of the latest request.
+        """
+        with self.__condition:
+            result, error = self.__result, self.__error
+            self.__result = None
+            self.__error = None
+        if error is not None:
+            raise error
+        return result
+
+    def close(self) -> None:
+        """Stops the worker thread; a fetch in flight is finished and discarded."""
+        with self.__condition:
+            self.__closed = True
+            self.__pending = None
+            self.__condition.notify()
+
+    def __next_request(self) -> Optional[tuple[int, K]]:
+        """
+        Waits until the pending request is out of its debounce window.
+
+        Returns:
+            Optional[tuple[int, K]]: The generation and the request, or None if the fetcher is closed.
+        """
+        with self.__condition:
+            while not self.__closed:
+                if self.__pending is None:
+                    self.__condition.wait()
+                    continue
+                generation, key, ready_at = self.__pending
+                remaining = ready_at - time.monotonic()
+                if remaining > 0:
+                    # a newer request restarts the wait
+                    self.__condition.wait(remaining)
+                    continue
+                self.__pending = None
+                self.__fetching = generation
+                return generation, key
+            return None
+
+    def __run(self) -> None:
+        """Fetches the pending requests one after another until the fetcher is closed."""
+        while (request := self.__next_request()) is not None:
+            generation, key = request
+            result: Optional[tuple[K, T]] = None
+            error: Optional[BaseException] = None
+            try:
+                result = (key, self.__fetch(key))
+            except Exception as exception:
+                error = exception
+            with self.__condition:
+                self.__fetching = None
+                if generation == self.__generation:
+                    self.__result, self.__error = result, error
@@ -20,26 +20,25 @@ class MenuChoice(int, Enum):
     VOLUMES = 2
 
 
-class IdIndexes(int, Enum):
-    """An enumeration of ID indexes with corresponding integer values."""
-    IMAGE_ID_INDEX = 2
-    CONTAINER_ID_INDEX = 0
-    VOLUME_ID_INDEX = -1
-
-
-class NameIndexes(int, Enum):
-    """An enumeration of Name indexes with corresponding integer values."""
-    IMAGE_NAME_INDEX = 0
-    CONTAINER_NAME_INDEX = -1
-    VOLUME_NAME_INDEX = -1
-
-
 class Steps(int, Enum):
     """An enumeration of Steps with corresponding integer values."""
     STEP_UP = -1
     STEP_DOWN = 1
 
 
+class RequestPriorities(int, Enum):
+    """An enumeration of the priorities of Docker Hub requests; a lower value goes first."""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class TagSortOrders(str, Enum):
+    """An enumeration of the orders of the filtered tags, with the names shown in the footer."""
+    RELEVANCE = "relevance"
+    LAST_UPDATED = "last_updated"
+    FULL_SIZE = "full_size"
+
+
 class MenuChoiceNames(str, Enum):
     """An enumeration of menu choices with corresponding string values."""
     IMAGES = "Images"
@@ -65,6 +64,9 @@ class Extensions(str, Enum):
     """
     TAR_EXTENSION = ".tar"
     JSON_EXTENSION = ".json"
+    GZIP_EXTENSION = ".gz"
+    XZ_EXTENSION = ".xz"
+    SHA256_EXTENSION = ".sha256"
 
 
 class DockerApiEndpoints(str, Enum):
@@ -80,3 +82,66 @@ class QueryParams(str, Enum):
     PAGE_SIZE = "page_size"
 
 
+class Compressions(str, Enum):
+    """Enumeration of the compressions of saved and exported archives."""
+    NONE = "none"
+    GZIP = "gzip"
+    XZ = "xz"
+
+
+class JobStates(str, Enum):
+    """Enumeration of the states of background jobs."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class CacheResources(str, Enum):
+    """Enumeration of the kinds of Docker data that are cached and invalidated separately."""
+    IMAGES = "images"
+    CONTAINERS = "containers"
+    VOLUMES = "volumes"
+    INSPECT = "inspect"
+    VERSION = "version"
+
+
+class Backends(str, Enum):
+    """Enumeration of the ways to communicate with Docker."""
+    CLI = "cli"
+    ENGINE = "engine"
+
+
+class EventTypes(str, Enum):
+    """Enumeration of the object types of Docker events."""
+    CONTAINER = "container"
+    IMAGE = "image"
+    VOLUME = "volume"
+
+
+class DockerEngineEndpoints(str, Enum):
+    """Enumeration of Docker Engine API endpoints."""
+    VERSION = "/version"
+    EVENTS = "/events"
+    IMAGES = "/images/json"
+    IMAGE_INSPECT = "/images/{id}/json"
+    IMAGE_DELETE = "/images/{id}"
+    IMAGE_TAG = "/images/{id}/tag"
+    IMAGE_SAVE = "/images/{id}/get"
+    IMAGES_SAVE = "/images/get"
+    IMAGE_CREATE = "/images/create"
+    CONTAINERS = "/containers/json"
+    CONTAINER_INSPECT = "/containers/{id}/json"
+    CONTAINER_DELETE = "/containers/{id}"
+    CONTAINER_STOP = "/containers/{id}/stop"
+    CONTAINER_START = "/containers/{id}/start"
+    CONTAINER_WAIT = "/containers/{id}/wait"
+    CONTAINER_RENAME = "/containers/{id}/rename"
+    CONTAINER_EXPORT = "/containers/{id}/export"
+    CONTAINER_EXEC = "/containers/{id}/exec"
+    EXEC_START = "/exec/{id}/start"
+    EXEC_INSPECT = "/exec/{id}/json"
+    CONTAINER_CREATE = "/containers/create"
+    VOLUMES = "/volumes"
+    VOLUME_DELETE = "/volumes/{id}"
+    VOLUME_CREATE = "/volumes/create"
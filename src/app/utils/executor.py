@@ -0,0 +1,115 @@
+"""
+This module provides a bounded-concurrency executor for operations on many Docker objects.
+
+Classes:
+- BulkResult: The outcome of the operation on one Docker object.
+- BulkExecutor: Runs an operation on many Docker objects on a pool of worker threads.
+"""
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Callable, Optional
+
+from ..exeptions.exeptions import DockerCommandError, DockerNotRunningError
+from ..utils.constants import MAX_WORKERS, PROGRESS_INTERVAL, OK_TEXT, FAILED_TEXT, SPACE, COLON, DOCKER_NOT_RUNNING_ITEM_TEXT
+
+
+class BulkResult:
+    """
+    The outcome of an operation on one Docker object.
+
+    Attributes:
+        name (str): The name of the Docker object.
+        error (Optional[str]): The error message, or None if the operation succeeded.
+    """
+    __slots__ = ("name", "error")
+
+    def __init__(self, name: str, error: Optional[str] = None):
+        """
+        Initializes the result of the operation on a Docker object.
+
+        Args:
+            name (str): The name of the Docker object.
+            error (Optional[str]): The error message, or None if the operation succeeded.
+        """
+        self.name: str = name
+        self.error: Optional[str] = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+    def __str__(self) -> str:
+        """Returns the line of the result for the report, for example 'FAILED web: No such container'."""
+        if self.ok:
+            return OK_TEXT + SPACE + self.name
+        return FAILED_TEXT + SPACE + self.name + COLON + SPACE + self.error
+
+
+class BulkExecutor:
+    """
+    Runs an operation on many Docker objects concurrently.
+
+    At most `max_workers` operations run at the same time, and a failure of one
+    operation does not stop the others.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        """
+        Initializes the executor with a limit of parallel operations.
+
+        Args:
+            max_workers (int): The maximum number of operations running at the same time.
+        """
+        self.max_workers: int = max(1, max_workers)
+
+    @staticmethod
+    def __result(name: str, future: Future) -> BulkResult:
+        """
+        Converts a finished future into the result of the operation.
+
+        Args:
+            name (str): The name of the Docker object.
+            future (Future): The finished future of the operation.
+
+        Returns:
+            BulkResult: The result of the operation.
+        """
+        try:
+            future.result()
+        except DockerCommandError as error:
+            return BulkResult(name, str(error))
+        except DockerNotRunningError:
+            return BulkResult(name, DOCKER_NOT_RUNNING_ITEM_TEXT)
+        except OSError as error:
+            return BulkResult(name, str(error))
+        return BulkResult(name)
+
+    def run(
+            self,
+            func: Callable,
+            items: list[tuple[str, tuple]],
+            on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> list[BulkResult]:
+        """
+        Runs the operation for every item and waits for all of them.
+
+        Args:
+            func (Callable): The operation, called with the arguments of an item.
+            items (list[tuple[str, tuple]]): The name of every Docker object with the arguments of the operation.
+            on_progress (Optional[Callable[[int, int], None]]): Called in the calling thread with the number
+                                                               of finished and all operations while waiting.
+
+        Returns:
+            list[BulkResult]: The results in the order of the items.
+        """
+        results: dict[Future, BulkResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures: dict[Future, str] = {pool.submit(func, *args): name for name, args in items}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[future] = self.__result(futures[future], future)
+                if on_progress:
+                    on_progress(len(results), len(futures))
+        return [results[future] for future in futures]
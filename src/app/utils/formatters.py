@@ -0,0 +1,167 @@
+"""
+This module provides functions for formatting Docker objects the same way the docker CLI does.
+
+It includes:
+- human_size: Formats a size in bytes as a human-readable string.
+- parse_size: Parses a human-readable size back into bytes.
+- human_duration: Formats a number of seconds as a human-readable duration.
+- time_ago: Formats a creation timestamp as a human-readable age.
+- parse_created_at: Parses the creation time printed by the docker CLI into a timestamp.
+- parse_timestamp: Parses an RFC 3339 time of the inspect information into a timestamp.
+- format_table: Aligns rows of columns into the lines of a text table.
+"""
+import re
+import time
+from datetime import datetime
+from typing import Optional
+
+from ..utils.constants import EMPTY_STRING
+
+SIZE_UNITS: tuple[str, ...] = ("B", "kB", "MB", "GB", "TB", "PB")
+CREATED_AT_FORMAT = "%Y-%m-%d %H:%M:%S %z"
+SIZE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(" + "|".join(SIZE_UNITS) + ")")
+COLUMN_PADDING = 3
+# datetime parses at most microseconds, Docker prints nanoseconds
+NANOSECONDS_PATTERN = re.compile(r"(\.\d{6})\d+")
+
+
+def human_size(size: float) -> str:
+    """
+    Formats a size in bytes as a human-readable string using decimal units.
+
+    Args:
+        size (float): The size in bytes.
+
+    Returns:
+        str: The formatted size, for example "187MB".
+    """
+    unit_index = 0
+    while size >= 1000 and unit_index < len(SIZE_UNITS) - 1:
+        size /= 1000
+        unit_index += 1
+    return "%.3g%s" % (size, SIZE_UNITS[unit_index])
+
+
+def parse_size(text: str) -> Optional[float]:
+    """
+    Parses a human-readable size with decimal units, as printed by the docker CLI.
+
+    Args:
+        text (str): The size, for example "12.3MB".
+
+    Returns:
+        Optional[float]: The size in bytes, or None if the text is not a size.
+    """
+    match = SIZE_PATTERN.fullmatch(text.strip())
+    if not match:
+        return None
+    return float(match.group(1)) * 1000 ** SIZE_UNITS.index(match.group(2))
+
+
+def human_duration(seconds: float) -> str:
+    """
+    Formats a number of seconds as a human-readable duration.
+
+    Args:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The formatted duration, for example "2 weeks".
+    """
+    seconds = int(seconds)
+    minutes = seconds // 60
+    hours = round(seconds / 3600)
+    if seconds < 1:
+        return "Less than a second"
+    if seconds == 1:
+        return "1 second"
+    if seconds < 60:
+        return f"{seconds} seconds"
+    if minutes == 1:
+        return "About a minute"
+    if minutes < 60:
+        return f"{minutes} minutes"
+    if hours == 1:
+        return "About an hour"
+    if hours < 48:
+        return f"{hours} hours"
+    if hours < 24 * 7 * 2:
+        return f"{hours // 24} days"
+    if hours < 24 * 30 * 2:
+        return f"{hours // 24 // 7} weeks"
+    if hours < 24 * 365 * 2:
+        return f"{hours // 24 // 30} months"
+    return f"{hours // 24 // 365} years"
+
+
+def time_ago(timestamp: float) -> str:
+    """
+    Formats a creation timestamp like the docker CLI does.
+
+    Args:
+        timestamp (float): The Unix timestamp of creation.
+
+    Returns:
+        str: The human-readable age, for example '2 weeks ago'.
+    """
+    return human_duration(time.time() - timestamp) + " ago"
+
+
+def parse_created_at(text: str) -> Optional[float]:
+    """
+    Parses the creation time printed by the docker CLI, for example '2024-01-02 03:04:05 +0100 CET'.
+
+    Args:
+        text (str): The creation time, with or without the name of the time zone.
+
+    Returns:
+        Optional[float]: The Unix timestamp, or None if the text is not a creation time.
+    """
+    try:
+        return datetime.strptime(" ".join(text.split()[:3]), CREATED_AT_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+def parse_timestamp(text: str) -> Optional[float]:
+    """
+    Parses an RFC 3339 time of the inspect information, for example '2024-01-02T03:04:05.123456789Z'.
+
+    Args:
+        text (str): The time.
+
+    Returns:
+        Optional[float]: The Unix timestamp, or None if the text is not a time.
+    """
+    try:
+        return datetime.fromisoformat(NANOSECONDS_PATTERN.sub(r"\1", text).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def format_table(headers: list[str], rows: list[list[str]]) -> list[str]:
+    """
+    Aligns the headers and rows into a text table.
+
+    Every column except the last one is padded to the width of its widest cell,
+    so the result looks like the output of the docker CLI.
+
+    Args:
+        headers (list[str]): The names of the columns.
+        rows (list[list[str]]): The cells of each row.
+
+    Returns:
+        list[str]: The header line followed by one line per row.
+    """
+    widths: list[int] = [len(header) for header in headers]
+    for row in rows:
+        for ind, cell in enumerate(row):
+            widths[ind] = max(widths[ind], len(cell))
+    lines: list[str] = []
+    for row in [headers, *rows]:
+        cells = [
+            cell.ljust(widths[ind] + COLUMN_PADDING) if ind < len(row) - 1 else cell
+            for ind, cell in enumerate(row)
+        ]
+        lines.append(EMPTY_STRING.join(cells))
+    return lines
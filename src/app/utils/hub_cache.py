@@ -0,0 +1,140 @@
+"""
+This module provides a persistent cache of Docker Hub responses that is kept across sessions.
+
+The cache keeps the body of every response in an SQLite database under the user cache directory
+(HUB_CACHE_PATH), keyed by the URL of the request, together with the validators Docker Hub sent
+with it (ETag and Last-Modified) and the time it was fetched. An entry younger than the TTL is
+fresh and is used without asking Docker Hub; an older entry is stale and is revalidated with a
+conditional request, which costs only the headers when the response has not changed.
+
+Only the most recently fetched HUB_CACHE_SIZE responses are kept. The cache is only an
+optimization: if the database cannot be opened or written, it behaves as if it were empty.
+
+Classes:
+- CachedResponse: A response read from the cache.
+- HubResponseCache: The SQLite cache of Docker Hub responses keyed by URL.
+"""
+import sqlite3
+import time
+from typing import NamedTuple, Optional
+
+from ..utils.constants import HUB_CACHE_PATH, HUB_CACHE_TTL, HUB_CACHE_SIZE
+from ..utils.sqlite_database import SqliteDatabase
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS responses ("
+    "url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at)"
+)
+
+
+class CachedResponse(NamedTuple):
+    """
+    A response read from the cache.
+
+    Attributes:
+        body (bytes): The decompressed body of the response.
+        etag (Optional[str]): The ETag header of the response.
+        last_modified (Optional[str]): The Last-Modified header of the response.
+        fetched_at (float): The Unix time at which the response was fetched or last revalidated.
+    """
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class HubResponseCache:
+    """
+    A thread-safe SQLite cache of Docker Hub responses keyed by URL.
+
+    The database is opened on the first use (see `SqliteDatabase`), so creating a cache costs
+    nothing at startup.
+
+    Attributes:
+        path (str): The path of the database file (the cache is disabled if it is empty).
+        ttl (float): The number of seconds for which a response is fresh.
+        max_size (int): The maximum number of kept responses.
+    """
+
+    def __init__(self, path: str = HUB_CACHE_PATH, ttl: float = HUB_CACHE_TTL, max_size: int = HUB_CACHE_SIZE):
+        """
+        Initializes the cache without opening the database.
+
+        Args:
+            path (str): The path of the database file.
+            ttl (float): The number of seconds for which a response is fresh.
+            max_size (int): The maximum number of kept responses.
+        """
+        self.path: str = path
+        self.ttl: float = ttl
+        self.max_size: int = max(1, max_size)
+        self.database: SqliteDatabase = SqliteDatabase(path, SCHEMA)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Returns the cached response to a URL, fresh or stale.
+
+        Args:
+            url (str): The URL of the request.
+
+        Returns:
+            Optional[CachedResponse]: The response, or None if it is not cached.
+        """
+        row: Optional[tuple] = self.database.run(
+            lambda connection: connection.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone(),
+            None
+        )
+        return None if row is None else CachedResponse(*row)
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        """
+        Returns whether a cached response is younger than the TTL.
+
+        Args:
+            response (CachedResponse): The cached response.
+
+        Returns:
+            bool: True if the response can be used without asking Docker Hub.
+        """
+        return time.time() - response.fetched_at < self.ttl
+
+    def put(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """
+        Stores the response to a URL, replacing the cached one, and drops the oldest
+        responses beyond the maximum size.
+
+        Args:
+            url (str): The URL of the request.
+            body (bytes): The decompressed body of the response.
+            etag (Optional[str]): The ETag header of the response.
+            last_modified (Optional[str]): The Last-Modified header of the response.
+        """
+        def save(connection: sqlite3.Connection) -> None:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, time.time())
+            )
+            connection.execute(
+                "DELETE FROM responses WHERE url NOT IN "
+                "(SELECT url FROM responses ORDER BY fetched_at DESC LIMIT ?)",
+                (self.max_size,)
+            )
+
+        self.database.run(save, None)
+
+    def touch(self, url: str) -> None:
+        """
+        Marks the cached response to a URL as fetched now, after Docker Hub confirmed it has not changed.
+
+        Args:
+            url (str): The URL of the request.
+        """
+        self.database.run(
+            lambda connection: connection.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            ),
+            None
+        )
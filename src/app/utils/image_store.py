@@ -0,0 +1,165 @@
+"""
+This module provides a persistent store of Docker image metadata that is kept across sessions.
+
+An image ID is the hash of the image content, so the inspect information of an image never
+changes while the image exists, except for its tags. The store keeps the inspect information
+of every inspected image in an SQLite database under the user cache directory (IMAGE_STORE_PATH),
+keyed by the full image ID, together with the rows of the last fetched images table, so the
+images tab can be shown at startup before Docker answers.
+
+Every time the images table is fetched from Docker, the stored information of the images
+that no longer exist is dropped. The store is only an optimization: if the database cannot
+be opened or written, it behaves as if it were empty.
+
+Classes:
+- ImageStore: The SQLite store of the inspect information and the table rows of Docker images.
+"""
+import json
+import sqlite3
+from typing import Optional
+
+from ..utils.constants import IMAGE_STORE_PATH, COLON
+from ..utils.formatters import time_ago
+from ..utils.records import Listing, ImageRecord
+from ..utils.sqlite_database import SqliteDatabase
+
+SHORT_ID_LENGTH = 12
+# every hex digit sorts before 'g', so the IDs that start with a prefix sort before the prefix + 'g'
+AFTER_HEX_DIGITS = "g"
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS images (id TEXT PRIMARY KEY, inspect TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS image_rows ("
+    "position INTEGER PRIMARY KEY, image_id TEXT NOT NULL, repository TEXT NOT NULL, tag TEXT NOT NULL, "
+    "created TEXT NOT NULL, size TEXT NOT NULL, created_at REAL)"
+)
+
+
+class ImageStore:
+    """
+    A thread-safe SQLite store of the inspect information and the table rows of Docker images.
+
+    The database is opened on the first use (see `SqliteDatabase`), so creating a store costs
+    nothing at startup.
+
+    Attributes:
+        path (str): The path of the database file (the store is disabled if it is empty).
+    """
+
+    def __init__(self, path: str = IMAGE_STORE_PATH):
+        """
+        Initializes the store without opening the database.
+
+        Args:
+            path (str): The path of the database file.
+        """
+        self.path: str = path
+        self.database: SqliteDatabase = SqliteDatabase(path, SCHEMA)
+
+    @staticmethod
+    def full_id(obj: dict) -> str:
+        """
+        Returns the image ID of the inspect information without the 'sha256:' prefix.
+
+        Args:
+            obj (dict): The inspect information of an image.
+
+        Returns:
+            str: The hexadecimal image ID.
+        """
+        return obj["Id"].split(COLON)[-1]
+
+    def get(self, image_id: str) -> Optional[dict]:
+        """
+        Returns the stored inspect information of an image.
+
+        Args:
+            image_id (str): The full or short hexadecimal ID of the image.
+
+        Returns:
+            Optional[dict]: The inspect information, or None if it is not stored,
+                            the ID is not hexadecimal or it matches several images.
+        """
+        image_id = image_id.split(COLON)[-1].lower()
+        if len(image_id) < SHORT_ID_LENGTH or any(char not in "0123456789abcdef" for char in image_id):
+            return None
+        rows: list[tuple[str]] = self.database.run(
+            lambda connection: connection.execute(
+                "SELECT inspect FROM images WHERE id >= ? AND id < ? LIMIT 2",
+                (image_id, image_id + AFTER_HEX_DIGITS)
+            ).fetchall(),
+            []
+        )
+        if len(rows) != 1:
+            return None
+        return json.loads(rows[0][0])
+
+    def __contains__(self, image_id: str) -> bool:
+        """Returns whether the inspect information of the image with the ID is stored."""
+        return self.get(image_id) is not None
+
+    def put(self, objects: list[dict]) -> None:
+        """
+        Stores the inspect information of the images among inspected Docker objects.
+
+        Args:
+            objects (list[dict]): The parsed output of 'docker inspect'; objects that
+                                  are not images (have no 'RepoTags') are skipped.
+        """
+        images = [(self.full_id(obj), json.dumps(obj)) for obj in objects if "RepoTags" in obj and "Id" in obj]
+        if images:
+            self.database.run(
+                lambda connection: connection.executemany("INSERT OR REPLACE INTO images VALUES (?, ?)", images),
+                None
+            )
+
+    def save_listing(self, listing: Listing) -> None:
+        """
+        Stores the rows of the images table, replacing the stored ones, and drops the stored
+        inspect information of the images that are not in the table anymore.
+
+        Args:
+            listing (Listing): The images table fetched from Docker.
+        """
+        rows = [
+            (position, record.image_id, record.repository, record.tag, record.created, record.size, record.created_at)
+            for position, record in enumerate(listing.records)
+            if isinstance(record, ImageRecord)
+        ]
+
+        def save(connection: sqlite3.Connection) -> None:
+            connection.execute("DELETE FROM image_rows")
+            connection.executemany("INSERT INTO image_rows VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            connection.execute(
+                "DELETE FROM images WHERE substr(id, 1, ?) NOT IN (SELECT image_id FROM image_rows)",
+                (SHORT_ID_LENGTH,)
+            )
+
+        self.database.run(save, None)
+
+    def load_listing(self) -> Optional[Listing]:
+        """
+        Loads the rows of the images table stored by the last fetch, with the age in the
+        CREATED column computed again from the creation time.
+
+        Returns:
+            Optional[Listing]: The images table, or None if no table is stored.
+        """
+        rows: list[tuple] = self.database.run(
+            lambda connection: connection.execute(
+                "SELECT image_id, repository, tag, created, size, created_at FROM image_rows ORDER BY position"
+            ).fetchall(),
+            []
+        )
+        if not rows:
+            return None
+        return Listing(ImageRecord, [
+            ImageRecord(
+                image_id=image_id,
+                repository=repository,
+                tag=tag,
+                created=created if created_at is None else time_ago(created_at),
+                size=size,
+                created_at=created_at
+            )
+            for image_id, repository, tag, created, size, created_at in rows
+        ])
@@ -0,0 +1,197 @@
+"""
+This module provides a queue that runs operations changing Docker objects as background jobs,
+so the terminal interface stays responsive while they run.
+
+Classes:
+- Job: One operation with its state, elapsed time, progress and result.
+- JobQueue: Runs jobs on a small pool of worker threads and keeps the recent ones for display.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from ..exeptions.exeptions import DockerCommandError, DockerNotRunningError
+from ..utils.constants import (
+    MAX_JOBS, JOBS_HISTORY, SPACE, EMPTY_STRING, SLASH, DOCKER_NOT_RUNNING_ITEM_TEXT, SUCCEEDED_TEXT
+)
+from ..utils.enams import JobStates
+from ..utils.executor import BulkResult
+
+
+class Job:
+    """
+    An operation that runs in the background.
+
+    The function of the job receives the job itself, so it can report its progress
+    with `set_progress`, and returns the result for every Docker object it processed.
+    After a successful run, `on_success` is called in the worker thread with the results,
+    for example to update the table rows of the processed objects. A job with a live view
+    of its own, like the per-layer progress of pulls, returns its lines from `details`.
+
+    Attributes:
+        title (str): The description of the job, for example 'Deleting 3 containers'.
+        state (JobStates): The state of the job.
+        progress (str): The latest progress reported by the job.
+        results (list[BulkResult]): The result for every processed Docker object.
+        error (Optional[str]): The error that stopped the whole job, if any.
+    """
+
+    def __init__(
+            self,
+            title: str,
+            func: Callable[["Job"], list[BulkResult]],
+            on_success: Optional[Callable[[list[BulkResult]], None]] = None,
+            details: Optional[Callable[[], list[str]]] = None
+    ):
+        """
+        Initializes a queued job.
+
+        Args:
+            title (str): The description of the job.
+            func (Callable[[Job], list[BulkResult]]): The operation of the job.
+            on_success (Optional[Callable[[list[BulkResult]], None]]): Called with the results after the operation.
+            details (Optional[Callable[[], list[str]]]): Returns the detailed progress of the running operation.
+        """
+        self.title: str = title
+        self.func: Callable[["Job"], list[BulkResult]] = func
+        self.on_success: Optional[Callable[[list[BulkResult]], None]] = on_success
+        self.details: Optional[Callable[[], list[str]]] = details
+        self.state: JobStates = JobStates.QUEUED
+        self.progress: str = EMPTY_STRING
+        self.results: list[BulkResult] = []
+        self.error: Optional[str] = None
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """The seconds the job has been running for, or ran for if it has finished."""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is queued or running."""
+        return self.state in (JobStates.QUEUED, JobStates.RUNNING)
+
+    @property
+    def failed_results(self) -> list[BulkResult]:
+        """The results of the Docker objects the job failed for."""
+        return [result for result in self.results if not result.ok]
+
+    def set_progress(self, done: int, total: int, details: object = EMPTY_STRING) -> None:
+        """
+        Reports the progress of the job.
+
+        Args:
+            done (int): The number of processed Docker objects.
+            total (int): The number of all Docker objects.
+            details (object): Additional progress, for example a transfer meter.
+        """
+        self.progress = f"{done}{SLASH}{total} {details}".strip()
+
+    def run(self) -> None:
+        """Runs the operation of the job and records its result."""
+        self.state = JobStates.RUNNING
+        self.started = time.monotonic()
+        try:
+            self.results = self.func(self) or []
+            if self.on_success:
+                self.on_success(self.results)
+        except DockerCommandError as error:
+            self.error = str(error)
+        except DockerNotRunningError:
+            self.error = DOCKER_NOT_RUNNING_ITEM_TEXT
+        except OSError as error:
+            self.error = str(error)
+        except Exception as error:
+            # any other error, e.g. a malformed pull stream, must not leave the job running forever
+            self.error = str(error) or type(error).__name__
+        self.finished = time.monotonic()
+        self.state = JobStates.FAILED if self.error or self.failed_results else JobStates.DONE
+
+    def summary(self) -> str:
+        """
+        Returns the progress of a running job or the result of a finished one.
+
+        Returns:
+            str: For example '2/3 succeeded' or the error of the job.
+        """
+        if self.error:
+            return self.error
+        if self.state in (JobStates.DONE, JobStates.FAILED) and self.results:
+            succeeded = sum(result.ok for result in self.results)
+            return f"{succeeded}{SLASH}{len(self.results)}{SPACE}{SUCCEEDED_TEXT}"
+        return self.progress
+
+    def __str__(self) -> str:
+        """Returns the line of the job in the jobs panel."""
+        return f"{self.state.value:<8}{self.elapsed:>7.1f}s   {self.title}   {self.summary()}"
+
+
+class JobQueue:
+    """
+    Runs jobs in the order they are submitted, at most MAX_JOBS at the same time.
+
+    Finished jobs are kept for display, up to JOBS_HISTORY of them.
+
+    Attributes:
+        changed (threading.Event): Set every time a job has finished.
+    """
+
+    def __init__(self, max_jobs: int = MAX_JOBS, history: int = JOBS_HISTORY):
+        """
+        Initializes the queue.
+
+        Args:
+            max_jobs (int): The maximum number of jobs running at the same time.
+            history (int): The maximum number of finished jobs that are kept.
+        """
+        self.history: int = history
+        self.changed = threading.Event()
+        self.__jobs: list[Job] = []
+        self.__lock = threading.Lock()
+        self.__pool = ThreadPoolExecutor(max_workers=max(1, max_jobs), thread_name_prefix="job")
+
+    def __run(self, job: Job) -> None:
+        """Runs a job in a worker thread and signals that it has finished."""
+        job.run()
+        self.changed.set()
+
+    def submit(self, job: Job) -> Job:
+        """
+        Queues a job.
+
+        Args:
+            job (Job): The job to run.
+
+        Returns:
+            Job: The queued job.
+        """
+        with self.__lock:
+            self.__jobs.append(job)
+            finished = [queued_job for queued_job in self.__jobs if not queued_job.is_active]
+            for old_job in finished[:max(0, len(finished) - self.history)]:
+                self.__jobs.remove(old_job)
+        self.__pool.submit(self.__run, job)
+        return job
+
+    @property
+    def jobs(self) -> list[Job]:
+        """The active and the recently finished jobs, in the order they were submitted."""
+        with self.__lock:
+            return list(self.__jobs)
+
+    def counts(self) -> dict[JobStates, int]:
+        """
+        Counts the jobs in every state.
+
+        Returns:
+            dict[JobStates, int]: The number of jobs in every state.
+        """
+        counts: dict[JobStates, int] = {state: 0 for state in JobStates}
+        for job in self.jobs:
+            counts[job.state] += 1
+        return counts
@@ -0,0 +1,222 @@
+"""
+This module provides a lazily expanded tree of parsed JSON for the inspect viewer.
+
+Only the nodes that are visible exist: the children of an object or array are created the first
+time it is expanded, and the visible nodes are kept in one flat list, so expanding or collapsing
+a node touches only its descendants and rendering a screen formats only the lines on it.
+
+Classes:
+- JsonNode: One key of an object or item of an array, with its value.
+- JsonTree: The visible nodes of a JSON document, usable as a sequence of display lines.
+"""
+from typing import Optional, Sequence, Union, overload
+
+from ..utils.constants import PLUS, DASH, SPACE, COLON, END_OF_LINE, EMPTY_STRING
+
+JsonValue = Union[dict, list, str, int, float, bool, None]
+
+INDENT = SPACE * 4
+JSON_LITERALS_DICT: dict[object, str] = {True: "true", False: "false", None: "null"}
+
+
+class JsonNode:
+    """
+    A key of a JSON object or an item of a JSON array.
+
+    Attributes:
+        key (str): The key, or the position of the item in its array.
+        value (JsonValue): The parsed value.
+        depth (int): The nesting level of the node, 0 for the top-level keys.
+        expanded (bool): Whether the children of the node are shown.
+    """
+    __slots__ = ("key", "value", "depth", "expanded", "__children")
+
+    def __init__(self, key: str, value: JsonValue, depth: int):
+        """
+        Initializes a collapsed node.
+
+        Args:
+            key (str): The key, or the position of the item in its array.
+            value (JsonValue): The parsed value.
+            depth (int): The nesting level of the node.
+        """
+        self.key: str = key
+        self.value: JsonValue = value
+        self.depth: int = depth
+        self.expanded: bool = False
+        self.__children: Optional[list["JsonNode"]] = None
+
+    @property
+    def is_expandable(self) -> bool:
+        """Whether the node is a non-empty object or array."""
+        return isinstance(self.value, (dict, list)) and bool(self.value)
+
+    @property
+    def children(self) -> list["JsonNode"]:
+        """The nodes of the keys or items of the value, created on the first access."""
+        if self.__children is None:
+            self.__children = JsonNode.nodes_of(self.value, self.depth + 1)
+        return self.__children
+
+    @staticmethod
+    def nodes_of(value: JsonValue, depth: int) -> list["JsonNode"]:
+        """
+        Creates the nodes of the keys of an object or the items of an array.
+
+        Args:
+            value (JsonValue): The object or array.
+            depth (int): The nesting level of the created nodes.
+
+        Returns:
+            list[JsonNode]: The nodes, or an empty list for other values.
+        """
+        if isinstance(value, dict):
+            return [JsonNode(str(key), item, depth) for key, item in value.items()]
+        if isinstance(value, list):
+            return [JsonNode(str(position), item, depth) for position, item in enumerate(value)]
+        return []
+
+    @staticmethod
+    def format_value(value: JsonValue) -> str:
+        """
+        Formats a value for one line of the screen.
+
+        Args:
+            value (JsonValue): The parsed value.
+
+        Returns:
+            str: Strings without quotes and with escaped line breaks, JSON literals for
+                 booleans and null, and a short summary for objects and arrays.
+        """
+        if isinstance(value, dict):
+            return f"{{{len(value)} keys}}" if value else "{}"
+        if isinstance(value, list):
+            return f"[{len(value)} items]" if value else "[]"
+        if isinstance(value, str):
+            return value.replace(END_OF_LINE, "\\n")
+        if isinstance(value, bool) or value is None:
+            return JSON_LITERALS_DICT[value]
+        return str(value)
+
+    def line(self) -> str:
+        """
+        Returns the display line of the node.
+
+        Returns:
+            str: For example '    + Config: {25 keys}', '    - Env:' or '      Image: nginx'.
+        """
+        if not self.is_expandable:
+            marker = SPACE
+        else:
+            marker = DASH if self.expanded else PLUS
+        value = EMPTY_STRING if self.expanded else SPACE + self.format_value(self.value)
+        return INDENT * self.depth + marker + SPACE + self.key + COLON + value
+
+
+class JsonTree(Sequence[str]):
+    """
+    The visible nodes of a JSON document, with all nodes collapsed at first.
+
+    As a sequence, the tree holds the display lines of the visible nodes, and a line is
+    formatted only when it is read, so slicing the lines of one screen costs as much as
+    the number of lines on it.
+    """
+
+    def __init__(self, data: JsonValue):
+        """
+        Initializes the tree with the top-level keys of the document visible.
+
+        The output of 'docker inspect' is an array with one object, whose keys are shown
+        at the top level.
+
+        Args:
+            data (JsonValue): The parsed document.
+        """
+        if isinstance(data, list) and len(data) == 1:
+            data = data[0]
+        self.nodes: list[JsonNode] = JsonNode.nodes_of(data, 0) or [JsonNode(EMPTY_STRING, data, 0)]
+
+    def __len__(self) -> int:
+        """Returns the number of visible nodes."""
+        return len(self.nodes)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, list[str]]:
+        """Returns the display line of a visible node, or the lines of a slice of them."""
+        if isinstance(index, slice):
+            return [node.line() for node in self.nodes[index]]
+        return self.nodes[index].line()
+
+    def __descendants_end(self, index: int) -> int:
+        """Returns the position after the last visible descendant of the node at the position."""
+        depth = self.nodes[index].depth
+        end = index + 1
+        while end < len(self.nodes) and self.nodes[end].depth > depth:
+            end += 1
+        return end
+
+    def expand(self, index: int) -> None:
+        """
+        Shows the children of the node at the position, keeping the state of expanded grandchildren.
+
+        Args:
+            index (int): The position of the node among the visible nodes.
+        """
+        node = self.nodes[index]
+        if node.expanded or not node.is_expandable:
+            return
+        node.expanded = True
+        visible: list[JsonNode] = []
+        stack: list[JsonNode] = list(reversed(node.children))
+        while stack:
+            child = stack.pop()
+            visible.append(child)
+            if child.expanded:
+                stack.extend(reversed(child.children))
+        self.nodes[index + 1:index + 1] = visible
+
+    def collapse(self, index: int) -> None:
+        """
+        Hides the descendants of the node at the position.
+
+        Args:
+            index (int): The position of the node among the visible nodes.
+        """
+        node = self.nodes[index]
+        if not node.expanded:
+            return
+        node.expanded = False
+        del self.nodes[index + 1:self.__descendants_end(index)]
+
+    def toggle(self, index: int) -> None:
+        """
+        Expands the node at the position if it is collapsed, otherwise collapses it.
+
+        Args:
+            index (int): The position of the node among the visible nodes.
+        """
+        if self.nodes[index].expanded:
+            self.collapse(index)
+        else:
+            self.expand(index)
+
+    def parent_index(self, index: int) -> int:
+        """
+        Finds the visible parent of the node at the position.
+
+        Args:
+            index (int): The position of the node among the visible nodes.
+
+        Returns:
+            int: The position of the parent, or the position itself for a top-level node.
+        """
+        depth = self.nodes[index].depth
+        for position in range(index - 1, -1, -1):
+            if self.nodes[position].depth < depth:
+                return position
+        return index
@@ -2,11 +2,12 @@
 This module provides a mixin classes.
 """
 import curses
-from typing import Union
+from typing import Collection, Optional, Sequence
 from urllib.parse import urlparse, parse_qs
 
 from ..utils.constants import *
-from ..utils.enams import Colors
+from ..utils.enams import Colors, QueryParams
+from ..utils.hints import Response
 
 
 class MenuMixin:
@@ -65,16 +66,19 @@ class TablesMixin:
     """
 
     @staticmethod
-    def put_tables(screen: curses.window, tables: list[str], index: int):
+    def put_tables(screen: curses.window, tables: Sequence[str], index: int, marked: Collection[str] = ()):
         """
         Renders a list of tables on the given screen.
 
+        Only the tables that fit on the screen are read, so the tables can be a lazy
+        sequence whose lines are formatted on access (see `JsonTree`).
+
         Args:
             screen (curses.window): The curses window object where the tables will be drawn.
-            tables (list[str]): A list of table strings to display.
+            tables (Sequence[str]): A sequence of table strings to display.
             index (int): The index of the currently selected table.
+            marked (Collection[str]): The tables marked by the user, drawn dimmed.
         """
-        tables: list[str] = tables
         cursor_index: int = index
 
         height, width = screen.getmaxyx()
@@ -86,13 +90,11 @@ class TablesMixin:
             start = cursor_index - height + 10
             end = start + end
 
-        for ind, table in enumerate(tables):
-            if ind < start:
-                continue
-            if ind > end:
-                break
+        for ind, table in enumerate(tables[start:end + 1], start):
             if ind == cursor_index:
                 screen.addstr(table[:width - 8], curses.color_pair(Colors.WHITE_ON_YELLOW))
+            elif table in marked:
+                screen.addstr(table[:width - 8], curses.A_DIM)
             else:
                 screen.addstr(table[:width - 8])
             screen.addstr(END_OF_LINE)
@@ -104,98 +106,47 @@ class UrlMixin:
     """
 
     @staticmethod
-    def put_tables_from_dict_or_list(data: Union[dict, list], result: list, indent: int = 0) -> None:
+    def get_query_param_from_url(url: str, query_param_name: str) -> str:
         """
-        Recursively formats a dictionary or list into a string representation
-        and appends it to the result list.
+        Extracts a specific query parameter from a given URL.
 
         Args:
-            data (Union[dict, list]): The input data, which can be a dictionary or a list.
-            result (list): The list to which the formatted strings will be appended.
-            indent (int): The current indentation level for formatting (default is 0).
+            url (str): The URL from which to extract the query parameter.
+            query_param_name (str): The name of the query parameter to extract.
 
-        This function handles nested dictionaries and lists, formatting them
-        with appropriate indentation. Keys are followed by their values, and
-        nested structures are indented further.
+        Returns:
+            str: The value of the query parameter, or None if it does not exist.
         """
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, list) or isinstance(value, dict):
-                    result.append(
-                        SPACE*indent + str(key) + COLON
-                    )
-                    UrlMixin.put_tables_from_dict_or_list(
-                        value,
-                        result,
-                        indent + 4
-                    )
-                    result.append(EMPTY_STRING)
-                else:
-                    result.append(
-                        SPACE*indent + str(key) + COLON + SPACE + str(value)
-                    )
-        if isinstance(data, list):
-            for value in data:
-                if isinstance(value, list) or isinstance(value, dict):
-                    UrlMixin.put_tables_from_dict_or_list(
-                        value,
-                        result,
-                        indent + 4
-                    )
-                    result.append(EMPTY_STRING)
-                else:
-                    result.append(
-                        SPACE*indent + str(value)
-                    )
+        parsed_url = urlparse(url)
+        query_params = parse_qs(parsed_url.query)
+        return query_params.get(query_param_name, [None])[0]
 
-    @staticmethod
-    def get_inspect_tables_from_json_string(string: str) -> list[str]:
+    def get_page_number(self, url: str) -> int:
         """
-        Parses the inspection JSON string and extracts relevant tables.
-
-        This private method removes unwanted characters from the JSON string
-        and splits it into a list of non-empty strings representing tables.
+        Extracts the page number from the URL of a page of results.
 
         Args:
-            string (str): The JSON string containing inspection data.
+            url (str): The URL, for example the 'next' or 'previous' link of a page.
 
         Returns:
-            list[str]: A list of parsed table strings.
+            int: The page number; the link to the first page may have no page parameter.
         """
-        replayed_strings: list[str] = [
-            '"',
-            ",",
-            "{",
-            "}",
-            "[",
-            "]",
-        ]
-        parsed_str: str = string
-        for s in replayed_strings:
-            parsed_str = parsed_str.replace(
-                s,
-                EMPTY_STRING
-            )
-        return [
-            s[8:] for s in parsed_str.split(END_OF_LINE) if s.strip()
-        ]
+        page = self.get_query_param_from_url(url=url, query_param_name=QueryParams.PAGE.value)
+        return START_PAGE_NUMBER if page is None else int(page)
 
-    @staticmethod
-    def get_query_param_from_url(url: str, query_param_name: str) -> str:
+    def get_adjacent_pages(self, data: Optional[Response]) -> list[int]:
         """
-        Extracts a specific query parameter from a given URL.
+        Finds the numbers of the next and the previous page of a page of results.
 
         Args:
-            url (str): The URL from which to extract the query parameter.
-            query_param_name (str): The name of the query parameter to extract.
+            data (Optional[Response]): The page of results.
 
         Returns:
-            str: The value of the query parameter, or None if it does not exist.
+            list[int]: The numbers of the pages the page links to.
         """
-        parsed_url = urlparse(url)
-        query_params = parse_qs(parsed_url.query)
-        return query_params.get(query_param_name, [None])[0]
-
+        if not data:
+            return []
+        return [self.get_page_number(url) for url in (data['next'], data['previous']) if url]
 
 
 
@@ -0,0 +1,113 @@
+"""
+This module provides a bounded cache of the pages of Docker Hub results, with background prefetch.
+
+The search viewers prefetch the pages next to the page on the screen, so paging through
+results does not wait for Docker Hub. A page that is requested while its prefetch is in
+flight waits for that fetch instead of sending the request again.
+
+Classes:
+- PageCache: A thread-safe LRU cache of result pages keyed by query and page number.
+"""
+import collections
+import threading
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from ..exeptions.exeptions import DockerApiError
+from ..utils.constants import PAGE_CACHE_SIZE
+
+T = TypeVar("T")
+
+
+class PageCache(Generic[T]):
+    """
+    A thread-safe LRU cache of result pages keyed by query and page number.
+
+    Attributes:
+        max_pages (int): The maximum number of cached pages of all queries.
+    """
+
+    def __init__(self, max_pages: int = PAGE_CACHE_SIZE):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_pages (int): The maximum number of cached pages of all queries.
+        """
+        self.max_pages: int = max(1, max_pages)
+        self.__pages: collections.OrderedDict[tuple[Hashable, int], T] = collections.OrderedDict()
+        self.__fetching: dict[tuple[Hashable, int], threading.Event] = {}
+        self.__lock = threading.Lock()
+
+    def peek(self, query: Hashable, page: int) -> Optional[T]:
+        """
+        Returns a cached page without fetching it.
+
+        Args:
+            query (Hashable): The query, for example the search text.
+            page (int): The page number.
+
+        Returns:
+            Optional[T]: The page, or None if it is not cached.
+        """
+        with self.__lock:
+            if (query, page) in self.__pages:
+                self.__pages.move_to_end((query, page))
+                return self.__pages[(query, page)]
+        return None
+
+    def get(self, query: Hashable, page: int, fetch: Callable[[], T]) -> T:
+        """
+        Returns a page, fetching it with the function if it is not cached.
+
+        Args:
+            query (Hashable): The query, for example the search text.
+            page (int): The page number.
+            fetch (Callable[[], T]): Fetches the page.
+
+        Returns:
+            T: The page.
+        """
+        key = (query, page)
+        while True:
+            with self.__lock:
+                if key in self.__pages:
+                    self.__pages.move_to_end(key)
+                    return self.__pages[key]
+                event = self.__fetching.get(key)
+                if event is None:
+                    self.__fetching[key] = threading.Event()
+                    break
+            # the page is being fetched by another thread, it is cached when the fetch succeeds
+            event.wait()
+        try:
+            value = fetch()
+            with self.__lock:
+                self.__pages[key] = value
+                while len(self.__pages) > self.max_pages:
+                    self.__pages.popitem(last=False)
+            return value
+        finally:
+            with self.__lock:
+                self.__fetching.pop(key).set()
+
+    def prefetch(self, query: Hashable, page: int, fetch: Callable[[], T]) -> None:
+        """
+        Fetches a page into the cache in a background thread, unless it is cached or being fetched.
+        Failures are ignored: the page is then fetched when it is shown.
+
+        Args:
+            query (Hashable): The query, for example the search text.
+            page (int): The page number.
+            fetch (Callable[[], T]): Fetches the page.
+        """
+        with self.__lock:
+            if (query, page) in self.__pages or (query, page) in self.__fetching:
+                return
+
+        def run():
+            try:
+                self.get(query, page, fetch)
+            except (DockerApiError, OSError):
+                pass
+
+        threading.Thread(target=run, daemon=True, name="page-prefetch").start()
@@ -0,0 +1,146 @@
+"""
+This module provides a small in-memory trie of values keyed by text, for search-as-you-type.
+
+The search viewer keeps the first page of results of every query it sent in the trie, so going
+back to an earlier query is answered from memory, and the results of the longest earlier query
+that the new text extends can be refined locally while the request for the new text is in flight.
+
+Classes:
+- PrefixTrie: A size-bounded trie that finds a key or the longest stored prefix of a text.
+"""
+import collections
+from typing import Generic, Optional, TypeVar
+
+from ..utils.constants import SEARCH_TRIE_SIZE
+
+T = TypeVar("T")
+
+
+class TrieNode(Generic[T]):
+    """
+    A node of the trie: the value of the key that ends at the node and the nodes of the next characters.
+
+    Attributes:
+        children (dict[str, TrieNode]): The nodes of the next characters.
+        value (Optional[T]): The value of the key, or None if no key ends here.
+    """
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        """Initializes a node without children and value."""
+        self.children: dict[str, "TrieNode[T]"] = {}
+        self.value: Optional[T] = None
+
+
+class PrefixTrie(Generic[T]):
+    """
+    A trie of values keyed by text that holds at most `max_size` keys, evicting the least recently used.
+
+    Attributes:
+        max_size (int): The maximum number of keys.
+    """
+
+    def __init__(self, max_size: int = SEARCH_TRIE_SIZE):
+        """
+        Initializes an empty trie.
+
+        Args:
+            max_size (int): The maximum number of keys.
+        """
+        self.max_size: int = max(1, max_size)
+        self.__root: TrieNode[T] = TrieNode()
+        self.__keys: collections.OrderedDict[str, None] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of keys."""
+        return len(self.__keys)
+
+    def __contains__(self, key: str) -> bool:
+        """Returns whether a value is stored for the key."""
+        return key in self.__keys
+
+    def __path(self, key: str) -> list[TrieNode[T]]:
+        """
+        Walks the nodes of the characters of a key, as far as they exist.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            list[TrieNode[T]]: The root and the nodes of the existing characters of the key.
+        """
+        path = [self.__root]
+        for char in key:
+            node = path[-1].children.get(char)
+            if node is None:
+                break
+            path.append(node)
+        return path
+
+    def put(self, key: str, value: T) -> None:
+        """
+        Stores the value of a key, evicting the least recently used key if the trie is full.
+
+        Args:
+            key (str): The key.
+            value (T): The value.
+        """
+        node = self.__root
+        for char in key:
+            node = node.children.setdefault(char, TrieNode())
+        node.value = value
+        self.__keys[key] = None
+        self.__keys.move_to_end(key)
+        while len(self.__keys) > self.max_size:
+            self.remove(next(iter(self.__keys)))
+
+    def get(self, key: str) -> Optional[T]:
+        """
+        Returns the value of a key and marks the key as recently used.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[T]: The value, or None if the key is not stored.
+        """
+        if key not in self.__keys:
+            return None
+        self.__keys.move_to_end(key)
+        return self.__path(key)[-1].value
+
+    def longest_prefix(self, text: str) -> Optional[tuple[str, T]]:
+        """
+        Finds the longest stored key that the text starts with, the text itself included.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            Optional[tuple[str, T]]: The key and its value, or None if no key is a prefix of the text.
+        """
+        path = self.__path(text)
+        for length in range(len(path) - 1, -1, -1):
+            if path[length].value is not None:
+                key = text[:length]
+                self.__keys.move_to_end(key)
+                return key, path[length].value
+        return None
+
+    def remove(self, key: str) -> None:
+        """
+        Removes a key and the nodes that no other key needs.
+
+        Args:
+            key (str): The key.
+        """
+        if key not in self.__keys:
+            return
+        del self.__keys[key]
+        path = self.__path(key)
+        path[-1].value = None
+        for length in range(len(key), 0, -1):
+            node = path[length]
+            if node.value is not None or node.children:
+                break
+            del path[length - 1].children[key[length - 1]]
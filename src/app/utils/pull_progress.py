@@ -0,0 +1,235 @@
+"""
+This module tracks the progress of image pulls layer by layer.
+
+Classes:
+- LayerProgress: The state and the downloaded bytes of one image layer.
+- PullProgress: The progress of the pull of one image, fed from the docker CLI output
+  or from the JSON progress messages of the Docker Engine API.
+
+Functions:
+- summarize: Sums up the progress of several concurrent pulls.
+"""
+import string
+import threading
+import time
+from typing import Optional
+
+from ..utils.constants import (
+    COLON, SLASH, SPACE, EMPTY_STRING, MIN_ELAPSED_TIME, RATE_SUFFIX, ETA_TEXT, LAYERS_TEXT
+)
+from ..utils.formatters import human_size, human_duration, parse_size
+
+PULLING_FROM_STATUS = "Pulling from"
+DOWNLOADING_STATUS = "Downloading"
+DOWNLOADED_STATUSES: tuple[str, ...] = ("Download complete", "Verifying Checksum", "Extracting")
+FINISHED_STATUSES: tuple[str, ...] = ("Pull complete", "Already exists")
+
+
+class LayerProgress:
+    """
+    The progress of one image layer.
+
+    Attributes:
+        layer_id (str): The short ID of the layer.
+        status (str): The latest status of the layer, for example 'Downloading'.
+        current (int): The downloaded bytes.
+        total (Optional[int]): The size of the layer, if it is known.
+    """
+    __slots__ = ("layer_id", "status", "current", "total")
+
+    def __init__(self, layer_id: str):
+        """Initializes the progress of a layer that has not started downloading."""
+        self.layer_id: str = layer_id
+        self.status: str = EMPTY_STRING
+        self.current: int = 0
+        self.total: Optional[int] = None
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the layer is downloaded and extracted, or was already present."""
+        return self.status in FINISHED_STATUSES
+
+    def __str__(self) -> str:
+        """Returns the line of the layer, for example 'a1b2c3d4e5f6   Downloading   1.2MB/3.4MB'."""
+        line = self.layer_id + SPACE * 3 + self.status
+        if self.total:
+            line += SPACE * 3 + human_size(self.current) + SLASH + human_size(self.total)
+        return line
+
+
+class PullProgress:
+    """
+    The progress of the pull of one image.
+
+    The progress is updated from the thread that runs the pull and read from the
+    thread that draws it, so updates and reads of the layers are done under a lock.
+
+    Attributes:
+        reference (str): The reference of the pulled image.
+        status (str): The latest message that is not about a layer, for example the digest.
+        error (Optional[str]): The error reported by the daemon, if any.
+        started (Optional[float]): The monotonic time the first layer was reported at, so pulls
+                                   waiting for their turn do not count towards the rate.
+    """
+
+    def __init__(self, reference: str):
+        """
+        Initializes the progress of a pull.
+
+        Args:
+            reference (str): The reference of the pulled image.
+        """
+        self.reference: str = reference
+        self.status: str = EMPTY_STRING
+        self.error: Optional[str] = None
+        self.started: Optional[float] = None
+        self.__layers: dict[str, LayerProgress] = {}
+        self.__lock = threading.Lock()
+
+    def update(self, layer_id: str, status: str, current: Optional[float] = None, total: Optional[float] = None):
+        """
+        Updates the progress of a layer.
+
+        Only the bytes of the download count, so the progress of the extraction,
+        which the daemon reports with the same fields, is ignored.
+
+        Args:
+            layer_id (str): The short ID of the layer.
+            status (str): The status of the layer.
+            current (Optional[float]): The downloaded bytes, if they are reported.
+            total (Optional[float]): The size of the layer, if it is reported.
+        """
+        with self.__lock:
+            if self.started is None:
+                self.started = time.monotonic()
+            layer = self.__layers.setdefault(layer_id, LayerProgress(layer_id))
+            layer.status = status
+            if status == DOWNLOADING_STATUS:
+                if total:
+                    layer.total = int(total)
+                if current is not None:
+                    layer.current = int(current)
+            elif (status in DOWNLOADED_STATUSES or status in FINISHED_STATUSES) and layer.total:
+                layer.current = layer.total
+
+    def apply_json(self, message: dict) -> None:
+        """
+        Applies one JSON progress message of the Docker Engine API.
+
+        Args:
+            message (dict): The decoded message, for example
+                            {"status": "Downloading", "id": "a1b2c3", "progressDetail": {"current": 1, "total": 2}}.
+        """
+        if message.get("error"):
+            self.error = message["error"]
+            return
+        status: str = message.get("status", EMPTY_STRING)
+        if not message.get("id") or status.startswith(PULLING_FROM_STATUS):
+            self.status = status
+            return
+        detail: dict = message.get("progressDetail") or {}
+        self.update(message["id"], status, detail.get("current"), detail.get("total"))
+
+    def apply_line(self, line: str) -> None:
+        """
+        Applies one line of the output of 'docker pull'.
+
+        A layer line looks like 'a1b2c3: Downloading' or, when the CLI prints progress bars,
+        'a1b2c3: Downloading [==>    ]  1.2MB/3.4MB'. Other lines, like 'latest: Pulling from library/alpine'
+        or 'Digest: sha256:...', are kept as the status.
+
+        Args:
+            line (str): The line of the output.
+        """
+        line = line.strip()
+        layer_id, separator, status = line.partition(COLON + SPACE)
+        is_layer = bool(layer_id) and all(char in string.hexdigits for char in layer_id)
+        if not separator or not is_layer or status.startswith(PULLING_FROM_STATUS):
+            if line:
+                self.status = line
+            return
+        current = total = None
+        sizes = status.rsplit(SPACE, 1)[-1].split(SLASH)
+        if len(sizes) == 2 and parse_size(sizes[0]) is not None and parse_size(sizes[1]) is not None:
+            current, total = parse_size(sizes[0]), parse_size(sizes[1])
+            status = status.split("[")[0].strip()
+        self.update(layer_id, status, current, total)
+
+    @property
+    def layers(self) -> list[LayerProgress]:
+        """The progress of every layer, in the order the layers were reported."""
+        with self.__lock:
+            return list(self.__layers.values())
+
+    @property
+    def current(self) -> int:
+        """The downloaded bytes of all layers."""
+        return sum(layer.current for layer in self.layers)
+
+    @property
+    def total(self) -> int:
+        """The size of all layers whose size is known."""
+        return sum(layer.total or 0 for layer in self.layers)
+
+    @property
+    def rate(self) -> float:
+        """The average number of bytes downloaded per second."""
+        if self.started is None:
+            return 0.0
+        return self.current / max(time.monotonic() - self.started, MIN_ELAPSED_TIME)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """The estimated seconds until the known layers are downloaded, or None if it can not be estimated."""
+        rate = self.rate
+        if not rate or not self.total:
+            return None
+        return max(self.total - self.current, 0) / rate
+
+    def summary(self) -> str:
+        """
+        Returns one line with the progress of the pull.
+
+        Returns:
+            str: For example 'nginx:latest   3/5 layers   12MB/40MB   5MB/s   ETA 6 seconds'.
+        """
+        layers: list[LayerProgress] = self.layers
+        parts: list[str] = [self.reference]
+        if layers:
+            parts.append(f"{sum(layer.is_finished for layer in layers)}{SLASH}{len(layers)} {LAYERS_TEXT}")
+        if self.total:
+            parts.append(human_size(self.current) + SLASH + human_size(self.total))
+            parts.append(human_size(self.rate) + RATE_SUFFIX)
+        eta = self.eta
+        if eta is not None and self.current < self.total:
+            parts.append(ETA_TEXT + SPACE + human_duration(eta))
+        if self.status and not layers:
+            parts.append(self.status)
+        return (SPACE * 3).join(parts)
+
+    def lines(self) -> list[str]:
+        """
+        Returns the summary of the pull followed by a line for every layer that is not finished.
+
+        Returns:
+            list[str]: The lines of the live view of the pull.
+        """
+        return [self.summary()] + [SPACE * 2 + str(layer) for layer in self.layers if not layer.is_finished]
+
+
+def summarize(progresses: list[PullProgress]) -> str:
+    """
+    Sums up the downloaded bytes and the rates of several concurrent pulls.
+
+    Args:
+        progresses (list[PullProgress]): The progress of every pull.
+
+    Returns:
+        str: For example '12MB/40MB 5MB/s', or an empty string if no sizes are known yet.
+    """
+    total = sum(progress.total for progress in progresses)
+    if not total:
+        return EMPTY_STRING
+    current = sum(progress.current for progress in progresses)
+    rate = sum(progress.rate for progress in progresses)
+    return human_size(current) + SLASH + human_size(total) + SPACE + human_size(rate) + RATE_SUFFIX
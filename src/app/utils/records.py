@@ -0,0 +1,373 @@
+"""
+This module provides compact records for Docker objects and a listing that indexes them.
+
+It includes:
+- BaseRecord: An abstract base class for a row of a Docker objects table.
+- ImageRecord, ContainerRecord, VolumeRecord: Records of Docker images, containers and volumes.
+- Listing: The records of one table, indexed by ID and rendered to text once.
+
+Records are parsed from the output of docker CLI commands with the '{{json .}}' format,
+so the values of columns never depend on their position in a whitespace-split line.
+"""
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..utils.constants import COLON, NONE_VALUE, EMPTY_STRING
+from ..utils.formatters import format_table, parse_created_at, parse_timestamp, human_size, time_ago
+
+
+class BaseRecord(ABC):
+    """
+    Abstract base class for a row of a Docker objects table.
+
+    Every subclass defines the table headers, the ID and the name of the object
+    and the cells of its row.
+    """
+    __slots__ = ()
+    headers: tuple[str, ...] = ()
+
+    @classmethod
+    @abstractmethod
+    def from_json(cls, data: dict) -> "BaseRecord":
+        """
+        Creates a record from one JSON line of the docker CLI output.
+
+        Args:
+            data (dict): The decoded JSON object.
+
+        Returns:
+            BaseRecord: The record of the Docker object.
+        """
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def id(self) -> str:
+        """The ID of the Docker object."""
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """The name of the Docker object."""
+        raise NotImplementedError()
+
+    @property
+    def archive_name(self) -> str:
+        """The name the archive of the Docker object is saved under, unique among the rows of its table."""
+        return self.name
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """
+        The identity of the table row: the ID of the object and its archive name, which tells
+        the rows of the tags of one image apart. It stays the same when the row is fetched again.
+        """
+        return self.id, self.archive_name
+
+    @abstractmethod
+    def to_row(self) -> list[str]:
+        """
+        Returns the cells of the table row of the record.
+
+        Returns:
+            list[str]: The cells in the order of the headers.
+        """
+        raise NotImplementedError()
+
+
+class ImageRecord(BaseRecord):
+    """A record of a Docker image (one row per repository tag)."""
+    __slots__ = ("image_id", "repository", "tag", "created", "size", "created_at")
+    headers = ("REPOSITORY", "TAG", "IMAGE ID", "CREATED", "SIZE")
+
+    def __init__(
+            self,
+            image_id: str,
+            repository: str,
+            tag: str,
+            created: str,
+            size: str,
+            created_at: Optional[float] = None
+    ):
+        """
+        Initializes the record with the columns of the 'docker images' table and the
+        creation timestamp, from which the age in the CREATED column can be computed again later.
+        """
+        self.image_id: str = image_id
+        self.repository: str = repository
+        self.tag: str = tag
+        self.created: str = created
+        self.size: str = size
+        self.created_at: Optional[float] = created_at
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ImageRecord":
+        """Creates an image record from one JSON line of 'docker images'."""
+        return cls(
+            image_id=data["ID"],
+            repository=data.get("Repository", NONE_VALUE),
+            tag=data.get("Tag", NONE_VALUE),
+            created=data.get("CreatedSince", NONE_VALUE),
+            size=data.get("Size", NONE_VALUE),
+            created_at=parse_created_at(data.get("CreatedAt", EMPTY_STRING))
+        )
+
+    @classmethod
+    def from_inspect(cls, data: dict) -> list["ImageRecord"]:
+        """Creates the records of an image, one per repository tag, from its inspect information."""
+        created_at = parse_timestamp(data.get("Created", EMPTY_STRING))
+        records: list[ImageRecord] = []
+        for repo_tag in data.get("RepoTags") or [NONE_VALUE + COLON + NONE_VALUE]:
+            repository, tag = repo_tag.rsplit(COLON, 1)
+            records.append(cls(
+                image_id=data["Id"].split(COLON)[-1][:12],
+                repository=repository,
+                tag=tag,
+                created=NONE_VALUE if created_at is None else time_ago(created_at),
+                size=human_size(data.get("Size") or 0),
+                created_at=created_at
+            ))
+        return records
+
+    @property
+    def id(self) -> str:
+        """The ID of the image."""
+        return self.image_id
+
+    @property
+    def name(self) -> str:
+        """The name of the image."""
+        return self.repository
+
+    @property
+    def reference(self) -> str:
+        """The 'repository:tag' reference of the image, or its ID if the image is untagged."""
+        if self.repository == NONE_VALUE:
+            return self.image_id
+        return self.repository + COLON + self.tag
+
+    @property
+    def archive_name(self) -> str:
+        """
+        The name the archive of the image is saved under: its reference, because the rows of
+        the tags of one repository and the untagged images share the repository name.
+        """
+        return self.reference
+
+    def to_row(self) -> list[str]:
+        """Returns the cells of the table row of the record."""
+        return [self.repository, self.tag, self.image_id, self.created, self.size]
+
+
+class ContainerRecord(BaseRecord):
+    """A record of a Docker container."""
+    __slots__ = ("container_id", "image", "command", "created", "status", "ports", "names")
+    headers = ("CONTAINER ID", "IMAGE", "COMMAND", "CREATED", "STATUS", "PORTS", "NAMES")
+
+    def __init__(
+            self,
+            container_id: str,
+            image: str,
+            command: str,
+            created: str,
+            status: str,
+            ports: str,
+            names: str
+    ):
+        """Initializes the record with the columns of the 'docker container ls' table."""
+        self.container_id: str = container_id
+        self.image: str = image
+        self.command: str = command
+        self.created: str = created
+        self.status: str = status
+        self.ports: str = ports
+        self.names: str = names
+
+    @classmethod
+    def from_json(cls, data: dict) -> "ContainerRecord":
+        """Creates a container record from one JSON line of 'docker container ls'."""
+        return cls(
+            container_id=data["ID"],
+            image=data.get("Image", EMPTY_STRING),
+            command=data.get("Command", EMPTY_STRING),
+            created=data.get("RunningFor", EMPTY_STRING),
+            status=data.get("Status", EMPTY_STRING),
+            ports=data.get("Ports", EMPTY_STRING),
+            names=data.get("Names", EMPTY_STRING)
+        )
+
+    @property
+    def id(self) -> str:
+        """The ID of the container."""
+        return self.container_id
+
+    @property
+    def name(self) -> str:
+        """The name of the container."""
+        return self.names
+
+    def to_row(self) -> list[str]:
+        """Returns the cells of the table row of the record."""
+        return [self.container_id, self.image, self.command, self.created, self.status, self.ports, self.names]
+
+
+class VolumeRecord(BaseRecord):
+    """A record of a Docker volume, which is identified by its name."""
+    __slots__ = ("driver", "volume_name")
+    headers = ("DRIVER", "VOLUME NAME")
+
+    def __init__(self, driver: str, volume_name: str):
+        """Initializes the record with the columns of the 'docker volume ls' table."""
+        self.driver: str = driver
+        self.volume_name: str = volume_name
+
+    @classmethod
+    def from_json(cls, data: dict) -> "VolumeRecord":
+        """Creates a volume record from one JSON line of 'docker volume ls'."""
+        return cls(driver=data.get("Driver", EMPTY_STRING), volume_name=data["Name"])
+
+    @property
+    def id(self) -> str:
+        """The ID of the volume."""
+        return self.volume_name
+
+    @property
+    def name(self) -> str:
+        """The name of the volume."""
+        return self.volume_name
+
+    def to_row(self) -> list[str]:
+        """Returns the cells of the table row of the record."""
+        return [self.driver, self.volume_name]
+
+
+class Listing:
+    """
+    The records of one Docker objects table.
+
+    The records are indexed by ID once, and the text of the table is rendered
+    only the first time it is needed. A listing can be patched in place, for example
+    from a background thread that follows the Docker events, so the records, the index
+    and the rendered text are always replaced together under a lock.
+    """
+
+    def __init__(self, record_type: type[BaseRecord], records: list[BaseRecord]):
+        """
+        Initializes the listing with the records of the table.
+
+        Args:
+            record_type (type[BaseRecord]): The type of the records.
+            records (list[BaseRecord]): The records in the order of the table rows.
+        """
+        self.record_type: type[BaseRecord] = record_type
+        self.records: list[BaseRecord] = records
+        self.by_id: dict[str, list[BaseRecord]] = self.__index(records)
+        self.__rendered: Optional[tuple[str, list[str]]] = None
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def from_json_lines(cls, record_type: type[BaseRecord], output: str) -> "Listing":
+        """
+        Parses the output of a docker CLI command with the '{{json .}}' format.
+
+        Args:
+            record_type (type[BaseRecord]): The type of the records.
+            output (str): The output of the command, one JSON object per line.
+
+        Returns:
+            Listing: The listing of the parsed records.
+        """
+        return cls(
+            record_type,
+            [record_type.from_json(json.loads(line)) for line in output.splitlines() if line.strip()]
+        )
+
+    @staticmethod
+    def __index(records: list[BaseRecord]) -> dict[str, list[BaseRecord]]:
+        """
+        Indexes the records by the ID of the Docker object.
+
+        Args:
+            records (list[BaseRecord]): The records to index.
+
+        Returns:
+            dict[str, list[BaseRecord]]: The records of every ID (an image has one record per tag).
+        """
+        by_id: dict[str, list[BaseRecord]] = {}
+        for record in records:
+            by_id.setdefault(record.id, []).append(record)
+        return by_id
+
+    def __len__(self) -> int:
+        """Returns the number of rows of the table."""
+        return len(self.records)
+
+    def get(self, index: int) -> Optional[BaseRecord]:
+        """
+        Returns the record of the table row with the given index.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            Optional[BaseRecord]: The record, or None if there is no such row.
+        """
+        records = self.records
+        if 0 <= index < len(records):
+            return records[index]
+        return None
+
+    def patch(self, record_id: str, records: list[BaseRecord]) -> None:
+        """
+        Replaces the rows of a Docker object with new records.
+
+        The new records take the place of the first old row, or are appended
+        if the object is not in the table yet. An empty list removes the object.
+
+        Args:
+            record_id (str): The ID of the Docker object.
+            records (list[BaseRecord]): The new records of the object.
+        """
+        with self.__lock:
+            new_records: list[BaseRecord] = []
+            inserted = False
+            for record in self.records:
+                if record.id != record_id:
+                    new_records.append(record)
+                elif not inserted:
+                    new_records.extend(records)
+                    inserted = True
+            if not inserted:
+                new_records.extend(records)
+            self.records = new_records
+            self.by_id = self.__index(new_records)
+            self.__rendered = None
+
+    def __render(self) -> tuple[str, list[str]]:
+        """
+        Renders the header and the rows of the table, if it has not been done yet.
+
+        Returns:
+            tuple[str, list[str]]: The header line and the lines of the rows.
+        """
+        with self.__lock:
+            if self.__rendered is None:
+                lines = format_table(
+                    list(self.record_type.headers),
+                    [record.to_row() for record in self.records]
+                )
+                self.__rendered = (lines[0], lines[1:])
+            return self.__rendered
+
+    @property
+    def header(self) -> str:
+        """The header line of the table."""
+        return self.__render()[0]
+
+    @property
+    def lines(self) -> list[str]:
+        """The lines of the table rows, one per record."""
+        return self.__render()[1]
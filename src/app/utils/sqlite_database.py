@@ -0,0 +1,82 @@
+"""
+This module provides a lazily opened SQLite database for the caches kept across sessions.
+
+The caches under the user cache directory are only an optimization, so a database that
+cannot be opened or written is turned off and behaves as if it were empty.
+
+Classes:
+- SqliteDatabase: A thread-safe SQLite database that is opened on the first use.
+"""
+import os
+import sqlite3
+import threading
+from typing import Callable, Optional, TypeVar
+
+from ..utils.constants import SQLITE_TIMEOUT
+
+T = TypeVar("T")
+
+
+class SqliteDatabase:
+    """
+    A thread-safe SQLite database that is opened, and whose tables are created, on the first use.
+
+    Attributes:
+        path (str): The path of the database file (the database is disabled if it is empty).
+        schema (tuple[str, ...]): The statements that create the tables.
+    """
+
+    def __init__(self, path: str, schema: tuple[str, ...]):
+        """
+        Initializes the database without opening it.
+
+        Args:
+            path (str): The path of the database file.
+            schema (tuple[str, ...]): The statements that create the tables.
+        """
+        self.path: str = path
+        self.schema: tuple[str, ...] = schema
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__disabled: bool = not path
+        self.__lock = threading.Lock()
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Opens the database and creates its tables, if it has not been done yet.
+
+        Returns:
+            sqlite3.Connection: The connection, shared by all threads under the lock.
+        """
+        if self.__connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+            with connection:
+                for statement in self.schema:
+                    connection.execute(statement)
+            self.__connection = connection
+        return self.__connection
+
+    def run(self, func: Callable[[sqlite3.Connection], T], default: T) -> T:
+        """
+        Runs a function with the connection in one transaction, under the lock.
+
+        Args:
+            func (Callable[[sqlite3.Connection], T]): The function that reads or writes the database.
+            default (T): The result if the database is disabled or fails.
+
+        Returns:
+            T: The result of the function, or the default.
+        """
+        with self.__lock:
+            if self.__disabled:
+                return default
+            try:
+                connection = self.__connect()
+                with connection:
+                    return func(connection)
+            except (sqlite3.Error, OSError):
+                # a broken or read-only cache must not break the application
+                self.__disabled = True
+                return default
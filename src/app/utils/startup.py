@@ -0,0 +1,41 @@
+"""
+This module measures the startup of the application, from the start of main.py to the first frame.
+
+The time of every startup milestone is recorded once, relative to the import of this module,
+which main.py imports before anything else. If the DOCKER_CMD_STARTUP_LOG environment variable
+names a file, every milestone is appended to it as a line '<name> <seconds since start> <unix time>',
+which is what `benchmarks.startup_benchmark` reads.
+
+This module is imported before the rest of the application, so it depends only on the
+standard library and reads its environment variable itself.
+
+Functions:
+- mark: Records a startup milestone.
+"""
+import os
+import time
+
+IMPORTS = "imports"
+MAIN = "main"
+VIEWER_INIT = "viewer_init"
+FIRST_PAINT = "first_paint"
+
+STARTUP_LOG = os.environ.get("DOCKER_CMD_STARTUP_LOG")
+STARTED = time.perf_counter()
+
+marks: dict[str, float] = {}
+
+
+def mark(name: str) -> None:
+    """
+    Records the first time a startup milestone is reached.
+
+    Args:
+        name (str): The name of the milestone, for example FIRST_PAINT.
+    """
+    if name in marks:
+        return
+    marks[name] = time.perf_counter() - STARTED
+    if STARTUP_LOG:
+        with open(STARTUP_LOG, "a") as log:
+            log.write(f"{name} {marks[name]:.6f} {time.time():.6f}\n")
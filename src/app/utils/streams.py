@@ -0,0 +1,393 @@
+"""
+This module provides the pipeline that writes archives streamed by Docker straight to compressed files.
+
+Classes:
+- ParallelGzipCompressor: A pigz-style gzip encoder that compresses independent blocks on a thread pool.
+- TransferMeter: Counts the bytes streamed by concurrent transfers and measures their rate.
+- LineWriter: A binary sink that splits a stream into lines and passes every line to a callback.
+- CompressedFileWriter: A binary sink that compresses a stream on the fly, hashes the result
+  with SHA-256 and writes it to a file, without any intermediate uncompressed file.
+"""
+import collections
+import functools
+import hashlib
+import lzma
+import os
+import struct
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from ..utils.constants import COMPRESSION, COMPRESSION_THREADS, GZIP_BLOCK_SIZE, GZIP_WINDOW_SIZE, GZIP_LEVEL, MIN_ELAPSED_TIME, RATE_SUFFIX, SLASH, COLON, UNDERSCORE, SPACE, END_OF_LINE, ARCHIVE_IN_USE_TEXT, BUNDLE_NAME, BUNDLE_ID_LENGTH
+from ..utils.enams import Compressions, Extensions
+from ..utils.formatters import human_size
+
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+@functools.lru_cache
+def get_compression_pool(threads: int = COMPRESSION_THREADS) -> ThreadPoolExecutor:
+    """
+    Returns the thread pool shared by all parallel compressors.
+
+    Args:
+        threads (int): The number of compression threads.
+
+    Returns:
+        ThreadPoolExecutor: The shared pool.
+    """
+    return ThreadPoolExecutor(max_workers=max(1, threads))
+
+
+def deflate_block(data: bytes, dictionary: bytes, level: int, last: bool) -> bytes:
+    """
+    Compresses one block of a gzip stream into raw deflate data.
+
+    The block is primed with the end of the previous block, so the ratio is
+    close to the one of a single-threaded stream. A block that is not the last one
+    ends with a sync flush on a byte boundary, so the blocks can be concatenated.
+
+    Args:
+        data (bytes): The uncompressed block.
+        dictionary (bytes): Up to 32KiB of the data before the block.
+        level (int): The compression level.
+        last (bool): Whether the block ends the stream.
+
+    Returns:
+        bytes: The raw deflate data of the block.
+    """
+    if dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipCompressor:
+    """
+    A gzip encoder that compresses the stream in independent blocks on a thread pool, like pigz.
+
+    zlib releases the GIL while compressing, so the blocks are compressed in parallel,
+    and their raw deflate data is concatenated in order into one standard gzip member.
+    It has the interface of the zlib compression objects: `compress` returns the
+    compressed data that is ready so far and `flush` finishes the stream.
+    """
+
+    def __init__(
+            self,
+            level: int = GZIP_LEVEL,
+            threads: int = COMPRESSION_THREADS,
+            block_size: int = GZIP_BLOCK_SIZE
+    ):
+        """
+        Initializes the compressor.
+
+        Args:
+            level (int): The compression level.
+            threads (int): The number of compression threads.
+            block_size (int): The size of the uncompressed blocks.
+        """
+        self.level: int = level
+        self.block_size: int = block_size
+        self.max_pending: int = 2 * max(1, threads)
+        self.__pool: ThreadPoolExecutor = get_compression_pool(threads)
+        self.__pending: collections.deque[Future] = collections.deque()
+        self.__buffer = bytearray()
+        self.__dictionary = b""
+        self.__crc: int = zlib.crc32(b"")
+        self.__size: int = 0
+        self.__header_written = False
+
+    def __submit(self, block: bytes, last: bool) -> None:
+        """Submits one block for compression and remembers the end of it as the next dictionary."""
+        self.__crc = zlib.crc32(block, self.__crc)
+        self.__size += len(block)
+        self.__pending.append(self.__pool.submit(deflate_block, block, self.__dictionary, self.level, last))
+        self.__dictionary = block[-GZIP_WINDOW_SIZE:]
+
+    def __collect(self, wait_all: bool) -> bytes:
+        """
+        Collects the compressed blocks in order.
+
+        Args:
+            wait_all (bool): Whether to wait for every pending block, or only for the blocks
+                             over the limit of pending blocks.
+
+        Returns:
+            bytes: The compressed data of the collected blocks.
+        """
+        output = bytearray()
+        if not self.__header_written:
+            output += GZIP_HEADER
+            self.__header_written = True
+        while self.__pending and (
+                wait_all or self.__pending[0].done() or len(self.__pending) > self.max_pending
+        ):
+            output += self.__pending.popleft().result()
+        return bytes(output)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Adds data to the stream.
+
+        Args:
+            data (bytes): The uncompressed data.
+
+        Returns:
+            bytes: The compressed data that is ready so far.
+        """
+        self.__buffer += data
+        while len(self.__buffer) >= self.block_size:
+            self.__submit(bytes(self.__buffer[:self.block_size]), last=False)
+            del self.__buffer[:self.block_size]
+        return self.__collect(wait_all=False)
+
+    def flush(self) -> bytes:
+        """
+        Finishes the stream.
+
+        Returns:
+            bytes: The rest of the compressed data with the gzip trailer.
+        """
+        self.__submit(bytes(self.__buffer), last=True)
+        self.__buffer.clear()
+        return self.__collect(wait_all=True) + struct.pack("<II", self.__crc, self.__size & 0xFFFFFFFF)
+
+
+def gzip_compressor(threads: int = COMPRESSION_THREADS):
+    """
+    Creates a gzip encoder, compressing in parallel blocks if more than one thread is configured.
+
+    Args:
+        threads (int): The number of compression threads.
+
+    Returns:
+        The zlib compression object or the ParallelGzipCompressor.
+    """
+    if threads > 1:
+        return ParallelGzipCompressor(threads=threads)
+    return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+COMPRESSORS_DICT: dict[Compressions, Callable] = {
+    Compressions.GZIP: gzip_compressor,
+    Compressions.XZ: lzma.LZMACompressor
+}
+COMPRESSION_EXTENSIONS_DICT: dict[Compressions, str] = {
+    Compressions.NONE: Extensions.TAR_EXTENSION,
+    Compressions.GZIP: Extensions.TAR_EXTENSION + Extensions.GZIP_EXTENSION,
+    Compressions.XZ: Extensions.TAR_EXTENSION + Extensions.XZ_EXTENSION
+}
+
+
+def archive_file_name(name: str, compression: Compressions = COMPRESSION) -> str:
+    """
+    Builds the name of the archive of a Docker object.
+
+    Args:
+        name (str): The archive name of the Docker object, for example 'library/nginx:latest'.
+        compression (Compressions): The compression of the archive.
+
+    Returns:
+        str: The file name, for example 'library_nginx_latest.tar.gz'.
+    """
+    return name.replace(SLASH, UNDERSCORE).replace(COLON, UNDERSCORE) + COMPRESSION_EXTENSIONS_DICT[compression]
+
+
+def bundle_name(references: list[str]) -> str:
+    """
+    Builds the name of a bundle of Docker images from a hash of their references, so every
+    selection of images has its own bundle and saving the same selection twice meets the same file.
+
+    Args:
+        references (list[str]): The references or IDs of the images.
+
+    Returns:
+        str: The name without extension, for example 'bundle_1a2b3c4d5e6f'.
+    """
+    digest = hashlib.sha256(END_OF_LINE.join(sorted(set(references))).encode()).hexdigest()
+    return BUNDLE_NAME + UNDERSCORE + digest[:BUNDLE_ID_LENGTH]
+
+
+class TransferMeter:
+    """
+    Counts the bytes streamed by one or more concurrent transfers.
+
+    Attributes:
+        total (int): The number of bytes streamed so far.
+        started (float): The monotonic time the meter was created at.
+    """
+
+    def __init__(self):
+        """Initializes an empty meter starting now."""
+        self.total: int = 0
+        self.started: float = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def add(self, size: int) -> None:
+        """
+        Adds streamed bytes to the meter.
+
+        Args:
+            size (int): The number of streamed bytes.
+        """
+        with self.__lock:
+            self.total += size
+
+    @property
+    def rate(self) -> float:
+        """The average number of bytes streamed per second."""
+        return self.total / max(time.monotonic() - self.started, MIN_ELAPSED_TIME)
+
+    def __str__(self) -> str:
+        """Returns the streamed size with the rate, for example '1.2GB 85.3MB/s'."""
+        return human_size(self.total) + SPACE + human_size(self.rate) + RATE_SUFFIX
+
+
+class LineWriter:
+    """
+    A binary sink that splits the written stream into text lines, for progress output
+    that is read while the command producing it is still running.
+    """
+
+    def __init__(self, on_line: Callable[[str], None]):
+        """
+        Initializes the sink.
+
+        Args:
+            on_line (Callable[[str], None]): Called with every complete line, without the line break.
+        """
+        self.on_line: Callable[[str], None] = on_line
+        self.__buffer = bytearray()
+
+    def write(self, chunk: bytes) -> int:
+        """
+        Passes the complete lines of the stream to the callback and keeps the incomplete rest.
+
+        Args:
+            chunk (bytes): The next piece of the stream.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        self.__buffer += chunk
+        *lines, rest = self.__buffer.split(END_OF_LINE.encode())
+        self.__buffer = bytearray(rest)
+        for line in lines:
+            if line.strip():
+                self.on_line(line.decode(errors="replace"))
+        return len(chunk)
+
+    def flush(self) -> None:
+        """Passes the last line of the stream to the callback, if it did not end with a line break."""
+        if self.__buffer.strip():
+            self.on_line(self.__buffer.decode(errors="replace"))
+        self.__buffer.clear()
+
+
+class CompressedFileWriter:
+    """
+    A binary sink that compresses the written stream and writes it straight to a file.
+
+    The SHA-256 of the written file is computed on the way and saved next to it
+    in a file with the SHA-256 extension, in the format of 'sha256sum'. If the stream
+    fails, the incomplete file is removed. Only one writer at a time may write a file:
+    a second writer of a file that is being written fails to open.
+
+    Usage:
+        with CompressedFileWriter("nginx.tar.gz") as output:
+            docker_communicator.save_image(image_id, output)
+    """
+    __paths_in_use: set[str] = set()
+    __paths_lock = threading.Lock()
+
+    def __init__(
+            self,
+            file_name: str,
+            compression: Compressions = COMPRESSION,
+            meter: Optional[TransferMeter] = None
+    ):
+        """
+        Initializes the writer.
+
+        Args:
+            file_name (str): The name of the compressed file.
+            compression (Compressions): The compression of the stream.
+            meter (Optional[TransferMeter]): The meter that counts the uncompressed bytes.
+        """
+        self.file_name: str = file_name
+        self.compression: Compressions = compression
+        self.meter: Optional[TransferMeter] = meter
+        self.sha256 = hashlib.sha256()
+        self.__compressor = None
+        self.__file = None
+
+    def __enter__(self) -> "CompressedFileWriter":
+        """
+        Opens the file and the encoder.
+
+        Raises:
+            FileExistsError: If another writer is writing the file.
+            OSError: If the file cannot be opened.
+        """
+        path = os.path.abspath(self.file_name)
+        with CompressedFileWriter.__paths_lock:
+            if path in CompressedFileWriter.__paths_in_use:
+                raise FileExistsError(ARCHIVE_IN_USE_TEXT.format(file_name=self.file_name))
+            CompressedFileWriter.__paths_in_use.add(path)
+        try:
+            compressor_factory: Optional[Callable] = COMPRESSORS_DICT.get(self.compression)
+            self.__compressor = compressor_factory() if compressor_factory else None
+            self.__file = open(self.file_name, "wb")
+        except BaseException:
+            self.__release()
+            raise
+        return self
+
+    def __release(self) -> None:
+        """Lets other writers write the file."""
+        with CompressedFileWriter.__paths_lock:
+            CompressedFileWriter.__paths_in_use.discard(os.path.abspath(self.file_name))
+
+    def __write_compressed(self, data: bytes) -> None:
+        """Hashes and writes already compressed data."""
+        if data:
+            self.sha256.update(data)
+            self.__file.write(data)
+
+    def write(self, chunk: bytes) -> int:
+        """
+        Compresses a chunk of the stream and writes it to the file.
+
+        Args:
+            chunk (bytes): The uncompressed chunk.
+
+        Returns:
+            int: The number of consumed bytes.
+        """
+        if self.meter:
+            self.meter.add(len(chunk))
+        self.__write_compressed(self.__compressor.compress(chunk) if self.__compressor else chunk)
+        return len(chunk)
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Finishes the file and writes its checksum, or removes it if the stream failed.
+        """
+        try:
+            try:
+                if exc_type is None and self.__compressor:
+                    self.__write_compressed(self.__compressor.flush())
+            finally:
+                self.__file.close()
+            if exc_type is not None:
+                os.remove(self.file_name)
+                return
+            with open(self.file_name + Extensions.SHA256_EXTENSION, "w") as checksum_file:
+                checksum_file.write(
+                    self.sha256.hexdigest() + SPACE * 2 + os.path.basename(self.file_name) + END_OF_LINE
+                )
+        finally:
+            self.__release()
@@ -0,0 +1,227 @@
+"""
+This module provides an in-memory index of all tags of a Docker Hub repository, for filtering them locally.
+
+Repositories like 'library/node' have thousands of tags over dozens of pages. The index fetches
+all pages of tags concurrently in a background thread, so the tag viewer can match the typed
+text against every tag of the repository without a request per key press.
+
+Classes:
+- TagIndex: The tags of one repository, fetched in the background, with substring and fuzzy matching.
+"""
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from ..exeptions.exeptions import DockerApiError, DockerApiRateLimitError
+from ..utils.constants import PAGE_SIZE, START_PAGE_NUMBER, TAG_INDEX_WORKERS, EMPTY_STRING
+from ..utils.enams import TagSortOrders
+from ..utils.hints import Tag, TagResponse
+
+# the score of a tag: substring matches come before fuzzy ones, then earlier and tighter matches
+Score = tuple[int, int, int]
+SUBSTRING_MATCH = 0
+FUZZY_MATCH = 1
+
+
+class TagIndex:
+    """
+    The tags of one repository, fetched page by page on a pool of threads.
+
+    The tags can be searched while the index is being built: a search covers the pages fetched so far,
+    and `version` changes with every fetched page, so the viewer knows when to search again.
+
+    Attributes:
+        total_pages (Optional[int]): The number of pages of tags, or None until the first page is fetched.
+        failed_pages (int): The number of pages that could not be fetched.
+        version (int): The number of pages fetched so far.
+    """
+
+    def __init__(
+            self,
+            fetch_page: Callable[[int], TagResponse],
+            first_page: Optional[TagResponse] = None,
+            workers: int = TAG_INDEX_WORKERS
+    ):
+        """
+        Initializes an empty index; the pages are fetched by `start`.
+
+        Args:
+            fetch_page (Callable[[int], TagResponse]): Fetches a page of tags by its number.
+            first_page (Optional[TagResponse]): The first page, if it has been fetched already.
+            workers (int): The number of pages fetched at the same time.
+        """
+        self.total_pages: Optional[int] = None
+        self.failed_pages: int = 0
+        self.version: int = 0
+        self.__fetch_page: Callable[[int], TagResponse] = fetch_page
+        self.__first_page: Optional[TagResponse] = first_page
+        self.__workers: int = max(1, workers)
+        self.__pages: dict[int, list[tuple[str, Tag]]] = {}
+        self.__tags: Optional[list[tuple[str, Tag]]] = None
+        self.__last_search: Optional[tuple[str, int, list[tuple[Score, str, Tag]]]] = None
+        self.__started: bool = False
+        self.__lock = threading.Lock()
+
+    @property
+    def loaded_pages(self) -> int:
+        """The number of pages fetched so far."""
+        with self.__lock:
+            return len(self.__pages)
+
+    @property
+    def complete(self) -> bool:
+        """Whether all pages have been fetched or have failed."""
+        with self.__lock:
+            return self.total_pages is not None and len(self.__pages) + self.failed_pages >= self.total_pages
+
+    def start(self) -> None:
+        """Starts fetching the pages in a background thread, unless it has been started already."""
+        with self.__lock:
+            if self.__started:
+                return
+            self.__started = True
+        threading.Thread(target=self.__build, daemon=True, name="tag-index").start()
+
+    def __fetch(self, page: int) -> Optional[TagResponse]:
+        """
+        Fetches a page, waiting for the Docker Hub budget as long as it is spent.
+
+        Args:
+            page (int): The page number.
+
+        Returns:
+            Optional[TagResponse]: The page, or None if it could not be fetched.
+        """
+        while True:
+            try:
+                return self.__fetch_page(page)
+            except DockerApiRateLimitError as error:
+                time.sleep(error.retry_after)
+            except (DockerApiError, OSError):
+                return None
+
+    def __add(self, page: int, data: Optional[TagResponse]) -> None:
+        """
+        Adds the tags of a fetched page, or counts the page as failed.
+
+        Args:
+            page (int): The page number.
+            data (Optional[TagResponse]): The page, or None if it could not be fetched.
+        """
+        with self.__lock:
+            if data is None:
+                self.failed_pages += 1
+                return
+            self.__pages[page] = [(tag['name'].lower(), tag) for tag in data['results']]
+            self.__tags = None
+            self.version += 1
+
+    def __load(self, page: int, data: Optional[TagResponse] = None) -> None:
+        """
+        Fetches a page, unless it has been fetched already, and adds its tags to the index.
+
+        A page that can not be read, for example one without 'results', is counted as failed,
+        so that the index still becomes complete.
+
+        Args:
+            page (int): The page number.
+            data (Optional[TagResponse]): The page, if it has been fetched already.
+        """
+        try:
+            self.__add(page, data or self.__fetch(page))
+        except Exception:
+            self.__add(page, None)
+
+    @staticmethod
+    def __count_pages(first_page: Optional[TagResponse]) -> int:
+        """Returns the number of pages of tags from the count in the first page, 1 if it is unknown."""
+        try:
+            return max(1, math.ceil(first_page['count'] / PAGE_SIZE))
+        except (KeyError, TypeError, ValueError):
+            return 1
+
+    def __build(self) -> None:
+        """Fetches the first page for the number of pages, then the other pages concurrently."""
+        first_page = self.__first_page or self.__fetch(START_PAGE_NUMBER)
+        with self.__lock:
+            self.total_pages = self.__count_pages(first_page)
+        if first_page is None:
+            self.__add(START_PAGE_NUMBER, None)
+        else:
+            self.__load(START_PAGE_NUMBER, first_page)
+        with ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix="tag-index") as executor:
+            # every page is added as soon as it arrives, so the tags can be searched meanwhile
+            executor.map(self.__load, range(START_PAGE_NUMBER + 1, self.total_pages + 1))
+
+    def __get_tags(self) -> list[tuple[str, Tag]]:
+        """Returns the lowercase names and the tags fetched so far, in the order of the pages."""
+        with self.__lock:
+            if self.__tags is None:
+                self.__tags = [tag for page in sorted(self.__pages) for tag in self.__pages[page]]
+            return self.__tags
+
+    @staticmethod
+    def __score(name: str, pattern: str) -> Optional[Score]:
+        """
+        Matches a lowercase tag name against a lowercase pattern.
+
+        Args:
+            name (str): The tag name.
+            pattern (str): The pattern.
+
+        Returns:
+            Optional[Score]: The score of the match (lower is better), or None if the name does not match:
+                             the position of the pattern in the name, or, if the characters of the
+                             pattern appear in the name only apart, the length of the part they span.
+        """
+        position = name.find(pattern)
+        if position >= 0:
+            return SUBSTRING_MATCH, position, len(name)
+        start = end = name.find(pattern[0])
+        if start < 0:
+            return None
+        for char in pattern[1:]:
+            end = name.find(char, end + 1)
+            if end < 0:
+                return None
+        return FUZZY_MATCH, end - start, len(name)
+
+    def search(self, pattern: str, order: TagSortOrders = TagSortOrders.RELEVANCE) -> list[Tag]:
+        """
+        Finds the fetched tags whose name contains the pattern, or its characters in the same order.
+
+        A search for a pattern that extends the previous one, when no page has been fetched
+        in between, only checks the tags that matched the previous one.
+
+        Args:
+            pattern (str): The pattern, matched case-insensitively; all tags match an empty one.
+            order (TagSortOrders): The order of the tags: by relevance (substring matches first,
+                                   then Docker Hub's order), newest or largest first.
+
+        Returns:
+            list[Tag]: The matching tags.
+        """
+        pattern = pattern.lower()
+        version = self.version
+        if self.__last_search and pattern.startswith(self.__last_search[0]) and version == self.__last_search[1]:
+            # the matches of an extended pattern are among the matches of the pattern
+            candidates = [(name, tag) for _, name, tag in self.__last_search[2]]
+        else:
+            candidates = self.__get_tags()
+        if pattern:
+            matches = [
+                (score, name, tag) for name, tag in candidates
+                if (score := self.__score(name, pattern)) is not None
+            ]
+        else:
+            matches = [((SUBSTRING_MATCH, 0, 0), name, tag) for name, tag in candidates]
+        self.__last_search = (pattern, version, matches)
+
+        tags = [tag for _, _, tag in matches]
+        if order is TagSortOrders.LAST_UPDATED:
+            return sorted(tags, key=lambda tag: tag.get('last_updated') or EMPTY_STRING, reverse=True)
+        if order is TagSortOrders.FULL_SIZE:
+            return sorted(tags, key=lambda tag: tag.get('full_size') or 0, reverse=True)
+        return [tag for _, _, tag in sorted(matches, key=lambda match: match[0])]
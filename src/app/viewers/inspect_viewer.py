@@ -10,6 +10,7 @@ from .base import ABSViewer
 from ..utils.constants import *
 from ..utils.enams import Steps
 from ..utils.index import ObjIndex
+from ..utils.json_tree import JsonTree, JsonValue
 from ..utils.mixins import MenuMixin, TablesMixin
 
 
@@ -20,20 +21,24 @@ class InspectViewer(ABSViewer, MenuMixin, TablesMixin):
     This class inherits from ABSViewer and MenuMixin, providing functionality
     to visualize the inspection data of Docker containers or images in a terminal
     interface using the curses library.
+
+    The data is shown as a tree with collapsed objects and arrays: ENTER or SPACE
+    expands or collapses the object under the cursor, RIGHT expands it and LEFT
+    collapses it or moves the cursor to the enclosing object.
     """
 
-    def __init__(self, screen: curses.window, tables: list[str], obj_name: str):
+    def __init__(self, screen: curses.window, data: JsonValue, obj_name: str):
         """
         Initializes the InspectViewer with the given screen and inspection data.
 
         Args:
             screen (curses.window): The curses window object for rendering.
-            tables list[str]: The list of strings containing inspection data.
+            data (JsonValue): The parsed inspection data.
             obj_name (str): The name of the Docker object being inspected.
         """
         self.stdscr = screen
         self.obj_name: str = obj_name
-        self.tables: list[str] = tables
+        self.tables: JsonTree = JsonTree(data)
         self.index: ObjIndex = ObjIndex()
         self.key_steps_dict: dict[int, Steps] = KEY_STEPS_DICT
 
@@ -61,12 +66,23 @@ class InspectViewer(ABSViewer, MenuMixin, TablesMixin):
         elif self.index.value < 0:
             self.index.value = max_value
 
+    def collapse(self) -> None:
+        """
+        Collapses the object under the cursor, or moves the cursor to the enclosing object
+        if the object under the cursor is not expanded.
+        """
+        if self.tables.nodes[self.index.value].expanded:
+            self.tables.collapse(self.index.value)
+        else:
+            self.index.value = self.tables.parent_index(self.index.value)
+
     def run(self):
         """
         Runs the main loop for the InspectViewer, handling user input and rendering.
 
         This method continuously refreshes the screen, displays the menu and
-        inspection tables, and processes user input for navigation and exit.
+        inspection tables, and processes user input for navigation, expanding
+        and collapsing, and exit.
         """
         while True:
             try:
@@ -87,8 +103,14 @@ class InspectViewer(ABSViewer, MenuMixin, TablesMixin):
                 if char in (curses.KEY_DOWN, curses.KEY_UP):
                     self.change_index(char)
 
-            except KeyboardInterrupt:
-                return
+                if char in (KEY_ENTER, KEY_SPASE):
+                    self.tables.toggle(self.index.value)
 
+                if char == curses.KEY_RIGHT:
+                    self.tables.expand(self.index.value)
 
+                if char == curses.KEY_LEFT:
+                    self.collapse()
 
+            except KeyboardInterrupt:
+                return
@@ -10,24 +10,29 @@ for terminal-based user interaction. It maintains indexes and lists for tracking
 Docker entities and user choices. A variety of dictionaries are used for
 mapping user choices to appropriate methods, indexes, and lists.
 """
+import json
 import platform
-import urllib.error
-from typing import Callable, Tuple
+import threading
+from typing import Callable, Optional
 
 from .base import ABSViewer
-from .get_new_name_viewer import GetNewNameViewer
-from .inspect_viewer import InspectViewer
-from .search_image_viewer import SearchImageViewer
-from ..docker_communicators.docker_comunicator import docker_communicator, DockerCommunicator
-from ..exeptions.exeptions import DockerNotRunningError, DockerApiError
+from ..docker_communicators.docker_comunicator import ABCDockerCommunicator
+from ..docker_communicators.docker_events import DockerEventsListener
+from ..docker_communicators.factory import get_docker_communicator
+from ..exeptions.exeptions import DockerNotRunningError, DockerApiError, DockerCommandError
 from ..menu_table.menu_table import menu_table, MenuTable
+from ..utils import startup
 from ..utils.constants import *
-from ..utils.enams import Colors, OperatingSystems, MenuChoice, IdIndexes, NameIndexes, Steps, Extensions
+from ..utils.enams import Colors, OperatingSystems, MenuChoice, MenuChoiceNames, Steps, Extensions
+from ..utils.executor import BulkExecutor, BulkResult
+from ..utils.jobs import Job, JobQueue
 from ..utils.index import ObjIndex
-from ..utils.mixins import UrlMixin
+from ..utils.pull_progress import PullProgress, summarize
+from ..utils.records import Listing, BaseRecord
+from ..utils.streams import CompressedFileWriter, TransferMeter, archive_file_name, bundle_name
 
 
-class Viewer(ABSViewer, UrlMixin):
+class Viewer(ABSViewer):
     """
     The Viewer class represents a viewers for Docker images and containers.
     """
@@ -42,16 +47,18 @@ class Viewer(ABSViewer, UrlMixin):
         self.stdscr: curses.window = stdscr
         self.underline_color: int = curses.A_BLINK if self.is_windows() else curses.A_DIM
 
-        self.docker_communicator: DockerCommunicator = docker_communicator
+        self.docker_communicator: ABCDockerCommunicator = get_docker_communicator()
         self.menu_table: MenuTable = menu_table
 
         self.image_index: ObjIndex = ObjIndex()
         self.container_index: ObjIndex = ObjIndex()
         self.volume_index: ObjIndex = ObjIndex()
 
-        self.underlined_images: list[int] = list()
-        self.underlined_containers: list[int] = list()
-        self.underlined_volumes: list[int] = list()
+        # the selected rows are kept by their keys, because the records are replaced by
+        # every event patch and refetch of the tables
+        self.underlined_images: set[tuple[str, str]] = set()
+        self.underlined_containers: set[tuple[str, str]] = set()
+        self.underlined_volumes: set[tuple[str, str]] = set()
 
         self.choice_tables_func_dict: dict[MenuChoice, Callable] = {
             MenuChoice.IMAGES: self.docker_communicator.images,
@@ -59,16 +66,15 @@ class Viewer(ABSViewer, UrlMixin):
             MenuChoice.VOLUMES: self.docker_communicator.volumes
         }
         self.choice_delete_func_dict: dict[MenuChoice, Callable] = {
-            MenuChoice.IMAGES: self.docker_communicator.delete_image,
-            MenuChoice.CONTAINERS: self.docker_communicator.delete_container,
-            MenuChoice.VOLUMES: self.docker_communicator.delete_volume_by_name
+            MenuChoice.IMAGES: self.docker_communicator.delete_images,
+            MenuChoice.CONTAINERS: self.docker_communicator.delete_containers,
+            MenuChoice.VOLUMES: self.docker_communicator.delete_volumes_by_name
         }
         self.choice_save_func_dict: dict[MenuChoice, Callable] = {
             MenuChoice.IMAGES: self.docker_communicator.save_image,
-            MenuChoice.CONTAINERS: self.docker_communicator.export_container,
-            MenuChoice.VOLUMES: self.docker_communicator.tar_volume_by_name
+            MenuChoice.CONTAINERS: self.docker_communicator.export_container
         }
-        self.choice_underlines_dict: dict[MenuChoice, list[int]] = {
+        self.choice_underlines_dict: dict[MenuChoice, set[tuple[str, str]]] = {
             MenuChoice.IMAGES: self.underlined_images,
             MenuChoice.CONTAINERS: self.underlined_containers,
             MenuChoice.VOLUMES: self.underlined_volumes
@@ -78,28 +84,35 @@ class Viewer(ABSViewer, UrlMixin):
             MenuChoice.CONTAINERS: self.container_index,
             MenuChoice.VOLUMES: self.volume_index
         }
-        self.choice_id_index_dict: dict[MenuChoice, IdIndexes] = {
-            MenuChoice.IMAGES: IdIndexes.IMAGE_ID_INDEX,
-            MenuChoice.CONTAINERS: IdIndexes.CONTAINER_ID_INDEX,
-            MenuChoice.VOLUMES: IdIndexes.VOLUME_ID_INDEX
-        }
-        self.choice_name_index_dict: dict[MenuChoice, NameIndexes] = {
-            MenuChoice.IMAGES: NameIndexes.IMAGE_NAME_INDEX,
-            MenuChoice.CONTAINERS: NameIndexes.CONTAINER_NAME_INDEX,
-            MenuChoice.VOLUMES: NameIndexes.VOLUME_NAME_INDEX
-        }
         self.choice_rename_unc_dict: dict[MenuChoice, Callable] = {
             MenuChoice.IMAGES: self.docker_communicator.image_rename,
             MenuChoice.CONTAINERS: self.docker_communicator.container_rename,
             MenuChoice.VOLUMES: self.docker_communicator.volume_rename
         }
-        self.index_number_of_objects_func_list: list[Tuple[ObjIndex, Callable]] = [
-            (self.image_index, self.get_number_of_images),
-            (self.container_index, self.get_number_of_containers),
-            (self.volume_index, self.get_number_of_volumes)
-        ]
         self.key_steps_dict: dict[int, Steps] = KEY_STEPS_DICT
 
+        self.bulk_executor: BulkExecutor = BulkExecutor()
+        self.job_queue: JobQueue = JobQueue()
+        self.jobs_expanded: bool = False
+        self.prefetch_pending: bool = True
+        # the images table of the last session is shown until the current one is fetched
+        self.images_restored: bool = self.docker_communicator.restore_images()
+        self.visible_ids: list[str] = []
+        self.inspect_prefetch: Optional[threading.Thread] = None
+        self.events_listener: DockerEventsListener = DockerEventsListener(self.docker_communicator)
+        self.events_listener.start()
+
+        self.choice_remove_rows_dict: dict[MenuChoice, Callable[[str, dict], None]] = {
+            MenuChoice.IMAGES: self.events_listener.remove_image,
+            MenuChoice.CONTAINERS: self.events_listener.remove_container,
+            MenuChoice.VOLUMES: self.events_listener.remove_volume
+        }
+        self.choice_rename_rows_dict: dict[MenuChoice, Callable[[BaseRecord, str], None]] = {
+            MenuChoice.IMAGES: lambda record, new_name: self.events_listener.add_image(new_name, {}),
+            MenuChoice.CONTAINERS: lambda record, new_name: self.events_listener.refresh_container(record.id, {}),
+            MenuChoice.VOLUMES: lambda record, new_name: self.events_listener.refresh_volume(new_name, {})
+        }
+
     @staticmethod
     def is_windows() -> bool:
         """
@@ -110,51 +123,88 @@ class Viewer(ABSViewer, UrlMixin):
         """
         return platform.system() == OperatingSystems.WINDOWS
 
-    def get_number_of_images(self) -> int:
+    def check_indexes(self):
         """
-        Gets the number of Docker images.
+        Checks and adjusts the selected index of the current tab to ensure it is within the valid range.
 
-        Returns:
-        - The number of Docker images.
+        Only the listing of the current tab is used, so the listings of the other tabs
+        are not fetched.
         """
-        return len(self.docker_communicator.images().split(END_OF_LINE))
+        index: ObjIndex = self.choice_index_dict[self.menu_table.choice]
+        last_index = len(self.get_tables()) - 1
+        if index.value > last_index:
+            index.clear()
+        if index.value < 0:
+            index.value = last_index
 
-    def get_number_of_containers(self) -> int:
+    def prefetch(self):
         """
-        Gets the number of Docker containers.
+        Fetches the listings of the tabs that are not shown into the cache in a background thread,
+        so switching to them does not wait for Docker. If the images table of the last session
+        is shown, the current one is fetched first and replaces it.
 
-        Returns:
-        - The number of Docker containers.
+        Failures are ignored: the listing of a tab is then fetched when the tab is shown.
         """
-        return len(self.docker_communicator.containers().split(END_OF_LINE))
+        funcs: list[Callable] = [
+            func for choice, func in self.choice_tables_func_dict.items() if choice != self.menu_table.choice
+        ]
+        if self.images_restored:
+            self.images_restored = False
+            funcs.insert(0, self.docker_communicator.refresh_images)
+
+        def run():
+            for func in funcs:
+                try:
+                    func()
+                except (DockerNotRunningError, DockerCommandError, OSError, ValueError):
+                    # a traceback of this thread would be printed over the screen
+                    continue
+
+        threading.Thread(target=run, daemon=True, name="prefetch").start()
 
-    def get_number_of_volumes(self) -> int:
+    def prefetch_inspect(self):
         """
-        Gets the number of Docker volumes.
+        Fetches the inspect information of the rows on the screen into the cache in a background
+        thread with one batched call, so inspecting any of them is instant.
 
-        Returns:
-        - The number of Docker containers.
+        Called while the user is idle. Only one prefetch runs at a time, and rows that are
+        already cached are skipped by the Docker communicator.
         """
-        return len(self.docker_communicator.volumes().split(END_OF_LINE))
+        if self.menu_table.choice not in (MenuChoice.IMAGES, MenuChoice.CONTAINERS) or not self.visible_ids:
+            return
+        if self.inspect_prefetch is not None and self.inspect_prefetch.is_alive():
+            return
+        self.inspect_prefetch = threading.Thread(
+            target=self.docker_communicator.inspect_many,
+            args=(list(self.visible_ids),),
+            daemon=True,
+            name="inspect-prefetch"
+        )
+        self.inspect_prefetch.start()
 
-    def check_indexes(self):
+    def is_live(self) -> bool:
         """
-        Checks and adjusts the selected Docker entity indexes to ensure they are within valid ranges.
+        Checks if the tables are kept up to date by the Docker events listener.
+
+        Returns:
+        - A boolean value indicating whether the events listener is running.
         """
-        for ind, func in self.index_number_of_objects_func_list:
-            last_index = func() - 3
-            if ind.value > last_index:
-                ind.clear()
-            if ind.value < 0:
-                ind.value = last_index
+        return self.events_listener.is_alive()
 
-    def update(self):
+    def update(self, refresh: bool = True):
         """
-        Updates the viewers by clearing the cache,
+        Updates the viewers by clearing the whole cache,
         resetting the selected Docker entity indexes,
         and clearing the underlined images, containers and volumes.
+        After a refresh, the tabs that are not shown are prefetched again after the next paint.
+
+        Parameters:
+        - refresh: Whether to clear the cache. Without it the tables are kept
+          up to date only by the Docker events listener.
         """
-        self.docker_communicator.cache_clear()
+        if refresh:
+            self.docker_communicator.cache_clear()
+            self.prefetch_pending = True
         self.image_index.clear()
         self.container_index.clear()
         self.volume_index.clear()
@@ -163,12 +213,12 @@ class Viewer(ABSViewer, UrlMixin):
         self.underlined_containers.clear()
         self.underlined_volumes.clear()
 
-    def get_tables(self) -> str:
+    def get_tables(self) -> Listing:
         """
         Gets the tables of the selected Docker entity based on the current choice.
 
         Returns:
-        - A string representation of the Docker images or containers table.
+        - The listing of the Docker images, containers or volumes.
         """
         return self.choice_tables_func_dict[self.menu_table.choice]()
 
@@ -227,45 +277,81 @@ class Viewer(ABSViewer, UrlMixin):
         """
         Displays the main table of the selected Docker entity based on the current choice in the terminal window.
         """
-        tables: list[str] = self.get_tables().split(END_OF_LINE)
+        listing: Listing = self.get_tables()
         cursor_index: int = self.get_index()
-        underline_indexes: list[int] = self.choice_underlines_dict[self.menu_table.choice]
+        underlined: set[tuple[str, str]] = self.choice_underlines_dict[self.menu_table.choice]
+
+        jobs_panel: list[str] = self.get_jobs_panel()
 
         height, width = self.stdscr.getmaxyx()
-        headers = tables.pop(0)
-        self.stdscr.addstr(headers + END_OF_LINE)
+        self.stdscr.addstr(listing.header + END_OF_LINE)
 
+        # the jobs panel takes rows from the table, so the scroll follows the reduced height
         start = 0
-        end = height - 9
+        end = height - 9 - len(jobs_panel)
 
         if cursor_index > end:
-            start = cursor_index - height + 10
+            start = max(0, cursor_index - end)
             end = start + end
 
-        for ind, table in enumerate(tables):
-            if ind < start:
-                continue
-            if ind > end:
-                break
+        records: list[BaseRecord] = listing.records
+        self.visible_ids = [record.id for record in records[start:end + 1]]
+        for ind, table in enumerate(listing.lines[start:end + 1], start):
             if ind == cursor_index:
                 self.stdscr.addstr(table[:width-8], curses.color_pair(Colors.WHITE_ON_YELLOW))
-            elif ind in underline_indexes:
+            elif ind < len(records) and records[ind].key in underlined:
                 self.stdscr.addstr(table[:width-8], self.underline_color)
             else:
                 self.stdscr.addstr(table[:width-8])
             self.stdscr.addstr(END_OF_LINE)
 
+        for line in jobs_panel:
+            self.stdscr.addstr(line[:width-8] + END_OF_LINE, curses.color_pair(Colors.WHITE_ON_BLUE))
+
     def add_underline(self):
         """
         Adds or removes an underline to the currently selected Docker entity based on the current choice.
         """
-        index = self.get_index()
+        record = self.get_record_by_index(self.get_index())
         underlined = self.choice_underlines_dict[self.menu_table.choice]
 
-        if index not in underlined:
-            underlined.append(index)
+        if record is None:
+            return
+        if record.key not in underlined:
+            underlined.add(record.key)
         else:
-            underlined.remove(index)
+            underlined.remove(record.key)
+
+    def get_selected_records(self) -> list[BaseRecord]:
+        """
+        Gets the records of the underlined Docker entities based on the current choice,
+        or the record under the cursor if nothing is underlined.
+
+        The underlined rows are looked up in the current table by their keys, so they stay
+        selected when the table is patched or fetched again; the rows of entities that have
+        disappeared from the table are skipped.
+
+        Returns:
+        - The list of the selected records, in the order of the table.
+        """
+        listing: Listing = self.get_tables()
+        underlined = self.choice_underlines_dict[self.menu_table.choice]
+        if not underlined:
+            record = listing.get(self.get_index())
+            return [record] if record else []
+        return [record for record in listing.records if record.key in underlined]
+
+    def get_record_by_index(self, index: int) -> Optional[BaseRecord]:
+        """
+        Gets the record of the selected Docker entity based on the current choice at the given index.
+
+        Parameters:
+        - index: An integer representing the index of the Docker image, container or volume.
+
+        Returns:
+        - The record of the Docker entity at the given index, or None if there is no such entity.
+        """
+        return self.get_tables().get(index)
 
     def get_id_by_index(self, index: int):
         """
@@ -277,15 +363,8 @@ class Viewer(ABSViewer, UrlMixin):
         Returns:
         - The ID of the selected Docker entity based on the current choice at the given index.
         """
-        tables: list[str] = self.get_tables().split(END_OF_LINE)
-        tables.pop(0)
-        id_index = self.choice_id_index_dict[self.menu_table.choice]
-
-        try:
-            items = [item for item in tables[index].split() if item]
-            return items[id_index]
-        except IndexError:
-            return None
+        record = self.get_record_by_index(index)
+        return record.id if record else None
 
     def get_name_by_index(self, index: int):
         """
@@ -297,72 +376,241 @@ class Viewer(ABSViewer, UrlMixin):
         Returns:
         - The name of the selected Docker entity based on the current choice at the given index.
         """
-        tables: list[str] = self.get_tables().split(END_OF_LINE)
-        tables.pop(0)
-        id_index = self.choice_name_index_dict[self.menu_table.choice]
+        record = self.get_record_by_index(index)
+        return record.name if record else None
 
-        try:
-            items = [item for item in tables[index].split() if item]
-            return items[id_index]
-        except IndexError:
-            return None
+    def describe(self, title: str, records: list[BaseRecord]) -> str:
+        """
+        Describes an operation on Docker entities for the jobs panel.
+
+        Parameters:
+        - title: The name of the operation.
+        - records: The records of the entities.
+
+        Returns:
+        - The description, for example 'Deleting web' or 'Deleting 3 Containers'.
+        """
+        if len(records) == 1:
+            return title + SPACE + records[0].name
+        return f"{title} {len(records)} {self.menu_table.choice_name.value}"
 
     def delete(self):
         """
-        Deletes the selected Docker entity based on the current choice in the menu.
+        Deletes the selected Docker entities based on the current choice in the menu in a background job.
+
+        All selected entities are deleted by one batched call of the Docker communicator,
+        which reports the errors of every entity separately. The rows of the deleted
+        entities are removed from the table when the job finishes.
         """
-        index: int = self.get_index()
-        underlines: list[int] = self.choice_underlines_dict[self.menu_table.choice]
         docker_func: Callable = self.choice_delete_func_dict[self.menu_table.choice]
+        remove_rows: Callable = self.choice_remove_rows_dict[self.menu_table.choice]
+        records: list[BaseRecord] = self.get_selected_records()
+        if not records:
+            return
 
-        if not underlines:
-            docker_func(
-                self.get_id_by_index(index)
-            )
-        else:
-            for under_index in underlines:
-                if self.get_id_by_index(under_index):
-                    docker_func(
-                        self.get_id_by_index(under_index)
-                    )
+        def run(job: Job) -> list[BulkResult]:
+            ids: list[str] = list(dict.fromkeys(record.id for record in records))
+            job.set_progress(0, len(ids))
+            errors: dict[str, str] = docker_func(ids, on_progress=job.set_progress)
+            return [BulkResult(record.name, errors.get(record.id)) for record in records]
+
+        def on_success(results: list[BulkResult]):
+            for record, result in zip(records, results):
+                if result.ok:
+                    remove_rows(record.id, {})
+
+        self.job_queue.submit(Job(self.describe(DELETING_TEXT, records), run, on_success))
+        self.choice_underlines_dict[self.menu_table.choice].clear()
 
     def save(self):
         """
         Save the selected Docker entity based on the current choice in the menu.
 
-        This method retrieves the indexes associated with the currently selected choice
-        from the `choice_underlines_dict`. If no indexes are found, it defaults to using
-        the index obtained from the `get_index` method. For each index, it attempts to
-        call the corresponding save function from `choice_save_func_dict`, passing the
-        entity's ID and name (appended with a TAR archive extension) as arguments.
+        This method retrieves the selected records (see `get_selected_records`). For each
+        record, the archive streamed by the corresponding save function from `choice_save_func_dict`
+        is compressed straight into a file named after the entity, an image after its reference
+        (see `BaseRecord.archive_name` and `archive_file_name`), with
+        its SHA-256 checksum next to it. The records are saved concurrently in a background job
+        (see `submit_bulk`), and the progress shows the streamed size and rate.
 
-        If a TypeError occurs during the save operation, it is caught and ignored.
+        Volumes are archived in one helper container that has all selected volumes
+        mounted and is removed afterwards (see `ABCDockerCommunicator.volume_helper`).
 
         This method does not return any value.
         """
-        indexes = self.choice_underlines_dict[self.menu_table.choice]
-        if not indexes:
-            indexes = [self.get_index()]
-        for index in indexes:
+        records: list[BaseRecord] = self.get_selected_records()
+        if not records:
+            return
+        title: str = self.describe(SAVING_TEXT, records)
+        if self.menu_table.choice == MenuChoice.VOLUMES:
+            def run(job: Job) -> list[BulkResult]:
+                with self.docker_communicator.volume_helper([record.name for record in records]) as helper:
+                    return self.save_records(job, records, helper.tar_volume)
+        else:
+            docker_func: Callable = self.choice_save_func_dict[self.menu_table.choice]
+
+            def run(job: Job) -> list[BulkResult]:
+                return self.save_records(job, records, docker_func)
+
+        self.job_queue.submit(Job(title, run))
+
+    def save_records(self, job: Job, records: list[BaseRecord], docker_func: Callable) -> list[BulkResult]:
+        """
+        Saves the archives of Docker entities concurrently, reporting the streamed size and rate.
+
+        Parameters:
+        - job: The job that saves the archives.
+        - records: The records of the entities.
+        - docker_func: The save function that streams the archive of an entity.
+
+        Returns:
+        - The result for every entity.
+        """
+        meter = TransferMeter()
+        return self.bulk_executor.run(
+            self.save_to_file,
+            [
+                (record.archive_name, (docker_func, record.id, archive_file_name(record.archive_name), meter))
+                for record in records
+            ],
+            on_progress=lambda done, total: job.set_progress(done, total, meter)
+        )
+
+    @staticmethod
+    def save_to_file(docker_func: Callable, obj_id: str, file_name: str, meter: TransferMeter):
+        """
+        Streams the archive of a Docker entity into a compressed file.
+
+        Parameters:
+        - docker_func: The save function that streams the archive.
+        - obj_id: The ID or name of the entity.
+        - file_name: The name of the compressed file.
+        - meter: The meter of the streamed bytes.
+        """
+        with CompressedFileWriter(file_name, meter=meter) as output:
+            docker_func(obj_id, output)
+
+    def save_bundle(self):
+        """
+        Save the selected Docker images into one archive with a single save operation in a background job.
+
+        Layers shared by the images are stored in the archive only once. The archive is
+        compressed on the fly into a file named after a hash of the references (see `bundle_name`),
+        with its SHA-256 checksum next to it, like the archives of `save`. After the archive
+        is saved, a manifest with a JSON extension next to it records the reference and ID
+        of every image in it.
+
+        This method does not return any value.
+        """
+        records: list[BaseRecord] = self.get_selected_records()
+        if not records:
+            return
+        references: list[str] = list(dict.fromkeys(record.reference for record in records))
+        name: str = bundle_name(references)
+        file_name: str = archive_file_name(name)
+
+        def run(job: Job) -> list[BulkResult]:
+            meter = TransferMeter()
+            job.set_progress(0, 1, meter)
             try:
-                self.choice_save_func_dict[self.menu_table.choice](
-                    self.get_id_by_index(index),
-                    self.get_name_by_index(index) + Extensions.TAR_EXTENSION
+                with CompressedFileWriter(file_name, meter=meter) as output:
+                    self.docker_communicator.save_images(references, output)
+            except (DockerCommandError, OSError) as error:
+                return [BulkResult(record.reference, str(error)) for record in records]
+            job.set_progress(1, 1, meter)
+            with open(name + Extensions.JSON_EXTENSION, "w") as manifest:
+                json.dump(
+                    {
+                        "Archive": file_name,
+                        "Images": [{"Reference": record.reference, "Id": record.id} for record in records]
+                    },
+                    manifest,
+                    indent=4
                 )
-            except TypeError:
-                continue
+            return [BulkResult(record.reference) for record in records]
+
+        self.job_queue.submit(Job(SAVING_TEXT + SPACE + file_name, run))
+
+    def pull(self, references: list[str]):
+        """
+        Pulls Docker images concurrently in a background job and adds their rows to the images table
+        when it finishes.
+
+        At most MAX_PULLS images are pulled at the same time. While the job runs, the expanded
+        jobs panel shows the progress of every image with the layers that are still being pulled.
+
+        Parameters:
+        - references: The 'repository:tag' references of the images.
+        """
+        progresses: list[PullProgress] = [PullProgress(reference) for reference in dict.fromkeys(references)]
+        if not progresses:
+            return
+
+        def run(job: Job) -> list[BulkResult]:
+            return BulkExecutor(MAX_PULLS).run(
+                self.docker_communicator.pull,
+                [(progress.reference, (progress.reference, progress)) for progress in progresses],
+                on_progress=lambda done, total: job.set_progress(done, total, summarize(progresses))
+            )
+
+        def on_success(results: list[BulkResult]):
+            for result in results:
+                if result.ok:
+                    self.events_listener.add_image(result.name, {})
+
+        if len(progresses) == 1:
+            title = PULLING_TEXT + SPACE + progresses[0].reference
+        else:
+            title = f"{PULLING_TEXT} {len(progresses)} {MenuChoiceNames.IMAGES.value}"
+        self.job_queue.submit(Job(
+            title,
+            run,
+            on_success,
+            lambda: [line for progress in progresses for line in progress.lines()]
+        ))
+
+    def get_jobs_panel(self) -> list[str]:
+        """
+        Gets the lines of the jobs panel below the main table.
+
+        The collapsed panel is one line with the number of jobs in every state.
+        The expanded panel has a line for every job with its state, elapsed time and
+        progress or result, followed by the errors of the entities it failed for.
+
+        Returns:
+        - The lines of the panel, at most JOBS_PANEL_HEIGHT of them.
+        """
+        jobs: list[Job] = self.job_queue.jobs
+        if not jobs:
+            return []
+        counts = self.job_queue.counts()
+        lines: list[str] = [
+            JOBS_TEXT + COLON + SPACE
+            + ", ".join(f"{count} {state.value}" for state, count in counts.items() if count)
+            + SPACE * 3 + JOBS_HINT_TEXT
+        ]
+        if self.jobs_expanded:
+            for job in reversed(jobs):
+                lines.append(str(job))
+                if job.details and job.is_active:
+                    lines.extend(SPACE * 4 + line for line in job.details())
+                lines.extend(SPACE * 4 + str(result) for result in job.failed_results)
+        return lines[:JOBS_PANEL_HEIGHT]
 
     def inspect(self):
         """
         Inspects a Docker container or Image and displays its details in a viewers.
         """
+        from .inspect_viewer import InspectViewer  # not needed for the first frame
+
         try:
             js_obj: str = self.docker_communicator.inspect(
                 self.get_id_by_index(self.get_index()),
+                is_image=self.menu_table.choice == MenuChoice.IMAGES
             )
             inspect_viewer = InspectViewer(
                 screen=self.stdscr,
-                tables=self.get_inspect_tables_from_json_string(js_obj),
+                data=json.loads(js_obj),
                 obj_name=self.get_name_by_index(self.get_index())
             )
             inspect_viewer.run()
@@ -375,28 +623,51 @@ class Viewer(ABSViewer, UrlMixin):
 
         This method displays a viewers to get a new name from the user. It retrieves
         the current name of the object based on the selected index and attempts to
-        rename it using the appropriate renaming function from the dictionary of
-        rename functions. If the renaming is successful, it updates the display.
-
-        Raises:
-            TypeError: If the renaming function is not callable or if there is an issue
-            with the provided names.
+        rename it in a background job using the appropriate renaming function from the
+        dictionary of rename functions. If the renaming is successful, the row of the
+        renamed object is updated when the job finishes.
         """
+        from .get_new_name_viewer import GetNewNameViewer  # not needed for the first frame
+
         get_new_name_viewer = GetNewNameViewer(
             screen=self.stdscr,
             obj_name=self.get_name_by_index(self.get_index())
         )
         new_name_ = get_new_name_viewer.run()
-        if new_name_:
+        record: Optional[BaseRecord] = self.get_record_by_index(self.get_index())
+        if new_name_ and record:
+            func: Callable = self.choice_rename_unc_dict[self.menu_table.choice]
+            refresh_rows: Callable = self.choice_rename_rows_dict[self.menu_table.choice]
+
+            def run(job: Job) -> list[BulkResult]:
+                func(record.name, new_name_)
+                return [BulkResult(record.name)]
+
+            self.job_queue.submit(Job(
+                RENAMING_TEXT + SPACE + record.name,
+                run,
+                lambda results: refresh_rows(record, new_name_)
+            ))
+
+    def search(self):
+        """
+        Runs the search of images and tags on Docker Hub, whose pulls run as background jobs.
+
+        The search viewers are imported only when the search is opened,
+        because they are not needed for the first frame.
+        """
+        from .search_image_viewer import SearchImageViewer
+
+        try:
+            SearchImageViewer(screen=self.stdscr, on_pull=self.pull).run()
+        except (DockerApiError, OSError):
+            self.stdscr.clear()
+            self.stdscr.addstr(INTERNET_TROUBLE_TEXT)
+            self.stdscr.refresh()
             try:
-                func = self.choice_rename_unc_dict[self.menu_table.choice]
-                func(
-                    self.get_name_by_index(self.get_index()),
-                    new_name_
-                )
-                self.update()
-            except TypeError:
-                return
+                self.stdscr.getch()
+            except KeyboardInterrupt:
+                pass
 
     def icon_to_screen(self, help_text: bool = False):
         """
@@ -404,7 +675,8 @@ class Viewer(ABSViewer, UrlMixin):
 
         This method clears the current content of the screen and adds
         the specified icon to the screen. If the `help_text` parameter
-        is set to True, it also adds additional help text below the icon.
+        is set to True, it also adds additional help text below the icon,
+        followed by the hit/miss counters of the Docker data cache.
         After updating the screen with the new content, it refreshes
         the display to show the icon and any help text.
 
@@ -416,6 +688,7 @@ class Viewer(ABSViewer, UrlMixin):
         self.stdscr.addstr(ICON)
         if help_text:
             self.stdscr.addstr(HELP_TEXT)
+            self.stdscr.addstr(f"{CACHE_TEXT} (hits/misses): {self.docker_communicator.cache}{END_OF_LINE}")
         self.stdscr.refresh()
 
     def run(self):
@@ -425,13 +698,24 @@ class Viewer(ABSViewer, UrlMixin):
 
         while True:
             try:
-                self.stdscr.clear()
+                self.stdscr.erase()
 
                 self.menu_table.put_table_on_screen(self.stdscr)
                 self.put_main_table()
 
                 self.stdscr.refresh()
+                if self.prefetch_pending:
+                    # the current tab is on the screen, load the other ones meanwhile
+                    startup.mark(startup.FIRST_PAINT)
+                    self.prefetch_pending = False
+                    self.prefetch()
+                # redraw periodically, so the changes applied by the events listener are shown
+                self.stdscr.timeout(REDRAW_TIMEOUT)
                 char = self.stdscr.getch()
+                self.stdscr.timeout(BLOCKING)
+
+                if char == curses.ERR:
+                    self.prefetch_inspect()
 
                 if char in (KEY_EXIT, KEY_ESC):
                     return
@@ -450,18 +734,21 @@ class Viewer(ABSViewer, UrlMixin):
                     self.add_underline()
 
                 if char == KEY_DELETE:
-                    self.icon_to_screen()
                     self.delete()
-                    self.update()
+
+                if char == KEY_JOBS:
+                    self.jobs_expanded = not self.jobs_expanded
 
                 if char == KEY_HELP:
                     self.icon_to_screen(help_text=True)
                     self.stdscr.getch()
 
                 if char == KEY_SAVE:
-                    self.icon_to_screen()
                     self.save()
 
+                if char == KEY_SAVE_BUNDLE and self.menu_table.choice == MenuChoice.IMAGES:
+                    self.save_bundle()
+
                 if char == KEY_INSPECT and self.menu_table.choice in (
                     MenuChoice.IMAGES,
                     MenuChoice.CONTAINERS
@@ -473,11 +760,7 @@ class Viewer(ABSViewer, UrlMixin):
                     self.rename()
 
                 if char == KEY_PULL:
-                    search_viewer = SearchImageViewer(
-                        screen=self.stdscr
-                    )
-                    search_viewer.run()
-                    self.update()
+                    self.search()
 
                 self.check_indexes()
 
@@ -501,9 +784,9 @@ class Viewer(ABSViewer, UrlMixin):
                 except KeyboardInterrupt:
                     return
 
-            except urllib.error.URLError:
+            except DockerCommandError as error:
                 self.stdscr.clear()
-                self.stdscr.addstr(INTERNET_TROUBLE_TEXT)
+                self.stdscr.addstr(DOCKER_COMMAND_TROUBLE_TEXT + str(error))
                 self.stdscr.refresh()
                 try:
                     self.stdscr.getch()
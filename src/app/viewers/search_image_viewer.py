@@ -1,12 +1,15 @@
 from curses.ascii import isalpha, ispunct, isdigit
-from typing import Optional
+from typing import Callable, Optional
 
 from .base import ABSViewer
 from .inspect_viewer import InspectViewer
 from .search_tag_viewer import SearchTagViewer
 from ..docker_communicators.docker_api_communicator import DockerApiCommunicator
+from ..exeptions.exeptions import DockerApiRateLimitError
 from ..utils.constants import *
-from ..utils.enams import Steps, QueryParams
+from ..utils.debounce import DebouncedFetcher
+from ..utils.prefix_trie import PrefixTrie
+from ..utils.enams import Steps
 from ..utils.hints import ImageResponse
 from ..utils.index import ObjIndex
 from ..utils.mixins import MenuMixin, UrlMixin, TablesMixin
@@ -16,22 +19,39 @@ class SearchImageViewer(ABSViewer, MenuMixin, UrlMixin, TablesMixin):
     """
     A viewers class for searching and displaying Docker images in a terminal interface.
     It handles user input, displays search results, and allows navigation through pages of results.
+
+    The results are fetched on a worker thread (see `DebouncedFetcher`), so typing goes on while
+    a request is in flight, and the results of outdated search text are never shown.
+    The first page of results of every search text is kept in a PrefixTrie: going back to an
+    earlier text shows its results at once, and while the results of a longer text are loading,
+    the results of the longest earlier text it extends are filtered locally and shown instead.
+    A request refused because the Docker Hub budget is spent keeps the results on the screen
+    and is sent again when the budget allows it; the footer shows the remaining budget.
     """
 
-    def __init__(self, screen: curses.window):
+    def __init__(self, screen: curses.window, on_pull: Optional[Callable[[list[str]], None]] = None):
         """
         Initializes the SearchImageViewer with the given curses window.
 
         Args:
             screen (curses.window): The curses window object for rendering the interface.
+            on_pull (Optional[Callable[[list[str]], None]]): Starts the pulls of image references in the
+                                                             background, or None to pull while waiting.
         """
         self.stdscr = screen
+        self.on_pull: Optional[Callable[[list[str]], None]] = on_pull
         self.text: str = EMPTY_STRING
         self.data: Optional[ImageResponse] = None
         self.index: ObjIndex = ObjIndex()
         self.key_steps_dict: dict[int, Steps] = KEY_STEPS_DICT
         self.api_communicator = DockerApiCommunicator()
         self.page_number: int = START_PAGE_NUMBER
+        self.requested_page: int = START_PAGE_NUMBER
+        self.rate_limited: bool = False
+        self.fetcher: DebouncedFetcher[tuple[str, int], ImageResponse] = DebouncedFetcher(
+            lambda request: self.api_communicator.get_repositories(*request)
+        )
+        self.results_trie: PrefixTrie[ImageResponse] = PrefixTrie()
 
     def get_tables(self) -> list[str]:
         """
@@ -59,12 +79,119 @@ class SearchImageViewer(ABSViewer, MenuMixin, UrlMixin, TablesMixin):
                     return f"{self.page_number}/{(self.data['count'] // PAGE_SIZE) + 1}"
         return NO_PAGES
 
+    def get_footer_text(self) -> str:
+        """
+        Returns the text of the footer: the page information and the remaining Docker Hub request budget.
+        """
+        return self.get_page_information() + FOOTER_SEPARATOR + self.api_communicator.get_budget_text()
+
     def backspace(self):
         """
         Removes the last character from the current search text.
         """
         self.text = self.text[:-1]
 
+    def search(self, page: int = START_PAGE_NUMBER, immediate: bool = False) -> None:
+        """
+        Requests a page of the results of the current search text in the background.
+
+        A page that was fetched or prefetched before is shown without a request, the first page
+        of a text from the results trie. Otherwise, until the first page arrives, the results of
+        the longest searched text that the current one extends are shown, filtered by the current text.
+
+        Args:
+            page (int): The page number.
+            immediate (bool): Whether to fetch without waiting for more typing, for page flips.
+        """
+        self.rate_limited = False
+        stored = self.results_trie.get(self.text) if page == START_PAGE_NUMBER else None
+        if stored is None:
+            stored = self.api_communicator.cached_repositories(self.text, page)
+        if stored is not None:
+            self.fetcher.cancel()
+            self.show(stored, page)
+            return
+        if page == START_PAGE_NUMBER:
+            prefix = self.results_trie.longest_prefix(self.text)
+            if prefix is not None:
+                self.show(self.refine(prefix[1], self.text), page)
+        self.requested_page = page
+        self.fetcher.request((self.text, page), immediate)
+
+    @staticmethod
+    def refine(data: ImageResponse, text: str) -> ImageResponse:
+        """
+        Filters the results of a shorter search text by a longer one.
+
+        Args:
+            data (ImageResponse): The results of the shorter text.
+            text (str): The longer text.
+
+        Returns:
+            ImageResponse: The results whose name or description contains the text, as one page.
+        """
+        text = text.lower()
+        results = [
+            image for image in data['results']
+            if text in image['repo_name'].lower() or text in (image.get('short_description') or EMPTY_STRING).lower()
+        ]
+        return ImageResponse(count=len(results), next=None, previous=None, results=results)
+
+    def show(self, data: ImageResponse, page: int) -> None:
+        """
+        Shows a page of results, keeping the cursor on the selected image if it is among them,
+        and prefetches the pages next to it.
+
+        Args:
+            data (ImageResponse): The results.
+            page (int): The page number.
+        """
+        names = self.get_tables()
+        selected = names[self.index.value] if 0 <= self.index.value < len(names) else None
+        self.data = data
+        self.page_number = page
+        names = self.get_tables()
+        if selected in names:
+            self.index.value = names.index(selected)
+        else:
+            self.index.clear()
+        for adjacent_page in self.get_adjacent_pages(data):
+            self.api_communicator.prefetch_repositories(self.text, adjacent_page)
+
+    def apply_results(self) -> None:
+        """
+        Shows the results of the latest request, if they have arrived, in place of the locally
+        filtered ones, and keeps the first page of results in the results trie.
+        If the request was refused for the spent budget, it is sent again when the budget allows it.
+
+        Raises:
+            DockerApiError, OSError: If the latest request failed otherwise.
+        """
+        if self.rate_limited and not self.api_communicator.retry_in():
+            self.rate_limited = False
+            self.fetcher.request((self.text, self.requested_page), immediate=True)
+        try:
+            result = self.fetcher.take()
+        except DockerApiRateLimitError:
+            self.rate_limited = True
+            return
+        if result is None:
+            return
+        (text, page), data = result
+        if page == START_PAGE_NUMBER:
+            self.results_trie.put(text, data)
+        self.show(data, page)
+
+    def get_title(self) -> str:
+        """
+        Returns the text of the header: the search text, or a prompt if nothing is typed yet,
+        with a loading indicator while results are being fetched.
+        """
+        title = self.text or CURS + START_TYPE_NAME
+        if self.fetcher.loading:
+            title += SPACE + LOADING_TEXT
+        return title
+
     def change_index(self, char: int) -> None:
         """
         Changes the selected Docker entity index based on the given character input.
@@ -85,13 +212,18 @@ class SearchImageViewer(ABSViewer, MenuMixin, UrlMixin, TablesMixin):
         Main loop for running the SearchImageViewer. It handles user input,
         updates the display, and manages navigation through search results.
         """
+        try:
+            self.__loop()
+        finally:
+            self.fetcher.close()
+
+    def __loop(self):
+        """Handles the keys until the viewer is closed, redrawing often while results are loading."""
         while True:
             try:
-                self.stdscr.clear()
-                if self.text:
-                    self.put_head_menu(self.stdscr, self.text)
-                else:
-                    self.put_head_menu(self.stdscr, CURS + START_TYPE_NAME)
+                self.apply_results()
+                self.stdscr.erase()
+                self.put_head_menu(self.stdscr, self.get_title())
 
                 self.put_tables(
                     screen=self.stdscr,
@@ -100,65 +232,53 @@ class SearchImageViewer(ABSViewer, MenuMixin, UrlMixin, TablesMixin):
                 )
                 self.put_footer(
                     screen=self.stdscr,
-                    center_text=self.get_page_information()
+                    center_text=self.get_footer_text()
                 )
 
+                if self.fetcher.loading:
+                    self.stdscr.timeout(LOADING_REDRAW_TIMEOUT)
+                elif self.rate_limited:
+                    self.stdscr.timeout(REDRAW_TIMEOUT)
                 char = self.stdscr.getch()
+                self.stdscr.timeout(BLOCKING)
 
                 if char == KEY_ESC:
                     return
                 if char == curses.KEY_BACKSPACE:
                     self.backspace()
-                    self.page_number = START_PAGE_NUMBER
-                    self.data = self.api_communicator.get_repositories(self.text)
+                    self.search()
 
                 if char in (curses.KEY_DOWN, curses.KEY_UP):
                     self.change_index(char)
 
                 if char == curses.KEY_LEFT and self.data and self.data['previous']:
-                    page = int(
-                        self.get_query_param_from_url(
-                            url=self.data['previous'],
-                            query_param_name=QueryParams.PAGE.value
-                        )
-                    )
-                    self.page_number = page
-                    self.data = self.api_communicator.get_repositories(self.text, page)
-                    self.index.clear()
+                    self.search(self.get_page_number(self.data['previous']), immediate=True)
                 if char == curses.KEY_RIGHT and self.data and self.data['next']:
-                    page = int(
-                        self.get_query_param_from_url(
-                            url=self.data['next'],
-                            query_param_name=QueryParams.PAGE.value
-                        )
-                    )
-                    self.page_number = page
-                    self.data = self.api_communicator.get_repositories(self.text, page)
-                    self.index.clear()
+                    self.search(self.get_page_number(self.data['next']), immediate=True)
                 if char == KEY_ENTER and self.get_tables():
-                    search_tag_viewer = SearchTagViewer(
-                        screen=self.stdscr,
-                        obj_name=self.get_tables()[self.index.value],
-                        api_communicator=self.api_communicator
-                    )
+                    try:
+                        search_tag_viewer = SearchTagViewer(
+                            screen=self.stdscr,
+                            obj_name=self.get_tables()[self.index.value],
+                            api_communicator=self.api_communicator,
+                            on_pull=self.on_pull
+                        )
+                    except DockerApiRateLimitError:
+                        # the footer shows when the tags can be fetched
+                        continue
                     search_tag_viewer.run()
 
-                if char == KEY_SPASE and self.data["results"]:
-                    images_tables: list[str] = []
-                    data = self.data["results"][self.index.value]
-                    self.put_tables_from_dict_or_list(data, images_tables)
+                if char == KEY_SPASE and self.data and self.data["results"]:
                     inspect_viewer = InspectViewer(
                         screen=self.stdscr,
                         obj_name=self.get_tables()[self.index.value],
-                        tables=images_tables
+                        data=self.data["results"][self.index.value]
                     )
                     inspect_viewer.run()
 
                 elif isalpha(char) or ispunct(char) or isdigit(char):
                     self.text += chr(char)
-                    self.data = self.api_communicator.get_repositories(self.text)
-                    self.page_number = START_PAGE_NUMBER
-                    self.index.clear()
+                    self.search()
 
             except KeyboardInterrupt:
                 return
@@ -1,11 +1,17 @@
+from curses.ascii import isalpha, ispunct, isdigit
+from typing import Callable, Optional
+
 from .base import ABSViewer
 from .inspect_viewer import InspectViewer
 from ..docker_communicators.docker_api_communicator import DockerApiCommunicator
-from ..docker_communicators.docker_comunicator import DockerCommunicator
+from ..docker_communicators.docker_comunicator import ABCDockerCommunicator
+from ..docker_communicators.factory import get_docker_communicator
+from ..exeptions.exeptions import DockerApiRateLimitError
 from ..utils.constants import *
-from ..utils.enams import Steps, QueryParams
-from ..utils.hints import TagResponse
+from ..utils.enams import Steps, TagSortOrders
+from ..utils.hints import Tag, TagResponse
 from ..utils.index import ObjIndex
+from ..utils.tag_index import TagIndex
 from ..utils.mixins import MenuMixin, TablesMixin, UrlMixin
 
 
@@ -13,9 +19,21 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
     """
     A viewers class for searching and displaying Docker image tags in a terminal interface.
     It handles user input, displays search results, and allows navigation through pages of tags.
+    A page that cannot be fetched because the Docker Hub budget is spent is not switched to;
+    the footer shows the remaining budget.
+
+    In filter mode, all tags of the repository are fetched in the background into a TagIndex,
+    and the typed text is matched against them as a substring or as a fuzzy pattern (its
+    characters in the same order), with the matches sorted by relevance, last update or size.
     """
 
-    def __init__(self, screen: curses.window, obj_name: str, api_communicator: DockerApiCommunicator):
+    def __init__(
+            self,
+            screen: curses.window,
+            obj_name: str,
+            api_communicator: DockerApiCommunicator,
+            on_pull: Optional[Callable[[list[str]], None]] = None
+    ):
         """
         Initializes the SearchTagViewer with the given curses window and object name.
 
@@ -23,15 +41,33 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
             screen (curses.window): The curses window object for rendering the interface.
             obj_name (str): The name of the Docker object (image) to search for.
             api_communicator (DockerApiCommunicator): The API communicator for fetching tags.
+            on_pull (Optional[Callable[[list[str]], None]]): Starts the pulls of image references in the
+                                                             background, or None to pull while waiting.
         """
+        self.on_pull: Optional[Callable[[list[str]], None]] = on_pull
+        self.marked: list[str] = []
         self.index: ObjIndex = ObjIndex()
-        self.docker_communicator: DockerCommunicator = DockerCommunicator()
+        self.docker_communicator: ABCDockerCommunicator = get_docker_communicator()
         self.api_communicator: DockerApiCommunicator = api_communicator
         self.stdscr = screen
         self.name = obj_name if SLASH in obj_name else LIBRARY + SLASH + obj_name
         self.data: TagResponse = self.api_communicator.get_tags(self.name)
         self.page_number: int = START_PAGE_NUMBER
         self.key_steps_dict: dict[int, Steps] = KEY_STEPS_DICT
+        self.filter_text: Optional[str] = None
+        self.sort_order: TagSortOrders = TagSortOrders.RELEVANCE
+        self.tag_index: Optional[TagIndex] = None
+        self.matches: list[Tag] = []
+        self.matches_version: int = 0
+        self.prefetch_adjacent()
+
+    def get_results(self) -> list[Tag]:
+        """
+        Returns the tags on the screen: the matches of the filter in filter mode, otherwise the current page.
+        """
+        if self.filter_text is not None:
+            return self.matches
+        return self.data['results']
 
     def get_tables(self) -> list[str]:
         """
@@ -41,10 +77,81 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
             list[str]: A list of tag names if data is available, otherwise an empty list.
         """
         tags = [
-            d['name'] for d in self.data['results']
+            d['name'] for d in self.get_results()
         ]
         return tags
 
+    def start_filter(self) -> None:
+        """Switches to filter mode, starting to fetch all tags of the repository in the background."""
+        self.tag_index = self.api_communicator.get_tag_index(self.name)
+        self.filter_text = EMPTY_STRING
+        self.index.clear()
+        self.update_matches()
+
+    def update_matches(self) -> None:
+        """
+        Matches the filter against the index, keeping the cursor on the selected tag if it still matches.
+        """
+        names = self.get_tables()
+        selected = names[self.index.value] if 0 <= self.index.value < len(names) else None
+        self.matches_version = self.tag_index.version
+        self.matches = self.tag_index.search(self.filter_text, self.sort_order)
+        names = self.get_tables()
+        if selected in names:
+            self.index.value = names.index(selected)
+        else:
+            self.index.clear()
+
+    def change_sort_order(self) -> None:
+        """Sorts the matches of the filter by the next order."""
+        orders = list(TagSortOrders)
+        self.sort_order = orders[(orders.index(self.sort_order) + 1) % len(orders)]
+        self.update_matches()
+
+    def filter_key(self, char: int) -> bool:
+        """
+        Handles a key in filter mode: typing edits the filter and ESC ends filter mode.
+
+        Parameters:
+        - char: An integer representing the character input from the user.
+
+        Returns:
+            bool: True if the key was handled, False if it works as outside filter mode.
+        """
+        if char == KEY_ESC:
+            self.filter_text = None
+            self.index.clear()
+        elif char == curses.KEY_BACKSPACE:
+            self.filter_text = self.filter_text[:-1]
+            self.update_matches()
+        elif isalpha(char) or ispunct(char) or isdigit(char):
+            self.filter_text += chr(char)
+            self.update_matches()
+        else:
+            return False
+        return True
+
+    def prefetch_adjacent(self) -> None:
+        """Fetches the pages next to the page on the screen in the background, so paging is instant."""
+        for page in self.get_adjacent_pages(self.data):
+            self.api_communicator.prefetch_tags(self.name, page)
+
+    def show_page(self, page: int) -> None:
+        """
+        Shows a page of tags, from the page cache if it was prefetched, and prefetches the pages next to it.
+        The current page stays on the screen if the Docker Hub budget is spent.
+
+        Args:
+            page (int): The page number.
+        """
+        try:
+            self.data = self.api_communicator.get_tags(self.name, page)
+        except DockerApiRateLimitError:
+            return
+        self.page_number = page
+        self.index.clear()
+        self.prefetch_adjacent()
+
     def change_index(self, char: int) -> None:
         """
         Changes the selected Docker entity index based on the given character input.
@@ -75,6 +182,35 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
                     return f"{self.page_number}/{(self.data['count'] // PAGE_SIZE) + 1}"
         return NO_PAGES
 
+    def get_title(self) -> str:
+        """
+        Returns the text of the header: the repository name, and in filter mode the filter,
+        with the progress of the index while its pages are being fetched.
+        """
+        if self.filter_text is None:
+            return self.name
+        title = self.name + SPACE + SLASH + self.filter_text
+        if not self.tag_index.complete:
+            title += SPACE + INDEXING_TEXT.format(
+                loaded=self.tag_index.loaded_pages,
+                total=self.tag_index.total_pages or 0
+            )
+        return title
+
+    def get_footer_text(self) -> str:
+        """
+        Returns the text of the footer: the page information, or in filter mode the number of
+        matches and their order, and the remaining Docker Hub request budget.
+        """
+        if self.filter_text is None:
+            information = self.get_page_information()
+        else:
+            information = (
+                MATCHES_TEXT.format(count=len(self.matches)) + FOOTER_SEPARATOR
+                + SORT_TEXT.format(order=self.sort_order.value)
+            )
+        return information + FOOTER_SEPARATOR + self.api_communicator.get_budget_text()
+
     def icon_to_screen(self, help_text: bool = False):
         """
         Displays an icon on the screen and optionally adds help text.
@@ -104,6 +240,32 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
         """
         return self.get_tables()[self.index.value]
 
+    def mark(self) -> None:
+        """
+        Marks the currently selected tag for pulling, or unmarks it if it is already marked.
+        Marks are kept when switching pages.
+        """
+        tag: str = self.get_tag()
+        if tag in self.marked:
+            self.marked.remove(tag)
+        else:
+            self.marked.append(tag)
+
+    def pull(self, references: list[str]):
+        """
+        Pulls images, in the background if a pull callback was given,
+        otherwise showing the icon until the pulls have finished.
+
+        Args:
+            references (list[str]): The 'repository:tag' references of the images.
+        """
+        if self.on_pull:
+            self.on_pull(references)
+            return
+        self.icon_to_screen()
+        for reference in references:
+            self.docker_communicator.pull(reference)
+
     def run(self):
         """
         Main loop for running the SearchTagViewer. It handles user input,
@@ -111,12 +273,35 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
         """
         while True:
             try:
-                self.stdscr.clear()
-                self.put_head_menu(screen=self.stdscr, title=self.name)
-                self.put_tables(screen=self.stdscr, tables=self.get_tables(), index=self.index.value)
-                self.put_footer(screen=self.stdscr, center_text=self.get_page_information())
+                if self.filter_text is not None and self.tag_index.version != self.matches_version:
+                    self.update_matches()
+                self.stdscr.erase()
+                self.put_head_menu(screen=self.stdscr, title=self.get_title())
+                self.put_tables(
+                    screen=self.stdscr,
+                    tables=self.get_tables(),
+                    index=self.index.value,
+                    marked=self.marked
+                )
+                self.put_footer(screen=self.stdscr, center_text=self.get_footer_text())
 
+                if self.filter_text is not None and not self.tag_index.complete:
+                    # show the matches in the pages that arrive
+                    self.stdscr.timeout(LOADING_REDRAW_TIMEOUT)
+                elif self.api_communicator.retry_in():
+                    # redraw the countdown in the footer while the budget is spent
+                    self.stdscr.timeout(REDRAW_TIMEOUT)
                 char = self.stdscr.getch()
+                self.stdscr.timeout(BLOCKING)
+
+                if self.filter_text is not None:
+                    if self.filter_key(char):
+                        continue
+                    if char == KEY_SORT:
+                        self.change_sort_order()
+                elif char == KEY_FILTER:
+                    self.start_filter()
+                    continue
 
                 if char in (KEY_EXIT, KEY_ESC):
                     return
@@ -124,44 +309,28 @@ class SearchTagViewer(ABSViewer, MenuMixin, TablesMixin, UrlMixin):
                 if char in (curses.KEY_DOWN, curses.KEY_UP):
                     self.change_index(char)
 
-                if char == curses.KEY_LEFT and self.data and self.data['previous']:
-                    page = int(
-                        self.get_query_param_from_url(
-                            url=self.data['previous'],
-                            query_param_name=QueryParams.PAGE.value
-                        )
-                    )
-                    self.page_number = page
-                    self.data = self.api_communicator.get_tags(self.name, page)
-                    self.index.clear()
-
-                if char == curses.KEY_RIGHT and self.data and self.data['next']:
-                    page = int(
-                        self.get_query_param_from_url(
-                            url=self.data['next'],
-                            query_param_name=QueryParams.PAGE.value
-                        )
-                    )
-                    self.page_number = page
-                    self.data = self.api_communicator.get_tags(self.name, page)
-                    self.index.clear()
+                if char == curses.KEY_LEFT and self.filter_text is None and self.data and self.data['previous']:
+                    self.show_page(self.get_page_number(self.data['previous']))
+
+                if char == curses.KEY_RIGHT and self.filter_text is None and self.data and self.data['next']:
+                    self.show_page(self.get_page_number(self.data['next']))
+
+                if char == KEY_MARK and self.get_tables():
+                    self.mark()
 
-                if char == KEY_ENTER:
-                    self.icon_to_screen()
-                    self.docker_communicator.pull(self.name + COLON + self.get_tag())
+                if char == KEY_ENTER and (self.marked or self.get_tables()):
+                    tags: list[str] = self.marked or [self.get_tag()]
+                    self.pull([self.name + COLON + tag for tag in tags])
+                    self.marked.clear()
 
                 if char == KEY_LATEST:
-                    self.icon_to_screen()
-                    self.docker_communicator.pull(self.name + COLON + LATEST)
+                    self.pull([self.name + COLON + LATEST])
 
-                if char in (KEY_SPASE, KEY_INSPECT):
-                    tags_tables: list[str] = []
-                    data = self.data["results"][self.index.value]
-                    self.put_tables_from_dict_or_list(data, tags_tables)
+                if char in (KEY_SPASE, KEY_INSPECT) and self.get_tables():
                     inspect_viewer = InspectViewer(
                         screen=self.stdscr,
                         obj_name=self.get_tables()[self.index.value],
-                        tables=tags_tables
+                        data=self.get_results()[self.index.value]
                     )
                     inspect_viewer.run()
 
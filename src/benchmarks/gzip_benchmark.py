@@ -0,0 +1,82 @@
+"""
+Benchmark of the gzip encoders used for saved archives.
+
+Compares the throughput and the compressed size of the single-threaded zlib encoder
+with the block-parallel encoder at several numbers of threads.
+
+Usage (from the src directory):
+    python3 -m benchmarks.gzip_benchmark --size 256 --threads 2 4 8
+"""
+import argparse
+import gzip
+import os
+import time
+import zlib
+
+from app.utils.constants import CHUNK_SIZE, GZIP_LEVEL
+from app.utils.formatters import human_size
+from app.utils.streams import ParallelGzipCompressor
+
+
+def make_data(size: int) -> bytes:
+    """
+    Generates data that compresses about as well as an image layer.
+
+    Args:
+        size (int): The size of the data in bytes.
+
+    Returns:
+        bytes: Text-like blocks mixed with incompressible ones.
+    """
+    text = b"".join(b"/usr/lib/python3/site-packages/module_%d.py\n" % i for i in range(2000))
+    block = text + os.urandom(len(text) // 2)
+    return (block * (size // len(block) + 1))[:size]
+
+
+def measure(compressor, data: bytes) -> tuple[float, int]:
+    """
+    Compresses the data in chunks, like the streaming pipeline does.
+
+    Args:
+        compressor: An object with the interface of the zlib compression objects.
+        data (bytes): The data to compress.
+
+    Returns:
+        tuple[float, int]: The elapsed seconds and the compressed size.
+    """
+    started = time.perf_counter()
+    compressed = bytearray()
+    for offset in range(0, len(data), CHUNK_SIZE):
+        compressed += compressor.compress(data[offset:offset + CHUNK_SIZE])
+    compressed += compressor.flush()
+    elapsed = time.perf_counter() - started
+    if gzip.decompress(compressed) != data:
+        raise AssertionError("the compressed stream does not decompress to the input")
+    return elapsed, len(compressed)
+
+
+def main():
+    """Runs the benchmark and prints one line per encoder."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=256, help="size of the data in MB")
+    parser.add_argument("--threads", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    data = make_data(args.size * 1000 * 1000)
+    encoders = [("zlib, 1 thread", zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS))]
+    encoders += [
+        (f"parallel, {threads} threads", ParallelGzipCompressor(threads=threads))
+        for threads in sorted(set(args.threads))
+    ]
+    baseline = None
+    for name, compressor in encoders:
+        elapsed, size = measure(compressor, data)
+        baseline = baseline or elapsed
+        print(
+            f"{name:<24} {human_size(len(data) / elapsed)}/s   "
+            f"ratio {size / len(data):.3f}   speedup {baseline / elapsed:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Benchmark of the per-request latency of Docker Hub requests against a local stand-in HTTPS server.
+
+Sends the same search requests once with a new `urllib.request.urlopen` connection per request,
+as the search used to, and once through the keep-alive ConnectionPool with gzip responses.
+The stand-in server answers with a page of search results like Docker Hub does, and can delay
+every new connection to model the round trips of the TCP and TLS handshakes over a real network.
+It uses a self-signed certificate made with the 'openssl' command.
+
+Usage (from the src directory):
+    python3 -m benchmarks.hub_latency_benchmark --requests 50 --connect-delay 0.05
+"""
+import argparse
+import gzip
+import http.server
+import json
+import os
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+
+from app.docker_communicators.connection_pool import ConnectionPool
+from app.utils.constants import PAGE_SIZE, GZIP_ENCODING
+
+SEARCH_PATH = "/v2/search/repositories/"
+
+
+def make_page() -> bytes:
+    """
+    Makes a page of search results shaped like the answers of Docker Hub.
+
+    Returns:
+        bytes: The JSON body of the page.
+    """
+    results = [
+        {
+            "repo_name": f"user-{i}/repository-{i}",
+            "short_description": "An image that does something useful " * 3,
+            "star_count": i,
+            "pull_count": i * 1000,
+            "repo_owner": "",
+            "is_automated": False,
+            "is_official": i == 0
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    return json.dumps({"count": 10000, "next": None, "previous": None, "results": results}).encode()
+
+
+def make_certificate(directory: str) -> tuple[str, str]:
+    """
+    Makes a self-signed certificate for localhost.
+
+    Args:
+        directory (str): The directory of the certificate and key files.
+
+    Returns:
+        tuple[str, str]: The paths of the certificate and the key.
+    """
+    certificate = os.path.join(directory, "certificate.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+            "-keyout", key, "-out", certificate
+        ],
+        check=True,
+        capture_output=True
+    )
+    return certificate, key
+
+
+def start_server(certificate: str, key: str, connect_delay: float) -> http.server.ThreadingHTTPServer:
+    """
+    Starts the stand-in HTTPS server on a free local port in a background thread.
+
+    Args:
+        certificate (str): The path of the certificate.
+        key (str): The path of the key.
+        connect_delay (float): The seconds every new connection waits before its first response.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The running server.
+    """
+    page = make_page()
+    compressed_page = gzip.compress(page)
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            time.sleep(connect_delay)
+
+        def do_GET(self):
+            body = page
+            gzipped = GZIP_ENCODING in self.headers.get("Accept-Encoding", "")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if gzipped:
+                body = compressed_page
+                self.send_header("Content-Encoding", GZIP_ENCODING)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certificate, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(get, urls: list[str]) -> list[float]:
+    """
+    Sends the requests one after another, like a user typing a search.
+
+    Args:
+        get (Callable[[str], bytes]): Sends one request and returns the body.
+        urls (list[str]): The URLs of the requests.
+
+    Returns:
+        list[float]: The latency of every request in seconds.
+    """
+    latencies = []
+    for url in urls:
+        started = time.perf_counter()
+        json.loads(get(url))
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main():
+    """Runs the benchmark and prints the latencies of both transports."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50, help="number of search requests")
+    parser.add_argument("--connect-delay", type=float, default=0.05, help="seconds of handshake latency per connection")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        certificate, key = make_certificate(directory)
+        server = start_server(certificate, key, args.connect_delay)
+        context = ssl.create_default_context(cafile=certificate)
+        base_url = f"https://localhost:{server.server_address[1]}{SEARCH_PATH}"
+        urls = [f"{base_url}?query=nginx{i}&page=1&page_size={PAGE_SIZE}" for i in range(args.requests)]
+
+        def urlopen_get(url: str) -> bytes:
+            with urllib.request.urlopen(url, context=context) as response:
+                return response.read()
+
+        pool = ConnectionPool(context=context)
+
+        def pool_get(url: str) -> bytes:
+            return pool.get(url)[1]
+
+        results = {"urlopen": measure(urlopen_get, urls), "connection pool": measure(pool_get, urls)}
+        pool.close()
+        server.shutdown()
+
+    for name, latencies in results.items():
+        print(
+            f"{name:<16} median {statistics.median(latencies) * 1000:7.1f} ms   "
+            f"max {max(latencies) * 1000:7.1f} ms   total {sum(latencies):6.2f} s"
+        )
+    print(f"connections opened by the pool: {pool.connections_opened} for {pool.requests} requests")
+
+
+if __name__ == "__main__":
+    main()
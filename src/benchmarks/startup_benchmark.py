@@ -0,0 +1,170 @@
+"""
+Benchmark of the startup time of the application against a fake docker binary.
+
+Reports the import time of the main viewer and the startup milestones recorded by
+`app.utils.startup` (imports, curses initialized, viewer initialized, first frame painted),
+with the wall time from spawning the process to the first frame. The application runs on a
+pseudo-terminal with a fake 'docker' script first on PATH, whose listings answer after a fixed
+delay, so the results do not depend on a Docker daemon. The image store of the runs is kept in
+a temporary directory, so every run after the first one shows the images table stored by the
+previous run, like a usual startup does.
+
+Usage (from the src directory):
+    python3 -m benchmarks.startup_benchmark --runs 5 --rows 200 --delay 0.05
+"""
+import argparse
+import fcntl
+import json
+import os
+import pty
+import select
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import time
+
+from app.utils import startup
+
+SRC_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TERMINAL_SIZE = (50, 200)
+TIMEOUT = 30.0
+
+FAKE_DOCKER = '''#!{python}
+import json, sys, time
+args = sys.argv[1:]
+if args[:1] == ["events"]:
+    time.sleep(3600)
+time.sleep({delay})
+if args[:1] == ["images"]:
+    for i in range({rows}):
+        print(json.dumps({{"ID": "%012x" % i, "Repository": "repository-%d" % i, "Tag": "latest",
+                          "CreatedSince": "3 days ago", "Size": "187MB"}}))
+elif args[:2] == ["container", "ls"]:
+    for i in range({rows}):
+        print(json.dumps({{"ID": "%012x" % (i + 1 << 24), "Image": "repository-%d" % i, "Command": "\\"sh\\"",
+                          "RunningFor": "2 minutes ago", "Status": "Up 2 minutes", "Ports": "", "Names": "c%d" % i}}))
+elif args[:2] == ["volume", "ls"]:
+    for i in range({rows}):
+        print(json.dumps({{"Driver": "local", "Name": "volume-%d" % i}}))
+elif args[:1] == ["--version"]:
+    print("Docker version 24.0.0, build fake")
+'''
+
+
+def write_fake_docker(directory: str, rows: int, delay: float) -> None:
+    """
+    Writes the fake docker script into a directory.
+
+    Args:
+        directory (str): The directory that is put first on PATH.
+        rows (int): The number of images, containers and volumes the fake lists.
+        delay (float): The seconds every fake command takes, like a slow daemon.
+    """
+    path = os.path.join(directory, "docker")
+    with open(path, "w") as script:
+        script.write(FAKE_DOCKER.format(python=sys.executable, rows=rows, delay=delay))
+    os.chmod(path, 0o755)
+
+
+def measure_import(env: dict) -> float:
+    """
+    Measures the import time of the main viewer in a fresh interpreter.
+
+    Args:
+        env (dict): The environment of the interpreter.
+
+    Returns:
+        float: The import time in seconds.
+    """
+    code = "import time; t = time.perf_counter(); import app.viewers.main_viewer; print(time.perf_counter() - t)"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=SRC_DIRECTORY, env=env, text=True)
+    return float(output)
+
+
+def measure_startup(env: dict, log_name: str) -> dict[str, float]:
+    """
+    Runs the application on a pseudo-terminal until the first frame is painted, then quits it.
+
+    Args:
+        env (dict): The environment of the application.
+        log_name (str): The file the application records its startup milestones to.
+
+    Returns:
+        dict[str, float]: The seconds from the start of main.py to every milestone, and
+                          the wall time from spawning the process to the first frame.
+    """
+    open(log_name, "w").close()
+    master, slave = pty.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ, struct.pack("HHHH", *TERMINAL_SIZE, 0, 0))
+    spawned = time.time()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=SRC_DIRECTORY,
+        env=dict(env, DOCKER_CMD_STARTUP_LOG=log_name, TERM="xterm"),
+        stdin=slave,
+        stdout=slave,
+        stderr=slave,
+        close_fds=True
+    )
+    os.close(slave)
+    marks: dict[str, tuple[float, float]] = {}
+    try:
+        deadline = time.monotonic() + TIMEOUT
+        while startup.FIRST_PAINT not in marks:
+            if time.monotonic() > deadline or process.poll() is not None:
+                raise RuntimeError("the application did not paint its first frame")
+            # the terminal output is drained, so the application never blocks on writing it
+            if select.select([master], [], [], 0.01)[0]:
+                os.read(master, 65536)
+            with open(log_name) as log:
+                for line in log:
+                    name, elapsed, wall = line.split()
+                    marks[name] = (float(elapsed), float(wall))
+        os.write(master, b"q")
+        process.wait(timeout=TIMEOUT)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        os.close(master)
+    result = {name: elapsed for name, (elapsed, _) in marks.items()}
+    result["spawn_to_first_paint"] = marks[startup.FIRST_PAINT][1] - spawned
+    return result
+
+
+def main():
+    """Runs the benchmark and prints the median of every measurement."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of measured startups")
+    parser.add_argument("--rows", type=int, default=200, help="number of objects of every kind the fake lists")
+    parser.add_argument("--delay", type=float, default=0.05, help="seconds every fake docker command takes")
+    parser.add_argument("--json", action="store_true", help="print the medians as JSON, for comparing runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_fake_docker(directory, args.rows, args.delay)
+        env = dict(
+            os.environ,
+            PATH=directory + os.pathsep + os.environ.get("PATH", ""),
+            DOCKER_CMD_BACKEND="cli",
+            DOCKER_CMD_IMAGE_STORE=os.path.join(directory, "images.sqlite3")
+        )
+        log_name = os.path.join(directory, "startup.log")
+        imports = [measure_import(env) for _ in range(args.runs)]
+        startups = [measure_startup(env, log_name) for _ in range(args.runs)]
+
+    medians = {"import_main_viewer": statistics.median(imports)}
+    for name in (startup.IMPORTS, startup.MAIN, startup.VIEWER_INIT, startup.FIRST_PAINT, "spawn_to_first_paint"):
+        medians[name] = statistics.median(result[name] for result in startups)
+    if args.json:
+        print(json.dumps(medians, indent=4))
+        return
+    for name, seconds in medians.items():
+        print(f"{name:<24} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
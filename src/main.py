@@ -1,9 +1,13 @@
+from app.utils import startup
+
 import curses
 
 from app.utils.enams import Colors
 from app.utils.constants import INVISIBLE
 from app.viewers.main_viewer import Viewer
 
+startup.mark(startup.IMPORTS)
+
 
 def main(stdscr: curses.window):
     """
@@ -13,6 +17,8 @@ def main(stdscr: curses.window):
     - stdscr: A curses.window object representing the terminal window.
     """
 
+    startup.mark(startup.MAIN)
+
     # set colors
     curses.start_color()
     curses.curs_set(INVISIBLE)
@@ -21,6 +27,7 @@ def main(stdscr: curses.window):
     curses.init_pair(Colors.WHITE_ON_YELLOW, curses.COLOR_WHITE, curses.COLOR_YELLOW)
 
     viewer = Viewer(stdscr)
+    startup.mark(startup.VIEWER_INIT)
     viewer.run()
 
 
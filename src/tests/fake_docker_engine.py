@@ -0,0 +1,144 @@
+"""
+This module provides a fake Docker daemon for the tests of the Docker Engine API communicator.
+
+It includes:
+- Response: A canned response of the fake daemon.
+- FakeDockerEngine: An HTTP server on a Unix domain socket that answers with canned responses
+  and records the requests it receives.
+"""
+import json
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+from typing import NamedTuple, Optional, Union
+
+
+class Response(NamedTuple):
+    """
+    A canned response of the fake daemon.
+
+    Attributes:
+        status (int): The status code.
+        body (Union[bytes, list[bytes]]): The body, or the chunks of a streamed (chunked) body.
+        close (bool): Whether the daemon closes the connection after the response without announcing it,
+                      like a daemon that drops an idle keep-alive connection.
+    """
+    status: int
+    body: Union[bytes, list[bytes]] = b""
+    close: bool = False
+
+
+def json_response(status: int, data: Union[dict, list], close: bool = False) -> Response:
+    """
+    Creates a response with a JSON body.
+
+    Args:
+        status (int): The status code.
+        data (Union[dict, list]): The body to encode.
+        close (bool): Whether the daemon closes the connection after the response.
+
+    Returns:
+        Response: The response.
+    """
+    return Response(status, json.dumps(data).encode(), close)
+
+
+class FakeDockerEngine:
+    """
+    An HTTP/1.1 server on a Unix domain socket that answers requests with canned responses.
+
+    Attributes:
+        socket_path (str): The path of the socket.
+        routes (dict[tuple[str, str], Response]): The responses by method and path (without the query).
+        requests (list[tuple[str, str]]): The method and the full path of every received request.
+        connections (int): The number of accepted connections.
+    """
+
+    def __init__(self, socket_path: str):
+        """
+        Initializes the daemon without starting it.
+
+        Args:
+            socket_path (str): The path of the socket.
+        """
+        self.socket_path: str = socket_path
+        self.routes: dict[tuple[str, str], Response] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.connections: int = 0
+        self.__server: Optional[socketserver.UnixStreamServer] = None
+
+    def route(self, method: str, path: str, response: Response) -> None:
+        """
+        Sets the response to the requests of a method and path.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path without the query.
+            response (Response): The response.
+        """
+        self.routes[(method, path)] = response
+
+    def __handler(self) -> type[BaseHTTPRequestHandler]:
+        """Returns the request handler class bound to this daemon."""
+        engine = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                engine.connections += 1
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def handle_request(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                engine.requests.append((self.command, self.path))
+                path = self.path.split("?")[0]
+                response = engine.routes.get((self.command, path), json_response(404, {"message": "page not found"}))
+                try:
+                    self.send(response)
+                except ConnectionError:
+                    # the client stopped reading a streamed response
+                    self.close_connection = True
+
+            def send(self, response: Response):
+                self.send_response(response.status)
+                if isinstance(response.body, list):
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    for chunk in response.body:
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    self.wfile.write(b"0\r\n\r\n")
+                else:
+                    self.send_header("Content-Length", str(len(response.body)))
+                    self.end_headers()
+                    self.wfile.write(response.body)
+                self.wfile.flush()
+                self.close_connection = response.close
+
+            do_GET = do_POST = do_DELETE = handle_request
+
+        return Handler
+
+    def start(self) -> "FakeDockerEngine":
+        """Starts serving on a background thread."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server_class = type("Server", (socketserver.ThreadingMixIn, socketserver.UnixStreamServer), {"daemon_threads": True})
+        self.__server = server_class(self.socket_path, self.__handler())
+        threading.Thread(target=self.__server.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and removes the socket."""
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
@@ -0,0 +1,219 @@
+"""Tests of the Docker Engine API communicator against a fake daemon on a Unix socket."""
+import errno
+import io
+import json
+
+import pytest
+
+from app.docker_communicators.docker_engine_communicator import DockerEngineCommunicator
+from app.docker_communicators.docker_events import DockerEventsListener
+from app.exeptions.exeptions import DockerNotRunningError, DockerCommandError, DockerNotFoundError
+from app.utils.image_store import ImageStore
+from app.utils.pull_progress import PullProgress
+from app.utils.records import ImageRecord
+from tests.fake_docker_engine import FakeDockerEngine, Response, json_response
+
+IMAGE_ID = "sha256:" + "a" * 64
+
+
+def stream(*messages: dict) -> list[bytes]:
+    """Returns the chunks of a stream of JSON messages, one per line."""
+    return [(json.dumps(message) + "\r\n").encode() for message in messages]
+
+
+class FullDisk(io.BytesIO):
+    """An output that fails like a file on a full disk."""
+
+    def write(self, chunk: bytes) -> int:
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = FakeDockerEngine(str(tmp_path / "docker.sock")).start()
+    engine.route("GET", "/version", json_response(200, {"Version": "24.0.0"}))
+    yield engine
+    engine.stop()
+
+
+@pytest.fixture
+def communicator(engine):
+    communicator = DockerEngineCommunicator("unix://" + engine.socket_path)
+    communicator.image_store = ImageStore("")
+    return communicator
+
+
+def test_images_are_listed_one_record_per_tag(engine, communicator):
+    engine.route("GET", "/images/json", json_response(200, [
+        {"Id": IMAGE_ID, "RepoTags": ["nginx:latest", "registry:5000/app:1"], "Created": 0, "Size": 1000},
+        {"Id": "sha256:" + "b" * 64, "RepoTags": None, "Created": 0, "Size": 10},
+    ]))
+
+    records = communicator.images().records
+
+    assert [(record.repository, record.tag) for record in records] == [
+        ("nginx", "latest"), ("registry:5000/app", "1"), ("<none>", "<none>")
+    ]
+    assert all(isinstance(record, ImageRecord) for record in records)
+    assert records[0].image_id == "a" * 12
+    assert engine.requests == [("GET", "/images/json?all=1")]
+
+
+def test_listings_share_one_keep_alive_connection(engine, communicator):
+    engine.route("GET", "/containers/json", json_response(200, [
+        {"Id": "c" * 64, "Names": ["/web"], "Image": "nginx", "Command": "nginx", "Created": 0, "Status": "Up",
+         "Ports": [{"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"}]}
+    ]))
+    engine.route("GET", "/volumes", json_response(200, {"Volumes": [{"Driver": "local", "Name": "data"}]}))
+
+    containers = communicator.containers().records
+    volumes = communicator.volumes().records
+
+    assert containers[0].names == "web"
+    assert containers[0].ports == "0.0.0.0:8080->80/tcp"
+    assert volumes[0].volume_name == "data"
+    assert engine.connections == 1
+
+
+def test_delete_image_deletes_its_containers_first(engine, communicator):
+    engine.route("GET", "/containers/json", json_response(200, [{"Id": "c" * 64}]))
+    engine.route("DELETE", "/containers/" + "c" * 64, Response(204))
+    engine.route("DELETE", "/images/" + IMAGE_ID, json_response(200, []))
+
+    communicator.delete_image(IMAGE_ID)
+
+    assert [request[0] for request in engine.requests] == ["GET", "DELETE", "DELETE"]
+    assert engine.requests[1:] == [
+        ("DELETE", "/containers/" + "c" * 64 + "?force=1"),
+        ("DELETE", "/images/" + IMAGE_ID + "?force=1"),
+    ]
+
+
+def test_delete_error_carries_the_message_of_the_daemon(engine, communicator):
+    engine.route("DELETE", "/volumes/data", json_response(409, {"message": "volume is in use"}))
+
+    with pytest.raises(DockerCommandError, match="volume is in use"):
+        communicator.delete_volume_by_name("data")
+
+
+def test_pull_streams_the_progress(engine, communicator):
+    engine.route("POST", "/images/create", Response(200, stream(
+        {"status": "Pulling from library/nginx", "id": "latest"},
+        {"status": "Downloading", "progressDetail": {"current": 500, "total": 1000}, "id": "layer1"},
+        {"status": "Pull complete", "progressDetail": {}, "id": "layer1"},
+    )))
+    progress = PullProgress("nginx")
+
+    communicator.pull("nginx", progress)
+
+    assert engine.requests == [("POST", "/images/create?fromImage=nginx&tag=latest")]
+    assert progress.status == "Pulling from library/nginx"
+    assert progress.error is None
+    assert [layer.status for layer in progress.layers] == ["Pull complete"]
+
+
+def test_pull_error_in_the_stream_is_raised(engine, communicator):
+    engine.route("POST", "/images/create", Response(200, stream(
+        {"status": "Pulling from library/nginx", "id": "latest"},
+        {"errorDetail": {"message": "manifest unknown"}, "error": "manifest unknown"},
+    )))
+
+    with pytest.raises(DockerCommandError, match="manifest unknown"):
+        communicator.pull("nginx:missing")
+
+
+def test_unreachable_daemon_is_not_running(tmp_path):
+    communicator = DockerEngineCommunicator("unix://" + str(tmp_path / "missing.sock"))
+
+    with pytest.raises(DockerNotRunningError):
+        communicator.check_version()
+
+
+def test_error_status_of_a_listing_carries_the_message_of_the_daemon(engine, communicator):
+    engine.route("GET", "/images/json", json_response(500, {"message": "server error"}))
+
+    with pytest.raises(DockerCommandError, match="server error"):
+        communicator.fetch_images()
+
+
+def test_inspect_falls_back_to_the_image_on_not_found(engine, communicator):
+    engine.route("GET", "/images/" + IMAGE_ID + "/json", json_response(200, {"Id": IMAGE_ID}))
+
+    assert json.loads(communicator.inspect(IMAGE_ID)) == [{"Id": IMAGE_ID}]
+    assert [path for _, path in engine.requests] == ["/containers/" + IMAGE_ID + "/json", "/images/" + IMAGE_ID + "/json"]
+
+
+def test_inspect_of_a_removed_object_is_not_found(engine, communicator):
+    with pytest.raises(DockerNotFoundError, match="page not found"):
+        communicator.inspect("c" * 64)
+
+
+def test_inspect_does_not_fall_back_on_other_errors(engine, communicator):
+    engine.route("GET", "/containers/" + "c" * 64 + "/json", json_response(500, {"message": "server error"}))
+
+    with pytest.raises(DockerCommandError, match="server error"):
+        communicator.inspect("c" * 64)
+    assert len(engine.requests) == 1
+
+
+def test_dropped_idle_connection_is_retried(engine, communicator):
+    engine.route("GET", "/version", json_response(200, {"Version": "24.0.0"}, close=True))
+    engine.route("GET", "/volumes", json_response(200, {"Volumes": []}))
+
+    communicator.check_version()
+    communicator.volumes()
+
+    assert engine.connections == 2
+
+
+def test_output_write_error_is_not_mapped(engine, communicator):
+    engine.route("GET", "/images/" + IMAGE_ID + "/get", Response(200, [b"x" * 65536] * 8))
+
+    with pytest.raises(OSError) as error:
+        communicator.save_image(IMAGE_ID, FullDisk())
+
+    assert not isinstance(error.value, DockerNotRunningError)
+    assert error.value.errno == errno.ENOSPC
+    assert communicator.check_version().startswith("Docker version 24.0.0")
+    assert engine.connections == 2
+
+
+def test_connection_is_dropped_after_an_error_mid_stream(engine, communicator):
+    engine.route("POST", "/images/create", Response(200, [b"not json\r\n"] + [b"x" * 65536] * 8))
+
+    with pytest.raises(ValueError):
+        communicator.pull("nginx")
+
+    assert communicator.check_version().startswith("Docker version 24.0.0")
+    assert engine.connections == 2
+
+
+def test_untag_event_refreshes_only_the_image(engine, communicator):
+    engine.route("GET", "/images/json", json_response(200, [
+        {"Id": IMAGE_ID, "RepoTags": ["nginx:latest", "nginx:1"], "Created": 0, "Size": 1000},
+    ]))
+    engine.route("GET", "/images/" + IMAGE_ID + "/json", json_response(200, {
+        "Id": IMAGE_ID, "RepoTags": ["nginx:1"], "Created": "2024-05-01T10:20:30.123456789Z", "Size": 1000
+    }))
+    listener = DockerEventsListener(communicator)
+    communicator.images()
+
+    listener.apply({"Type": "image", "Action": "untag", "Actor": {"ID": IMAGE_ID}})
+
+    assert [record.reference for record in communicator.images().records] == ["nginx:1"]
+    assert engine.requests[1:] == [("GET", "/images/" + IMAGE_ID + "/json")]
+
+
+def test_inspect_looks_up_the_image_store_only_for_images_missing_in_the_cache(engine, communicator, monkeypatch):
+    lookups = []
+    stored_inspect = communicator.stored_inspect
+    monkeypatch.setattr(communicator, "stored_inspect", lambda obj_id: lookups.append(obj_id) or stored_inspect(obj_id))
+    engine.route("GET", "/containers/" + "c" * 64 + "/json", json_response(200, {"Id": "c" * 64}))
+    engine.route("GET", "/images/" + IMAGE_ID + "/json", json_response(200, {"Id": IMAGE_ID}))
+
+    communicator.inspect("c" * 64)
+    communicator.inspect(IMAGE_ID, is_image=True)
+    communicator.inspect(IMAGE_ID, is_image=True)
+
+    assert lookups == [IMAGE_ID]
+    assert [path for _, path in engine.requests] == ["/containers/" + "c" * 64 + "/json", "/images/" + IMAGE_ID + "/json"]